@@ -10,6 +10,11 @@ Version:       '1.0.0'
 # Library
 import logging
 import time
+import datetime
+import concurrent.futures
+import threading
+import shlex
+import signal
 import os
 import glob
 import psutil
@@ -20,18 +25,19 @@ import pandas as pd
 from copy import deepcopy
 
 from lib_info_args import logger_name
-from lib_data_io import read_obj, write_obj, write_csv, read_csv
+from lib_data_io import read_workspace, write_csv, read_csv, read_json, write_json, read_array, write_array, \
+    read_columnar, write_columnar, define_columnar_format, columnar_formats, WriterSegment
 
 from lib_utils_io import filter_dframe_by_column, convert_dframe_units
 from lib_utils_system import fill_tags2string, make_folder
-from lib_utils_time import check_time_delta_limits, fill_time_delta_parts, convert_time_delta_to_seconds
+from lib_utils_time import check_time_delta_limits, fill_time_delta_parts, convert_time_delta_to_seconds, \
+    SchedulerTick, AdaptiveInterval
 
-from lib_analysis_fx import get_process_info, organize_process_info
+from lib_analysis_fx import TrackerProcess, WatcherProcess, BufferSamples, BufferOverhead, define_collectors
 from lib_analysis_fx import get_memory_info, organize_memory_info
-from lib_analysis_fx import get_disk_info
-from lib_analysis_fx import get_system_load_info
-from lib_analysis_fx import kill_process_tree
-from lib_analysis_plot import plot_process_info, plot_memory_info, plot_disk_info
+from lib_analysis_fx import kill_process_tree, define_units_info
+
+import lib_analysis_plot
 
 # Logging
 log_stream = logging.getLogger(logger_name)
@@ -47,7 +53,14 @@ class DriverAnalysis:
 
     # -------------------------------------------------------------------------------------
     # Method to initialize class
-    def __init__(self, report_time, dict_algorithm, dict_process, dict_report, dict_tmp=None):
+    def __init__(self, report_time, dict_algorithm, dict_process, dict_report, dict_tmp=None, process_command=None):
+
+        # overhead object(s) (wall and cpu time of the analysis phases and rss of the analysis process)
+        proc_overhead_settings = dict_process.get('analysis_overhead', None)
+        if proc_overhead_settings is None:
+            proc_overhead_settings = {}
+        self.proc_overhead = BufferOverhead(percentiles=proc_overhead_settings.get('percentiles', None))
+        self.proc_overhead_report = proc_overhead_settings.get('report_columns', False)
 
         # generic object(s)
         self.report_time = report_time
@@ -61,39 +74,225 @@ class DriverAnalysis:
         self.alg_template = dict_algorithm['template']
         self.alg_tools = dict_algorithm['tools']
 
-        # process object(s)
-        self.proc_name = self.dict_process['name']
+        # process object(s) (one or more targets resolved by the same process scan)
+        self.proc_targets = self.define_process_targets(self.dict_process)
+
+        # launch object(s) (process command spawned by the analysis; handle known without the process scan)
+        self.proc_launch_command = process_command
+        if self.proc_launch_command is None:
+            self.proc_launch_command = self.dict_process.get('launch_command', None)
+        if isinstance(self.proc_launch_command, str):
+            self.proc_launch_command = shlex.split(self.proc_launch_command)
+        self.proc_launch = bool(self.proc_launch_command)
+        if self.proc_launch and (self.proc_targets.__len__() > 1):
+            log_stream.warning(' ===> Launch mode is defined by one process target. '
+                               'Target "' + self.proc_targets[0]['name'] + '" used for the launched process')
+            self.proc_targets = self.proc_targets[:1]
+        self.proc_launch_pid, self.proc_launch_time_start, self.proc_launch_info = None, None, None
+
+        self.proc_name = self.proc_targets[0]['name']
+        self.proc_analysis_mode = self.dict_process.get('analysis_mode', None)
+        if self.proc_analysis_mode is None:
+            self.proc_analysis_mode = 'standard'
+        if self.proc_analysis_mode not in ['standard', 'high_frequency']:
+            log_stream.error(' ===> Analysis mode "' + self.proc_analysis_mode + '" is not supported')
+            raise ValueError('Analysis mode "' + self.proc_analysis_mode + '" is not supported. Allowed modes are ' +
+                             '["standard", "high_frequency"]')
         self.proc_analysis_time_frequency = fill_time_delta_parts(self.dict_process['analysis_time_frequency'])
         self.proc_analysis_time_frequency = check_time_delta_limits(
-            self.proc_analysis_time_frequency, time_delta_min='2s', time_delta_max=None)
+            self.proc_analysis_time_frequency,
+            time_delta_min='50ms' if self.proc_analysis_mode == 'high_frequency' else '2s', time_delta_max=None)
         self.proc_analysis_seconds_frequency = convert_time_delta_to_seconds(self.proc_analysis_time_frequency)
-        self.proc_analysis_time_period = fill_time_delta_parts(self.dict_process['analysis_time_period'])
-        self.proc_analysis_time_period = check_time_delta_limits(
-            self.proc_analysis_time_period, time_delta_min=None, time_delta_max='1h')
-        self.proc_analysis_seconds_period = convert_time_delta_to_seconds(self.proc_analysis_time_period)
         self.proc_analysis_tools = self.dict_process['analysis_tools']
 
-        # report object(s)
-        self.report_file_path_ancillary = self.define_file_name(
-            os.path.join(self.dict_report['ancillary']['folder_name'], self.dict_report['ancillary']['file_name']),
-            report_time=self.report_time)
-        self.report_file_path_destination = self.define_file_name(
-            os.path.join(self.dict_report['destination']['folder_name'], self.dict_report['destination']['file_name']),
-            report_time=self.report_time)
-        self.report_file_path_figure = self.define_file_name(
-            os.path.join(self.dict_report['figure']['folder_name'], self.dict_report['figure']['file_name']),
-            report_time=self.report_time)
+        # daemon object(s) (unbounded analysis period; outputs rolled over at the boundaries of the time segments)
+        proc_daemon_settings = self.dict_process.get('analysis_daemon', None)
+        if proc_daemon_settings is None:
+            proc_daemon_settings = {}
+        self.proc_daemon = proc_daemon_settings.get('active', False)
+        self.proc_daemon_time_segment = proc_daemon_settings.get('time_segment', None)
+        if self.proc_daemon_time_segment is None:
+            self.proc_daemon_time_segment = '1h'
+        self.proc_daemon_time_segment = check_time_delta_limits(
+            fill_time_delta_parts(self.proc_daemon_time_segment), time_delta_min='1min', time_delta_max=None)
+        self.proc_daemon_seconds_segment = convert_time_delta_to_seconds(self.proc_daemon_time_segment)
+        if self.proc_daemon and ('{report_datetime}' not in self.dict_report['destination']['file_name']):
+            log_stream.warning(' ===> Destination file name is not defined by the "{report_datetime}" tag. '
+                               'The segments of the daemon mode are saved in the same file')
+
+        # period object(s) (analysis period limited to 1h; no limit in daemon and launch mode)
+        if self.proc_daemon or self.proc_launch:
+            self.proc_analysis_time_period, self.proc_analysis_seconds_period = None, None
+        else:
+            self.proc_analysis_time_period = fill_time_delta_parts(self.dict_process['analysis_time_period'])
+            self.proc_analysis_time_period = check_time_delta_limits(
+                self.proc_analysis_time_period, time_delta_min=None, time_delta_max='1h')
+            self.proc_analysis_seconds_period = convert_time_delta_to_seconds(self.proc_analysis_time_period)
+
+        # report object(s) (file paths defined for each process target; segment time used by the daemon mode)
+        self.report_storage = self.dict_report['settings'].get('report_storage', None)
+        if self.report_storage is None:
+            self.report_storage = 'csv'
+        if self.report_storage != 'csv':
+            self.report_storage = define_columnar_format(self.report_storage)
+        self.report_time_segment = None
+        if self.proc_daemon:
+            self.report_time_segment = self.define_time_segment(pd.Timestamp.now())
+            self.define_process_files(self.report_time_segment)
+        else:
+            self.define_process_files(self.report_time)
         self.report_file_delimiter = self.dict_report['settings']['report_delimiter']
         self.report_count_row_max = self.dict_report['settings']['report_ancillary_max_row']
         self.report_count_row_step = 0
         self.report_count_id_start = self.dict_report['settings']['report_ancillary_id_start']
         self.report_count_id_step = self.dict_report['settings']['report_ancillary_id_start']
+        self.report_count_bytes_max = self.dict_report['settings'].get('report_ancillary_max_bytes', None)
+
+        # set ancillary writer (rows appended to the ancillary file of each target by batches)
+        for proc_target in self.proc_targets:
+            proc_target['obj_writer'] = WriterSegment(
+                flush_rows=self.dict_report['settings'].get('report_ancillary_flush_row', None),
+                file_format='pickle' if self.report_storage == 'csv' else self.report_storage)
 
         self.report_time_elapsed_start = time.time()
         self.report_time_elapsed_step = None
 
-        # get process obj list
-        self.proc_obj_init = get_process_info(self.proc_name, verbose=True)
+        # set scheduler (absolute deadlines of the analysis steps; overrun steps are counted and skipped)
+        self.proc_scheduler = SchedulerTick(
+            self.proc_analysis_seconds_frequency, seconds_period=self.proc_analysis_seconds_period)
+
+        # set lifecycle (wait the process targets before the analysis; follow the process targets until the exit)
+        proc_lifecycle_settings = self.dict_process.get('analysis_lifecycle', None)
+        if proc_lifecycle_settings is None:
+            proc_lifecycle_settings = {}
+        self.proc_lifecycle_wait = proc_lifecycle_settings.get('wait_target', False)
+        self.proc_lifecycle_follow = proc_lifecycle_settings.get('follow_target', False)
+        if self.proc_launch:
+            self.proc_lifecycle_wait, self.proc_lifecycle_follow = False, True
+        proc_lifecycle_time_frequency = proc_lifecycle_settings.get('wait_time_frequency', None)
+        if proc_lifecycle_time_frequency is None:
+            proc_lifecycle_time_frequency = '5sec'
+        self.proc_lifecycle_seconds_frequency = convert_time_delta_to_seconds(
+            fill_time_delta_parts(proc_lifecycle_time_frequency))
+        self.proc_lifecycle_seconds_period = convert_time_delta_to_seconds(
+            fill_time_delta_parts(proc_lifecycle_settings.get('wait_time_period', None)))
+        self.proc_watcher = None
+        if self.proc_lifecycle_follow:
+            self.proc_watcher = WatcherProcess()
+            self.proc_scheduler.set_wait(self.proc_watcher.wait_exit)
+
+        # set adaptive interval (standard mode; interval between the min and max frequency driven by the slope)
+        self.proc_adaptive, self.proc_adaptive_columns = None, []
+        proc_adaptive_settings = self.dict_process.get('analysis_adaptive', None)
+        if proc_adaptive_settings is None:
+            proc_adaptive_settings = {}
+        if proc_adaptive_settings.get('active', False) and (self.proc_analysis_mode == 'standard'):
+            proc_adaptive_time_min = proc_adaptive_settings.get('time_frequency_min', None)
+            if proc_adaptive_time_min is None:
+                proc_adaptive_time_min = self.proc_analysis_time_frequency
+            proc_adaptive_time_min = check_time_delta_limits(
+                fill_time_delta_parts(proc_adaptive_time_min), time_delta_min='2s', time_delta_max=None)
+            proc_adaptive_time_max = proc_adaptive_settings.get('time_frequency_max', None)
+            if proc_adaptive_time_max is None:
+                proc_adaptive_time_max = '1min'
+            proc_adaptive_slope_max = proc_adaptive_settings.get('slope_max', None)
+            if proc_adaptive_slope_max is None:
+                proc_adaptive_slope_max = 1048576
+            self.proc_adaptive = AdaptiveInterval(
+                self.proc_analysis_seconds_frequency,
+                seconds_min=convert_time_delta_to_seconds(proc_adaptive_time_min),
+                seconds_max=convert_time_delta_to_seconds(fill_time_delta_parts(proc_adaptive_time_max)),
+                slope_max=proc_adaptive_slope_max,
+                factor_down=proc_adaptive_settings.get('factor_down', 0.5),
+                factor_up=proc_adaptive_settings.get('factor_up', 1.5))
+            self.proc_adaptive_columns = proc_adaptive_settings.get('columns_name', None)
+            if self.proc_adaptive_columns is None:
+                self.proc_adaptive_columns = self.define_adaptive_columns()
+
+        # units metadata of the report fields (values are stored in bytes; seeded by the collectors schema)
+        self.report_units = {'scheduler_lag': 's', 'scheduler_interval': 's'}
+
+        # set process tracker (to avoid a full process scan at each analysis step)
+        tool_attrs_process = self.define_tool_attributes('tool_info_process', self.alg_tools)
+        proc_scan_frequency = None
+        if tool_attrs_process is not None:
+            proc_scan_frequency = tool_attrs_process.get('process_scan_frequency', '1min')
+        proc_obj_init = None
+        if self.proc_launch:
+            proc_obj_init = {proc_target['name']: [] for proc_target in self.proc_targets}
+        self.proc_tracker = TrackerProcess(
+            [proc_target['name'] for proc_target in self.proc_targets], process_obj_init=proc_obj_init,
+            process_scan_frequency=proc_scan_frequency, process_scan_active=not self.proc_launch)
+
+        # get process obj list (first full scan, shared by all the targets)
+        self.proc_tracker.update_process_collections(verbose=True)
+        for proc_target in self.proc_targets:
+            proc_target['obj_init'] = self.proc_tracker.get_process_list(
+                process_name=proc_target['name'], process_update=False)
+
+        # set collectors (registered tools; host collectors shared by the targets, target collectors for each target)
+        proc_collectors_seconds_period = self.proc_analysis_seconds_period
+        if self.proc_daemon:
+            proc_collectors_seconds_period = self.proc_daemon_seconds_segment
+        proc_collectors_context = {
+            'tools': self.alg_tools, 'process_tracker': self.proc_tracker,
+            'seconds_period': proc_collectors_seconds_period,
+            'seconds_frequency': self.proc_analysis_seconds_frequency}
+        self.proc_collectors = define_collectors(
+            self.proc_analysis_tools, self.alg_tools, tool_scope='host', tool_context=proc_collectors_context,
+            tool_mode=self.proc_analysis_mode)
+        for proc_target in self.proc_targets:
+            proc_collectors_prefix = None
+            if proc_target['prefix_name'] is not None:
+                proc_collectors_prefix = {'tool_info_process': proc_target['prefix_name']}
+            proc_target['obj_collectors'] = define_collectors(
+                self.proc_analysis_tools, self.alg_tools, tool_scope='target', tool_context=proc_collectors_context,
+                tool_prefix=proc_collectors_prefix, tool_mode=self.proc_analysis_mode)
+
+        # set collectors executor (thread pool shared by the collectors; timeout of each collector in seconds)
+        proc_collectors_n = self.proc_collectors.__len__() + sum(
+            [proc_target['obj_collectors'].__len__() for proc_target in self.proc_targets])
+        self.proc_collectors_workers = self.dict_process.get('analysis_collectors_workers', None)
+        if self.proc_collectors_workers is None:
+            self.proc_collectors_workers = max(proc_collectors_n, 1)
+        self.proc_collectors_time_timeout = self.dict_process.get('analysis_collectors_timeout', None)
+        if self.proc_collectors_time_timeout is not None:
+            self.proc_collectors_seconds_timeout = convert_time_delta_to_seconds(
+                fill_time_delta_parts(self.proc_collectors_time_timeout))
+        else:
+            self.proc_collectors_seconds_timeout = self.proc_analysis_seconds_frequency
+        self.proc_collectors_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.proc_collectors_workers, thread_name_prefix='ruler_collector')
+        self.proc_collectors_running = {}
+
+        # set cpu buffer (samples of the cores saved in the array file)
+        self.proc_cpu_buffer, self.report_cpu_sample_start = None, 0
+        for proc_collector in self.proc_collectors:
+            if proc_collector.tool_name == 'tool_info_cpu':
+                self.proc_cpu_buffer = proc_collector.cpu_buffer
+
+        # set units metadata (columns declared by the collectors schema)
+        proc_collectors_all = self.proc_collectors + [
+            proc_collector for proc_target in self.proc_targets for proc_collector in proc_target['obj_collectors']]
+        for proc_collector in proc_collectors_all:
+            self.report_units.update({column_name: column_units for column_name, column_units in
+                                      proc_collector.get_schema().items() if column_units is not None})
+            self.report_units[proc_collector.get_latency_name()] = 's'
+
+        # set collectors timeout (collector timeout or analysis timeout, adapted by each collector)
+        self.proc_collectors_timeout = {
+            id(proc_collector): proc_collector.define_timeout(self.proc_collectors_seconds_timeout)
+            for proc_collector in proc_collectors_all}
+
+        # set samples buffer (high frequency mode; columns of the collectors schema saved in the array files)
+        for proc_target in self.proc_targets:
+            proc_target['obj_buffer'] = None
+            if self.proc_analysis_mode == 'high_frequency':
+                proc_buffer_columns = []
+                for proc_collector in proc_target['obj_collectors'] + self.proc_collectors:
+                    proc_buffer_columns += proc_collector.define_columns()
+                proc_buffer_columns += ['scheduler_lag', 'scheduler_missed']
+                proc_target['obj_buffer'] = BufferSamples(proc_buffer_columns, sample_n=self.report_count_row_max)
 
         # get and organize memory info
         self.info_virtual_memory_init, self.info_swap_memory_init = get_memory_info()
@@ -111,40 +310,254 @@ class DriverAnalysis:
         # set dframe tag(s)
         self.report_index_tag = 'time'
 
-        # flag to clean ancillary file(s) previously saved
-        if self.flag_clean_report_file_ancillary:
-            if self.flag_activate_report_alg_organize:
-                report_file_path_ancillary_generic = self.define_file_name(
-                    self.report_file_path_ancillary, report_time=self.report_time, report_id='*')
+        # clean report file(s) previously saved
+        self.clean_process_files(self.report_time_segment if self.proc_daemon else self.report_time)
 
-                report_file_path_ancillary_list = glob.glob(report_file_path_ancillary_generic)
-                for report_file_path_ancillary_step in report_file_path_ancillary_list:
-                    if os.path.exists(report_file_path_ancillary_step):
-                        os.remove(report_file_path_ancillary_step)
+        # set finalize executor (daemon mode; dump and view of the completed segments in a background thread)
+        self.report_finalize_executor, self.report_finalize_futures = None, []
+        if self.proc_daemon:
+            self.report_finalize_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='ruler_finalize')
+
+        # set analysis stop (daemon and launch mode; analysis stopped by SIGTERM or SIGINT at the next step)
+        self.proc_analysis_stop = False
+        if (self.proc_daemon or self.proc_launch) and (threading.current_thread() is threading.main_thread()):
+            signal.signal(signal.SIGTERM, self.stop_analysis)
+            signal.signal(signal.SIGINT, self.stop_analysis)
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to define process targets
+    @staticmethod
+    def define_process_targets(dict_process):
 
-        # flag to clean destination file(s) previously saved
-        if self.flag_clean_report_file_destination:
-            if self.flag_activate_report_alg_dump:
-                report_file_path_destination_generic = self.report_file_path_destination
-                if os.path.exists(report_file_path_destination_generic):
-                    os.remove(report_file_path_destination_generic)
+        proc_targets_raw = dict_process.get('targets', None)
+        if not proc_targets_raw:
+            proc_targets_raw = [{'name': dict_process['name']}]
 
-        # flag to clean figure file(s) previously saved
-        if self.flag_clean_report_file_figure:
-            if self.flag_activate_report_alg_view:
-                report_file_path_figure_generic = self.define_file_name(
-                    self.report_file_path_figure, report_time=self.report_time, report_type='*')
+        proc_targets = []
+        for proc_target_raw in proc_targets_raw:
+            if 'name' not in list(proc_target_raw.keys()):
+                log_stream.error(' ===> Process target must be defined by the "name" key')
+                raise RuntimeError('Process target name is not defined')
+            proc_target_name = proc_target_raw['name']
+            proc_target_report_name = proc_target_raw.get('report_name', None)
+            if proc_target_report_name is None:
+                proc_target_report_name = proc_target_name
+            proc_target_prefix_name = proc_target_raw.get('prefix_name', None)
 
-                report_file_path_figure_list = glob.glob(report_file_path_figure_generic)
-                for report_file_path_figure_step in report_file_path_figure_list:
-                    if os.path.exists(report_file_path_figure_step):
-                        os.remove(report_file_path_figure_step)
+            proc_targets.append({'name': proc_target_name, 'report_name': proc_target_report_name,
+                                 'prefix_name': proc_target_prefix_name})
+
+        return proc_targets
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to define time segment (start of the daemon segment including the time)
+    def define_time_segment(self, time_step):
+        return pd.Timestamp(time_step).floor(pd.Timedelta(self.proc_daemon_time_segment))
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to define process files (file paths of each process target for the report time)
+    def define_process_files(self, report_time):
+
+        for proc_target in self.proc_targets:
+            proc_target['file_path_ancillary'] = self.define_file_name(
+                os.path.join(self.dict_report['ancillary']['folder_name'], self.dict_report['ancillary']['file_name']),
+                report_time=report_time, report_process=proc_target['report_name'])
+            proc_target['file_path_destination'] = self.define_file_name(
+                os.path.join(self.dict_report['destination']['folder_name'],
+                             self.dict_report['destination']['file_name']),
+                report_time=report_time, report_process=proc_target['report_name'])
+            proc_target['file_path_figure'] = self.define_file_name(
+                os.path.join(self.dict_report['figure']['folder_name'], self.dict_report['figure']['file_name']),
+                report_time=report_time, report_process=proc_target['report_name'])
+            if self.report_storage != 'csv':
+                proc_target['file_path_ancillary'] = os.path.splitext(
+                    proc_target['file_path_ancillary'])[0] + columnar_formats[self.report_storage]
+                proc_target['file_path_destination'] = os.path.splitext(
+                    proc_target['file_path_destination'])[0] + columnar_formats[self.report_storage]
+            proc_target['file_path_units'] = os.path.splitext(proc_target['file_path_destination'])[0] + '_units.json'
+            proc_target['file_path_cpu'] = self.define_file_array(proc_target['file_path_destination'])
+            proc_target['file_path_hf'] = self.define_file_array(proc_target['file_path_destination'], file_tag='hf')
+            proc_target['file_path_overhead'] = self.define_file_array(
+                proc_target['file_path_destination'], file_tag='overhead', file_ext='.csv')
+            proc_target['file_path_overhead_summary'] = self.define_file_array(
+                proc_target['file_path_destination'], file_tag='overhead_summary', file_ext='.csv')
+
+        if self.proc_targets.__len__() > 1:
+            for proc_file_key in ['file_path_ancillary', 'file_path_destination']:
+                proc_file_list = [proc_target[proc_file_key] for proc_target in self.proc_targets]
+                if proc_file_list.__len__() != set(proc_file_list).__len__():
+                    log_stream.error(' ===> Report file names must be defined by the "{process_name}" tag '
+                                     'to save the report of each process target')
+                    raise RuntimeError('Report file names are the same for different process targets')
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to clean process files (ancillary, destination and figure files previously saved)
+    def clean_process_files(self, report_time):
+
+        for proc_target in self.proc_targets:
+
+            # flag to clean ancillary file(s) previously saved
+            if self.flag_clean_report_file_ancillary:
+                if self.flag_activate_report_alg_organize:
+                    report_file_path_ancillary_generic = self.define_file_name(
+                        proc_target['file_path_ancillary'], report_time=report_time, report_id='*')
+
+                    report_file_path_ancillary_list = glob.glob(report_file_path_ancillary_generic)
+                    report_file_path_ancillary_list += glob.glob(
+                        self.define_file_array(report_file_path_ancillary_generic))
+                    report_file_path_ancillary_list += glob.glob(
+                        self.define_file_array(report_file_path_ancillary_generic, file_tag='hf'))
+                    for report_file_path_ancillary_step in report_file_path_ancillary_list:
+                        if os.path.exists(report_file_path_ancillary_step):
+                            os.remove(report_file_path_ancillary_step)
+
+            # flag to clean destination file(s) previously saved
+            if self.flag_clean_report_file_destination:
+                if self.flag_activate_report_alg_dump:
+                    report_file_path_destination_generic = proc_target['file_path_destination']
+                    if os.path.exists(report_file_path_destination_generic):
+                        os.remove(report_file_path_destination_generic)
+                    if os.path.exists(proc_target['file_path_cpu']):
+                        os.remove(proc_target['file_path_cpu'])
+                    if os.path.exists(proc_target['file_path_hf']):
+                        os.remove(proc_target['file_path_hf'])
+                    for report_file_path_overhead in [proc_target['file_path_overhead'],
+                                                      proc_target['file_path_overhead_summary']]:
+                        if os.path.exists(report_file_path_overhead):
+                            os.remove(report_file_path_overhead)
+
+            # flag to clean figure file(s) previously saved
+            if self.flag_clean_report_file_figure:
+                if self.flag_activate_report_alg_view:
+                    report_file_path_figure_generic = self.define_file_name(
+                        proc_target['file_path_figure'], report_time=report_time, report_type='*')
+
+                    report_file_path_figure_list = glob.glob(report_file_path_figure_generic)
+                    for report_file_path_figure_step in report_file_path_figure_list:
+                        if os.path.exists(report_file_path_figure_step):
+                            os.remove(report_file_path_figure_step)
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to roll report segment (daemon mode; completed segment finalized in the background)
+    def roll_report_segment(self, time_step):
+
+        # check time segment (no roll over within the current segment)
+        report_time_segment = self.define_time_segment(time_step)
+        if report_time_segment == self.report_time_segment:
+            return
+
+        log_stream.info(' ------> Segment "' + str(self.report_time_segment) + '" ... COMPLETED. NEXT SEGMENT "' +
+                        str(report_time_segment) + '"')
+
+        # save samples buffer (high frequency mode; ancillary file of the completed segment)
+        if self.proc_analysis_mode == 'high_frequency':
+            self.freeze_report_array()
+        # save pending rows (standard mode; ancillary file of the completed segment)
+        self.flush_report_analysis()
+
+        # get completed segment (file paths of the targets, counter and units)
+        report_targets = [dict(proc_target) for proc_target in self.proc_targets]
+        report_count_id_end = self.report_count_id_step
+        if (self.report_count_row_step == 0) and (self.report_count_id_step > self.report_count_id_start):
+            report_count_id_end -= 1
+        report_units = deepcopy(self.report_units)
+
+        # set next segment (file paths, counters and cpu buffer)
+        self.report_time_segment = report_time_segment
+        self.define_process_files(self.report_time_segment)
+        self.report_count_row_step = 0
+        self.report_count_id_step = self.report_count_id_start
+        if self.proc_cpu_buffer is not None:
+            self.proc_cpu_buffer.reset_buffer()
+            self.report_cpu_sample_start = 0
+        self.clean_process_files(self.report_time_segment)
+
+        # finalize completed segment (dump and view in the background thread)
+        self.report_finalize_futures = [
+            report_future for report_future in self.report_finalize_futures if not report_future.done()]
+        self.report_finalize_futures.append(self.report_finalize_executor.submit(
+            self.finalize_report_segment, report_targets, report_count_id_end, report_units))
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to stop analysis (signal handler; the current segment is saved by the dump and view methods)
+    def stop_analysis(self, signal_num, signal_frame):
+        log_stream.warning(' ===> Signal "' + signal.Signals(signal_num).name + '" received. Stop analysis')
+        self.proc_analysis_stop = True
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to finalize report segment (dump and view of a completed segment)
+    def finalize_report_segment(self, report_targets, report_count_id_end, report_units):
+        try:
+            self.dump(report_targets=report_targets, report_count_id_end=report_count_id_end,
+                      report_units=report_units)
+            self.view(report_targets=report_targets)
+        except Exception as exc:
+            log_stream.error(' ===> Finalize segment ... FAILED [' + str(exc) + ']')
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to define adaptive columns (rss of the first process of each target and available memory of the system)
+    def define_adaptive_columns(self):
+
+        tool_attrs_process = self.define_tool_attributes('tool_info_process', self.alg_tools)
+        if tool_attrs_process is None:
+            tool_attrs_process = {}
+        tool_attrs_memory = self.define_tool_attributes('tool_info_memory', self.alg_tools)
+        if tool_attrs_memory is None:
+            tool_attrs_memory = {}
+
+        adaptive_columns = []
+        for proc_target in self.proc_targets:
+            prefix_name = proc_target['prefix_name']
+            if prefix_name is None:
+                prefix_name = tool_attrs_process.get('prefix_name', None)
+            if prefix_name is None:
+                prefix_name = 'process_name'
+            separator_name = tool_attrs_process.get('separator_name', None)
+            if separator_name is None:
+                separator_name = '_'
+            adaptive_columns.append(separator_name.join([prefix_name, 'rss']).format(proc_n=0))
+
+        prefix_name = tool_attrs_memory.get('prefix_name_virtual_memory', None)
+        if prefix_name is None:
+            prefix_name = 'virtual_memory'
+        separator_name = tool_attrs_memory.get('separator_name', None)
+        if separator_name is None:
+            separator_name = '_'
+        adaptive_columns.append(separator_name.join([prefix_name, 'available']))
+
+        return list(dict.fromkeys(adaptive_columns))
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to define file array (array saved next to the dframe file)
+    @staticmethod
+    def define_file_array(file_name, file_tag='cpu', file_ext='.npz'):
+        return os.path.splitext(file_name)[0] + '_' + file_tag + file_ext
 
     # -------------------------------------------------------------------------------------
 
     # -------------------------------------------------------------------------------------
     # Method to define file name
-    def define_file_name(self, file_name_raw, report_time=None, report_type=None, report_id=None):
+    def define_file_name(self, file_name_raw, report_time=None, report_type=None, report_id=None,
+                         report_process=None):
 
         report_time_stamp = None
         if report_time is not None:
@@ -161,7 +574,7 @@ class DriverAnalysis:
 
         alg_template_keys = self.alg_template
         alg_template_values = {
-            'process_name': self.proc_name,
+            'process_name': report_process if report_process is not None else self.proc_name,
             'report_type': report_type,
             "report_id": report_id,
             'report_sub_path': report_time_stamp,
@@ -174,189 +587,348 @@ class DriverAnalysis:
 
     # -------------------------------------------------------------------------------------
 
-    # -------------------------------------------------------------------------------------
-    # Method to define time execution
-    def define_clock_execution(self, clock_stamp_start_in=None, clock_stamp_end_in=None, clock_update=True):
-
-        if clock_update:
-            clock_stamp_start_out = pd.Timestamp.now().round(freq='s')
-            if self.proc_analysis_time_period is not None:
-                clock_stamp_end_out = clock_stamp_start_out + pd.Timedelta(self.proc_analysis_time_period)
-                clock_update = False
-            else:
-                clock_stamp_end_out = clock_stamp_start_out + pd.Timedelta(self.proc_analysis_time_frequency)
-                clock_update = True
-        else:
-            clock_stamp_start_out = deepcopy(clock_stamp_start_in + pd.Timedelta(self.proc_analysis_time_frequency))
-            clock_stamp_end_out = deepcopy(clock_stamp_end_in)
-
-        return clock_stamp_start_out, clock_stamp_end_out, clock_update
-    # -------------------------------------------------------------------------------------
-
     # -------------------------------------------------------------------------------------
     # Method to define tool attributes
     @staticmethod
     def define_tool_attributes(tool_name, tool_collections):
         tool_attrs = None
         if tool_name in list(tool_collections.keys()):
-            tool_attrs = tool_collections[tool_name]
+            tool_attrs = deepcopy(tool_collections[tool_name])
         return tool_attrs
     # -------------------------------------------------------------------------------------
 
     # -------------------------------------------------------------------------------------
-    # Method to execute report analysis
+    # Method to execute collectors (collectors run concurrently; null sample for the collectors over the deadline)
+    def execute_collectors(self, collectors_jobs):
+
+        # submit collectors (a collector still running from a previous step is not submitted again)
+        collectors_futures = []
+        for proc_collector, proc_process_list in collectors_jobs:
+            collector_future = self.proc_collectors_running.get(id(proc_collector), None)
+            if (collector_future is not None) and (not collector_future.done()):
+                log_stream.warning(' ===> Collector "' + proc_collector.tool_name +
+                                   '" is still running from a previous step. Skip sample')
+                collectors_futures.append(None)
+            else:
+                collector_phase = '_'.join(['collector', proc_collector.tool_name.replace('tool_info_', '')])
+                collectors_futures.append(self.proc_collectors_executor.submit(
+                    self.proc_overhead.measure_phase, collector_phase,
+                    proc_collector.sample_latency, proc_process_list))
+        collectors_time_start = time.monotonic()
+
+        # wait collectors (each collector within its own deadline)
+        collectors_collections = []
+        for (proc_collector, proc_process_list), collector_future in zip(collectors_jobs, collectors_futures):
+
+            collector_collections, collector_latency = None, np.nan
+            if collector_future is not None:
+                collector_timeout = self.proc_collectors_timeout[id(proc_collector)]
+                collector_wait = None
+                if collector_timeout is not None:
+                    collector_wait = max(collectors_time_start + collector_timeout - time.monotonic(), 0.0)
+                try:
+                    collector_collections, collector_latency = collector_future.result(timeout=collector_wait)
+                    self.proc_collectors_running.pop(id(proc_collector), None)
+                except concurrent.futures.TimeoutError:
+                    log_stream.warning(' ===> Collector "' + proc_collector.tool_name + '" is not responding in ' +
+                                       str(collector_timeout) + ' seconds. Null sample')
+                    collector_latency = time.monotonic() - collectors_time_start
+                    self.proc_collectors_running[id(proc_collector)] = collector_future
+                except Exception as exc:
+                    log_stream.warning(' ===> Collector "' + proc_collector.tool_name + '" failed [' +
+                                       type(exc).__name__ + ': ' + str(exc) + ']. Null sample')
+                    collector_latency = time.monotonic() - collectors_time_start
+                    self.proc_collectors_running.pop(id(proc_collector), None)
+
+            if collector_collections is None:
+                collector_collections = proc_collector.get_null_sample()
+            else:
+                self.report_units.update(proc_collector.get_units(collector_collections))
+            collector_collections[proc_collector.get_latency_name()] = float('{:.4f}'.format(collector_latency))
+
+            collectors_collections.append(collector_collections)
+
+        return collectors_collections
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to execute report analysis (collections defined for each process target)
     def execute_report_analysis(self):
 
-        info_process_collections, info_memory_collections = {}, {}
-        info_disk_collections, info_system_load_collection = {}, {}
-        if 'tool_info_process' in self.proc_analysis_tools:
+        # overhead start
+        overhead_start = self.proc_overhead.start_phase()
 
-            # get tool attributes
-            tool_attrs = self.define_tool_attributes('tool_info_process', self.alg_tools)
+        # define collectors jobs (target collectors with the process list of the target; host collectors)
+        collectors_jobs, collectors_targets = [], []
+        if any([proc_target['obj_collectors'] for proc_target in self.proc_targets]):
 
-            # get and organize process info collections
-            info_process_raw = get_process_info(self.proc_name, **tool_attrs)
-            info_process_collections = organize_process_info(info_process_raw, **tool_attrs)
+            # get tool attributes (process selection)
+            tool_attrs = self.define_tool_attributes('tool_info_process', self.alg_tools)
+            if tool_attrs is None:
+                tool_attrs = {}
 
-        if 'tool_info_memory' in self.proc_analysis_tools:
+            # update process handles (one scan shared by all the targets)
+            self.proc_tracker.update_process_collections()
 
-            # get tool attributes
-            tool_attrs = self.define_tool_attributes('tool_info_memory', self.alg_tools)
-            # get and organize memory info collections
-            info_virtual_memory, info_swap_memory = get_memory_info()
-            info_memory_collections = organize_memory_info(info_virtual_memory, info_swap_memory, **tool_attrs)
+            for proc_target in self.proc_targets:
 
-        if 'tool_info_disk' in self.proc_analysis_tools:
+                # get process list (using the tracked process handles)
+                info_process_raw = self.proc_tracker.get_process_list(
+                    process_name=proc_target['name'], process_update=False, **tool_attrs)
 
-            # get tool attributes
-            tool_attrs = self.define_tool_attributes('tool_info_disk', self.alg_tools)
-            # get and organize disk info collections
-            info_disk_collections = get_disk_info(**tool_attrs)
+                for proc_collector in proc_target['obj_collectors']:
+                    collectors_jobs.append((proc_collector, info_process_raw))
+                    collectors_targets.append(proc_target['report_name'])
 
-        if 'tool_info_system_load' in self.proc_analysis_tools:
+        for proc_collector in self.proc_collectors:
+            collectors_jobs.append((proc_collector, None))
+            collectors_targets.append(None)
 
-            # get tool attributes
-            tool_attrs = self.define_tool_attributes('tool_info_system_load', self.alg_tools)
-            # get and organize system load info collections
-            info_system_load_collection = get_system_load_info(**tool_attrs)
+        # execute collectors (concurrent samples merged in the collections of the step)
+        collectors_collections = self.execute_collectors(collectors_jobs)
 
-        # merge information
-        info_report_collections = {**info_process_collections, **info_memory_collections,
-                                   **info_disk_collections, **info_system_load_collection}
+        info_process_targets = {proc_target['report_name']: {} for proc_target in self.proc_targets}
+        info_host_collections = {}
+        for collector_target, collector_collections in zip(collectors_targets, collectors_collections):
+            if collector_target is None:
+                info_host_collections.update(collector_collections)
+            else:
+                info_process_targets[collector_target].update(collector_collections)
 
         # time elapsed
         self.report_time_elapsed_step = round(time.time() - self.report_time_elapsed_start, 1)
 
+        # merge information (system collections shared by all the targets)
+        info_report_targets = {}
+        for info_report_name, info_process_collections in info_process_targets.items():
+            info_report_collections = {**info_process_collections, **info_host_collections}
+            if info_report_collections:
+                info_report_collections['time_elapsed'] = self.report_time_elapsed_step
+                info_report_targets[info_report_name] = info_report_collections
+
         # set empty dictionary to NoneTye
-        if not info_report_collections:
-            info_report_collections = None
-        else:
-            info_report_collections['time_elapsed'] = self.report_time_elapsed_step
+        if not info_report_targets:
+            info_report_targets = None
 
-        return info_report_collections
+        # overhead end
+        self.proc_overhead.stop_phase('execute_report_analysis', overhead_start)
+
+        return info_report_targets
     # -------------------------------------------------------------------------------------
 
     # -------------------------------------------------------------------------------------
-    # Method to freeze report analysis
-    def freeze_report_analysis(self, analysis_time, analysis_collections):
+    # Method to freeze report analysis (row appended to the ancillary file; cpu samples saved at each flush)
+    def freeze_report_analysis(self, analysis_time, analysis_collections, report_file_path_ancillary,
+                               report_writer):
+
+        # overhead start
+        overhead_start = self.proc_overhead.start_phase()
 
         # get and update file path ancillary
-        report_file_path_anc = deepcopy(self.report_file_path_ancillary)
-        report_file_path_anc = self.define_file_name(report_file_path_anc, report_id=self.report_count_id_step)
+        report_file_path_anc = self.define_file_name(report_file_path_ancillary, report_id=self.report_count_id_step)
 
-        if not os.path.exists(report_file_path_anc):
+        # append analysis row (batch of rows flushed to the ancillary file)
+        report_flushed = report_writer.append_row(
+            report_file_path_anc, analysis_time, analysis_collections, row_units=deepcopy(self.report_units))
 
-            # create ancillary folder
-            report_folder_name_anc, report_file_name_anc = os.path.split(report_file_path_anc)
-            make_folder(report_folder_name_anc)
+        # save analysis array (cpu samples of the ancillary file)
+        if report_flushed:
+            self.freeze_report_cpu(report_file_path_anc)
 
-            # create analysis dframe
-            analysis_dframe = pd.DataFrame(data=analysis_collections, index=[analysis_time])
-            analysis_dframe.index.name = self.report_index_tag
+        # overhead end
+        self.proc_overhead.stop_phase('freeze_report_analysis', overhead_start)
 
-            # save analysis dframe
-            write_obj(report_file_path_anc, analysis_dframe)
+    # -------------------------------------------------------------------------------------
 
-        else:
+    # -------------------------------------------------------------------------------------
+    # Method to freeze report cpu (cpu samples of the ancillary file)
+    def freeze_report_cpu(self, report_file_path_anc):
+        if self.proc_cpu_buffer is not None:
+            write_array(self.define_file_array(report_file_path_anc),
+                        self.proc_cpu_buffer.get_buffer(sample_start=self.report_cpu_sample_start))
 
-            # read analysis dframe previously saved
-            analysis_dframe_tmp = read_obj(report_file_path_anc)
-            # delete old ancillary file
-            if os.path.exists(report_file_path_anc):
-                os.remove(report_file_path_anc)
+    # -------------------------------------------------------------------------------------
 
-            # create analysis dframe
-            analysis_dframe_update = pd.DataFrame(data=analysis_collections, index=[analysis_time])
-            # merge analysis dframe
-            analysis_dframe = pd.concat([analysis_dframe_tmp, analysis_dframe_update], axis=0)
-            analysis_dframe.index.name = self.report_index_tag
+    # -------------------------------------------------------------------------------------
+    # Method to flush report analysis (pending rows of each target appended to the ancillary file; file closed)
+    def flush_report_analysis(self):
+        for proc_target in self.proc_targets:
+            report_writer = proc_target['obj_writer']
+            report_file_path_anc = report_writer.file_name
+            if report_writer.close_segment():
+                self.freeze_report_cpu(report_file_path_anc)
 
-            # save analysis dframe
-            write_obj(report_file_path_anc, analysis_dframe)
+    # -------------------------------------------------------------------------------------
 
-        # update counter(s)
+    # -------------------------------------------------------------------------------------
+    # Method to update report counter(s)
+    def update_report_counter(self):
         self.report_count_row_step += 1
-        if self.report_count_row_step == self.report_count_row_max:
+        report_count_bytes_step = max(
+            [proc_target['obj_writer'].file_bytes for proc_target in self.proc_targets])
+        if (self.report_count_row_step == self.report_count_row_max) or (
+                (self.report_count_bytes_max is not None) and (report_count_bytes_step >= self.report_count_bytes_max)):
+            self.flush_report_analysis()
             self.report_count_row_step = 0
             self.report_count_id_step += 1
+            if self.proc_cpu_buffer is not None:
+                self.report_cpu_sample_start = self.proc_cpu_buffer.sample_n
 
     # -------------------------------------------------------------------------------------
 
     # -------------------------------------------------------------------------------------
-    # Method to view report analysis
-    def view_report_analysis(self, report_analysis_src, report_process_n=0):
-
-        if 'tool_info_process' in self.proc_analysis_tools:
+    # Method to view report analysis (figures defined by the plot spec of the collectors)
+    def view_report_analysis(self, report_analysis_src, report_file_path_figure, report_collectors,
+                             report_units=None):
+
+        for proc_collector in report_collectors:
+            for plot_spec in proc_collector.get_plot_spec():
+
+                # get tool attributes (updated by the plot spec)
+                tool_attrs = {**deepcopy(proc_collector.tool_attrs), **plot_spec}
+                plot_fx = getattr(lib_analysis_plot, tool_attrs.pop('plot_name'))
+                plot_attrs = tool_attrs.pop('plot_attrs', {})
+
+                # filter analysis by column (prefix or name)
+                report_analysis_filter = filter_dframe_by_column(report_analysis_src, **tool_attrs)
+                # define report analysis file
+                report_analysis_file = report_file_path_figure.format(report_type=tool_attrs['prefix_name'])
+
+                # plot and save figure
+                if report_analysis_filter is not None:
+                    report_analysis_view = convert_dframe_units(
+                        report_analysis_filter, dframe_units_src=report_units, **tool_attrs)
+                    plot_fx(report_analysis_view, dframe_file_path=report_analysis_file,
+                            prefix_name=tool_attrs['prefix_name'], **plot_attrs)
 
-            # get tool attributes
-            tool_attrs = self.define_tool_attributes('tool_info_process', self.alg_tools)
-            tool_attrs['prefix_name'] = tool_attrs['prefix_name'].format(proc_n=report_process_n)
+    # -------------------------------------------------------------------------------------
 
-            # filter analysis by column (prefix or name)
-            report_analysis_filter = filter_dframe_by_column(report_analysis_src, **tool_attrs)
-            # define report analysis file
-            report_analysis_file = self.report_file_path_figure.format(report_type=tool_attrs['prefix_name'])
+    # -------------------------------------------------------------------------------------
+    # Method to launch process (launch mode; process command spawned as a child of the analysis)
+    def launch_process(self):
+
+        proc_target = self.proc_targets[0]
+
+        log_stream.info(' -----> Launch process "' + ' '.join(self.proc_launch_command) + '" ... ')
+        try:
+            self.proc_launch_pid = os.posix_spawnp(self.proc_launch_command[0], self.proc_launch_command, os.environ)
+        except OSError as exc:
+            log_stream.error(' ===> Process command "' + self.proc_launch_command[0] + '" is not available [' +
+                             str(exc) + ']')
+            raise RuntimeError('Process command cannot be launched')
+        self.proc_launch_time_start = time.monotonic()
+
+        # set process handle (no process scan for the launched process)
+        proc_obj_launch = psutil.Process(self.proc_launch_pid)
+        self.proc_tracker.set_process_collections({proc_target['name']: [proc_obj_launch]})
+        proc_target['obj_init'] = [proc_obj_launch]
+        self.report_time_elapsed_start = time.time()
 
-            # plot and save figure
-            if report_analysis_filter is not None:
-                report_analysis_view = convert_dframe_units(report_analysis_filter, dframe_units='G', **tool_attrs)
-                plot_process_info(report_analysis_view, dframe_file_path=report_analysis_file,
-                                  prefix_name=tool_attrs['prefix_name'])
+        log_stream.info(' -----> Launch process "' + ' '.join(self.proc_launch_command) + '" ... DONE [pid: ' +
+                        str(self.proc_launch_pid) + ']')
 
-        if 'tool_info_memory' in self.proc_analysis_tools:
+    # -------------------------------------------------------------------------------------
 
-            # get tool attributes
-            tool_attrs = self.define_tool_attributes('tool_info_memory', self.alg_tools)
-            tool_attrs['prefix_name'] = tool_attrs['prefix_name_virtual_memory']
+    # -------------------------------------------------------------------------------------
+    # Method to wait launch process (launch mode; exit status and resource usage of the child from wait4)
+    def wait_launch_process(self, prefix_name='launch', separator_name='_'):
+
+        log_stream.info(' -----> Wait launched process [pid: ' + str(self.proc_launch_pid) + '] ... ')
+
+        # wait the child (no wait if the analysis stopped with the process still running)
+        proc_wait_options = 0 if self.proc_watcher.process_exited else os.WNOHANG
+        try:
+            proc_pid, proc_status, proc_rusage = os.wait4(self.proc_launch_pid, proc_wait_options)
+        except ChildProcessError:
+            proc_pid, proc_status, proc_rusage = 0, None, None
+        if proc_pid == 0:
+            log_stream.warning(' ===> Launched process is still running. Resource usage is not available')
+            log_stream.info(' -----> Wait launched process [pid: ' + str(self.proc_launch_pid) + '] ... SKIPPED')
+            return
+
+        # organize launch info (exact peak rss and cpu times of the child; ru_maxrss in kilobytes)
+        dict_launch = {
+            'pid': self.proc_launch_pid, 'exit_code': os.waitstatus_to_exitcode(proc_status),
+            'time_elapsed': round(time.monotonic() - self.proc_launch_time_start, 4),
+            'rusage_maxrss': proc_rusage.ru_maxrss * 1024,
+            'rusage_utime': proc_rusage.ru_utime, 'rusage_stime': proc_rusage.ru_stime,
+            'rusage_cpu_time': proc_rusage.ru_utime + proc_rusage.ru_stime,
+            'rusage_minflt': proc_rusage.ru_minflt, 'rusage_majflt': proc_rusage.ru_majflt,
+            'rusage_inblock': proc_rusage.ru_inblock, 'rusage_oublock': proc_rusage.ru_oublock,
+            'rusage_nvcsw': proc_rusage.ru_nvcsw, 'rusage_nivcsw': proc_rusage.ru_nivcsw}
+        dict_launch_units = {'time_elapsed': 's', 'rusage_maxrss': 'B',
+                             'rusage_utime': 's', 'rusage_stime': 's', 'rusage_cpu_time': 's'}
+
+        info_launch_collections, info_launch_units = {}, {}
+        for obj_key, obj_value in dict_launch.items():
+            info_launch_collections[separator_name.join([prefix_name, obj_key])] = obj_value
+            if obj_key in dict_launch_units:
+                info_launch_units[separator_name.join([prefix_name, obj_key])] = dict_launch_units[obj_key]
+
+        self.proc_launch_info = {'time': pd.Timestamp.now(), 'collections': info_launch_collections,
+                                 'units': info_launch_units}
+
+        log_stream.info(' ------> ExitCode: "' + str(dict_launch['exit_code']) + '" :: MaxRSS: "' +
+                        str(dict_launch['rusage_maxrss']) + ' B" :: CpuTime: "' +
+                        '{:.2f}'.format(dict_launch['rusage_cpu_time']) + ' SECONDS"')
+        log_stream.info(' -----> Wait launched process [pid: ' + str(self.proc_launch_pid) + '] ... DONE')
 
-            # filter analysis by column (prefix or name)
-            report_analysis_filter = filter_dframe_by_column(report_analysis_src, **tool_attrs)
-            # define report analysis file
-            report_analysis_file = self.report_file_path_figure.format(report_type=tool_attrs['prefix_name'])
+    # -------------------------------------------------------------------------------------
 
-            # plot and save figure
-            if report_analysis_filter is not None:
-                report_analysis_view = convert_dframe_units(
-                    report_analysis_filter, dframe_units='G', dframe_format='{:0.3}', **tool_attrs)
-                plot_memory_info(report_analysis_view, dframe_file_path=report_analysis_file)
+    # -------------------------------------------------------------------------------------
+    # Method to wait process targets (lifecycle mode; scan at the wait frequency until a target is found)
+    def wait_process_targets(self):
+
+        if not self.proc_lifecycle_wait:
+            return True
+
+        log_stream.info(' -----> Wait process target(s) [frequency: ' +
+                        str(self.proc_lifecycle_seconds_frequency) + ' seconds] ... ')
+        proc_found = self.proc_tracker.wait_process_collections(
+            self.proc_lifecycle_seconds_frequency, seconds_period=self.proc_lifecycle_seconds_period,
+            wait_stop=lambda: self.proc_analysis_stop)
+
+        if proc_found:
+            for proc_target in self.proc_targets:
+                proc_target['obj_init'] = self.proc_tracker.get_process_list(
+                    process_name=proc_target['name'], process_update=False)
+            self.report_time_elapsed_start = time.time()
+            log_stream.info(' -----> Wait process target(s) ... DONE')
+        else:
+            log_stream.warning(' ===> Process target(s) not found in the wait period')
+            log_stream.info(' -----> Wait process target(s) ... FAILED')
 
-        if 'tool_info_disk' in self.proc_analysis_tools:
+        return proc_found
 
-            # get tool attributes
-            tool_attrs = self.define_tool_attributes('tool_info_disk', self.alg_tools)
+    # -------------------------------------------------------------------------------------
 
-            # filter analysis by column (prefix or name)
-            report_analysis_filter = filter_dframe_by_column(report_analysis_src, **tool_attrs)
-            # define report analysis file
-            report_analysis_file = self.report_file_path_figure.format(report_type=tool_attrs['prefix_name'])
+    # -------------------------------------------------------------------------------------
+    # Method to update process watcher (lifecycle mode; tracked processes of the targets watched until the exit)
+    def update_process_watcher(self):
+        if self.proc_watcher is not None:
+            for proc_obj_list in self.proc_tracker.process_obj_collections.values():
+                self.proc_watcher.update_process_list(proc_obj_list)
 
-            # plot and save figure
-            if report_analysis_filter is not None:
-                report_analysis_view = convert_dframe_units(
-                    report_analysis_filter, dframe_units='T', dframe_format='{:0.5}', **tool_attrs)
-                plot_disk_info(report_analysis_view, dframe_file_path=report_analysis_file)
+    # -------------------------------------------------------------------------------------
 
-        print('cioa')
+    # -------------------------------------------------------------------------------------
+    # Method to release analysis (executors and watcher of the organize part)
+    def release_analysis(self):
+
+        # release ancillary writers (pending rows appended to the ancillary files)
+        self.flush_report_analysis()
+        # release collectors executor (collectors still running are not waited)
+        self.proc_collectors_executor.shutdown(wait=False)
+        # release finalize executor (segments in progress are waited)
+        if self.report_finalize_executor is not None:
+            self.report_finalize_executor.shutdown(wait=True)
+        # release process watcher
+        if self.proc_watcher is not None:
+            self.proc_watcher.close()
+        # release launched process (exit status and resource usage)
+        if self.proc_launch_pid is not None:
+            self.wait_launch_process()
 
     # -------------------------------------------------------------------------------------
 
@@ -366,32 +938,69 @@ class DriverAnalysis:
 
         # info report start
         log_stream.info(' ----> Organize report ... ')
+        overhead_start = self.proc_overhead.start_phase()
+
+        # launch process (launch mode; process monitored from the start)
+        if self.flag_activate_report_alg_organize and self.proc_launch:
+            self.launch_process()
+
+        # flag to activate organize part (process targets waited in lifecycle mode)
+        if self.flag_activate_report_alg_organize and (not self.wait_process_targets()):
+
+            # release analysis
+            self.release_analysis()
+
+            # info report end
+            log_stream.info(' ----> Organize analysis report ... SKIPPED. PROCESS TARGET NOT FOUND')
+
+        elif self.flag_activate_report_alg_organize and (self.proc_analysis_mode == 'high_frequency'):
+
+            # organize high frequency analysis (samples saved in the array files)
+            self.organize_high_frequency()
 
-        # flag to activate organize part
-        if self.flag_activate_report_alg_organize:
+            # release analysis
+            self.release_analysis()
 
-            # define clock execution
-            clock_stamp_start_out, clock_stamp_end_out, clock_update_out = self.define_clock_execution(
-                clock_stamp_start_in=None, clock_stamp_end_in=None, clock_update=True)
+            # info report end
+            log_stream.info(' ----> Organize analysis report ... DONE')
+
+        elif self.flag_activate_report_alg_organize:
+
+            # start scheduler (ticks defined by the analysis frequency over the analysis period)
+            self.update_process_watcher()
+            self.proc_scheduler.start()
 
             while True:
 
-                # define clock time step
-                clock_time_step = deepcopy(clock_stamp_start_out)
+                # wait scheduler tick (sample time defined by the actual time of the tick; period checked)
+                log_stream.info(' -----> Analysis time ... ')
+                clock_time_step, clock_tick_info = self.proc_scheduler.wait_tick()
+                if clock_time_step is None:
+                    if self.proc_scheduler.wait_stopped:
+                        log_stream.info(' -----> Analysis time ... PROCESS TARGET EXITED. EXIT')
+                    else:
+                        log_stream.info(' -----> Analysis time ... EXPIRED. EXIT')
+                    break
+                if self.proc_analysis_stop:
+                    log_stream.info(' -----> Analysis time ... STOPPED. EXIT')
+                    break
+                log_stream.info(' -----> Analysis time ... CONTINUE')
+
+                # roll report segment (daemon mode; outputs of the completed segment finalized in the background)
+                if self.proc_daemon:
+                    self.roll_report_segment(clock_time_step)
+
                 # info clock time step start
                 log_stream.info(' -----> Time "' + str(clock_time_step) + '" ... ')
-                log_stream.info(' ------> Period: "' + str(clock_stamp_start_out) + '" :: "' + str(clock_stamp_end_out) + '"')
-
-                # check analysis time period
-                log_stream.info(' ------> Analysis time ... ')
-                if clock_time_step > clock_stamp_end_out:
-                    log_stream.info(' ------> Analysis time ... EXPIRED. EXIT')
-                    break
-                else:
-                    log_stream.info(' ------> Analysis time ... CONTINUE')
+                log_stream.info(' ------> Tick: "' + str(clock_tick_info['tick']) + '" :: Lag: "' +
+                                '{:.4f}'.format(clock_tick_info['lag']) + ' SECONDS"')
+                if clock_tick_info['missed'] > 0:
+                    log_stream.warning(' ===> Analysis step exceeded the analysis frequency. Skip ' +
+                                       str(clock_tick_info['missed']) + ' tick(s)')
 
-                # get report information
+                # get report information (new processes of the targets added to the watcher)
                 info_report = self.execute_report_analysis()
+                self.update_process_watcher()
 
                 # check analysis report
                 log_stream.info(' ------> Analysis information ... ')
@@ -401,147 +1010,413 @@ class DriverAnalysis:
                 else:
                     log_stream.info(' ------> Analysis information  ... CONTINUE')
 
-                # save report information
-                self.freeze_report_analysis(clock_time_step, info_report)
-
-                # compute the time information
-                clock_stamp_start_in = deepcopy(clock_stamp_start_out)
-                clock_stamp_end_in = deepcopy(clock_stamp_end_out)
-                clock_update_in = deepcopy(clock_update_out)
-
-                # define clock execution (in while cycles)
-                clock_stamp_start_out, clock_stamp_end_out, clock_update_out = self.define_clock_execution(
-                    clock_stamp_start_in=clock_stamp_start_in, clock_stamp_end_in=clock_stamp_end_in,
-                    clock_update=clock_update_in)
-
-                # compute time sleep (if defined)
-                log_stream.info(' ------> Sleep time ... ')
-                time_loop = time.time()
-                if self.proc_analysis_seconds_frequency is not None:
-                    # time.sleep(self.proc_analysis_seconds_frequency)
-                    time_sleep = round(self.proc_analysis_seconds_frequency - ((time.time() - time_loop) % 60.0))
-                    log_stream.info(' ------> Sleep time ... WAIT FOR "' + str(time_sleep) + ' SECONDS"')
-                    time.sleep(time_sleep)
-                else:
-                    log_stream.info(' ------> Sleep time ... NOT SET')
+                # save report information (for each process target; scheduler info added to the collections)
+                for proc_target in self.proc_targets:
+                    if proc_target['report_name'] in list(info_report.keys()):
+                        info_report_target = info_report[proc_target['report_name']]
+                        for clock_tick_key, clock_tick_value in clock_tick_info.items():
+                            info_report_target['_'.join(['scheduler', clock_tick_key])] = clock_tick_value
+                        if self.proc_overhead_report:
+                            info_overhead_collections = self.proc_overhead.get_phase_info()
+                            self.report_units.update(define_units_info(
+                                info_overhead_collections, fields_bytes=['rss'],
+                                fields_units={'wall': 's', 'cpu': 's'}))
+                            info_report_target.update(info_overhead_collections)
+                        self.freeze_report_analysis(
+                            clock_time_step, info_report_target, proc_target['file_path_ancillary'],
+                            proc_target['obj_writer'])
+                self.update_report_counter()
+
+                # update scheduler interval (adaptive mode driven by the rate of change of the memory values)
+                if self.proc_adaptive is not None:
+                    proc_adaptive_values = {}
+                    for info_report_name, info_report_target in info_report.items():
+                        for proc_adaptive_column in self.proc_adaptive_columns:
+                            proc_adaptive_value = info_report_target.get(proc_adaptive_column, None)
+                            if isinstance(proc_adaptive_value, (int, float)) and np.isfinite(proc_adaptive_value):
+                                proc_adaptive_values[(info_report_name, proc_adaptive_column)] = proc_adaptive_value
+                    proc_adaptive_seconds = self.proc_adaptive.update_interval(
+                        proc_adaptive_values, self.proc_scheduler.time_sample_monotonic)
+                    if proc_adaptive_seconds != clock_tick_info['interval']:
+                        log_stream.info(' ------> Interval: "' + '{:.2f}'.format(proc_adaptive_seconds) +
+                                        ' SECONDS" [slope: ' + '{:.1f}'.format(self.proc_adaptive.slope_last) + ']')
+                    self.proc_scheduler.set_interval(proc_adaptive_seconds)
 
                 # info clock time step start
                 log_stream.info(' -----> Time "' + str(clock_time_step) + '" ... DONE')
 
+            # release analysis
+            self.release_analysis()
+
             # info report end
             log_stream.info(' ----> Organize analysis report ... DONE')
         else:
             # info report end
             log_stream.info(' ----> Organize analysis report ... NOT ACTIVATED')
 
+        # overhead end
+        self.proc_overhead.stop_phase('organize', overhead_start)
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to organize high frequency analysis (cheap collectors sampled in the buffers; no logging for each step)
+    def organize_high_frequency(self):
+
+        # get process lists (updated at each ancillary file)
+        self.proc_tracker.update_process_collections()
+        proc_process_lists = {proc_target['report_name']: self.proc_tracker.get_process_list(
+            process_name=proc_target['name'], process_update=False) for proc_target in self.proc_targets}
+        self.update_process_watcher()
+
+        # start scheduler (ticks defined by the analysis frequency over the analysis period)
+        log_stream.info(' -----> Sample high frequency analysis [frequency: ' +
+                        str(self.proc_analysis_seconds_frequency) + ' seconds] ... ')
+        self.proc_scheduler.start()
+
+        while True:
+
+            # wait scheduler tick (sample time in nanoseconds; period checked)
+            clock_time_step, clock_tick_info = self.proc_scheduler.wait_tick()
+            if (clock_time_step is None) or self.proc_analysis_stop:
+                break
+            clock_time_step_ns = self.proc_scheduler.time_sample_ns
+
+            # roll report segment (daemon mode; outputs of the completed segment finalized in the background)
+            if self.proc_daemon:
+                self.roll_report_segment(clock_time_step)
+
+            # get host collections (collectors shared by all the targets)
+            info_host_collections = {'scheduler_lag': clock_tick_info['lag'],
+                                     'scheduler_missed': clock_tick_info['missed']}
+            for proc_collector in self.proc_collectors:
+                info_host_collections.update(proc_collector.sample())
+
+            # update samples buffer (for each process target)
+            for proc_target in self.proc_targets:
+                info_process_collections = {}
+                for proc_collector in proc_target['obj_collectors']:
+                    info_process_collections.update(
+                        proc_collector.sample(proc_process_lists[proc_target['report_name']]))
+                proc_target['obj_buffer'].update_buffer(
+                    clock_time_step_ns, {**info_process_collections, **info_host_collections})
+
+            # save samples buffer (ancillary file completed)
+            if self.report_count_row_step + 1 == self.report_count_row_max:
+                self.freeze_report_array()
+                self.proc_tracker.update_process_collections()
+                proc_process_lists = {proc_target['report_name']: self.proc_tracker.get_process_list(
+                    process_name=proc_target['name'], process_update=False) for proc_target in self.proc_targets}
+                self.update_process_watcher()
+            self.update_report_counter()
+
+        # save samples buffer (ancillary file not completed)
+        self.freeze_report_array()
+
+        if self.proc_scheduler.wait_stopped:
+            log_stream.info(' -----> Sample high frequency analysis ... PROCESS TARGET EXITED')
+        log_stream.info(' -----> Sample high frequency analysis [samples: ' + str(self.proc_scheduler.tick_n) +
+                        ' :: missed: ' + str(self.proc_scheduler.tick_missed) + '] ... DONE')
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to freeze report array (samples buffer of each target saved in the ancillary array file)
+    def freeze_report_array(self):
+        for proc_target in self.proc_targets:
+            if proc_target['obj_buffer'].sample_n > 0:
+                report_file_path_anc = self.define_file_array(
+                    self.define_file_name(proc_target['file_path_ancillary'], report_id=self.report_count_id_step),
+                    file_tag='hf')
+                make_folder(os.path.split(report_file_path_anc)[0])
+                write_array(report_file_path_anc, proc_target['obj_buffer'].get_buffer())
+                proc_target['obj_buffer'].reset_buffer()
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to merge analysis array(s) (samples concatenated along the time axis)
+    def merge_report_array(self, report_file_path_anc_tmp, report_count_ids, report_array_tag='cpu',
+                           report_array_keys=None):
+
+        if report_array_keys is None:
+            report_array_keys = ['time', 'cpu_times_percent', 'cpu_stats']
+
+        report_analysis_array = None
+        for report_count_id in report_count_ids:
+            report_file_path_anc_id = self.define_file_array(
+                self.define_file_name(report_file_path_anc_tmp, report_id=report_count_id), file_tag=report_array_tag)
+            if os.path.exists(report_file_path_anc_id):
+                report_array_id = read_array(report_file_path_anc_id)
+                if report_analysis_array is None:
+                    report_analysis_array = report_array_id
+                else:
+                    for report_array_key in report_array_keys:
+                        report_analysis_array[report_array_key] = np.concatenate(
+                            [report_analysis_array[report_array_key], report_array_id[report_array_key]], axis=0)
+        return report_analysis_array
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to convert report array (samples buffer --> dframe indexed by the local time of the samples)
+    def convert_report_array(self, report_analysis_array):
+
+        if report_analysis_array is None:
+            return None
+
+        report_time_zone = datetime.timezone(datetime.timedelta(seconds=time.localtime().tm_gmtoff))
+        report_time_index = pd.to_datetime(
+            report_analysis_array['time'], unit='ns', utc=True).tz_convert(report_time_zone).tz_localize(None)
+
+        report_analysis_dframe = pd.DataFrame(
+            data=report_analysis_array['values'], columns=report_analysis_array['columns'].tolist(),
+            index=report_time_index)
+        report_analysis_dframe.index.name = self.report_index_tag
+
+        return report_analysis_dframe
+
     # -------------------------------------------------------------------------------------
 
     # -------------------------------------------------------------------------------------
-    # Method to dump analysis report
-    def dump(self):
+    # Method to dump analysis report (current report or completed segment of the daemon mode)
+    def dump(self, report_targets=None, report_count_id_end=None, report_units=None):
+
+        report_launch = None
+        if report_targets is None:
+            report_targets, report_launch = self.proc_targets, self.proc_launch_info
+        if report_count_id_end is None:
+            report_count_id_end = self.report_count_id_step
+        if report_units is None:
+            report_units = self.report_units
 
         # info report start
         log_stream.info(' ----> Dump analysis report ... ')
+        overhead_start = self.proc_overhead.start_phase()
 
         # flag to activate dump part
         if self.flag_activate_report_alg_dump:
 
-            # get file ancillary and destination
-            report_file_path_anc_tmp = deepcopy(self.report_file_path_ancillary)
-            report_file_path_dst = deepcopy(self.report_file_path_destination)
-
             # get start, end and list counter(s)
             report_count_id_start = self.report_count_id_start
-            report_count_id_end = self.report_count_id_step
             report_count_ids = np.arange(report_count_id_start, report_count_id_end + 1, 1).tolist()
 
-            # flag to clean destination file previously saved
-            if self.flag_clean_report_file_destination:
-                if os.path.exists(report_file_path_dst):
-                    os.remove(report_file_path_dst)
-
-            if not os.path.exists(report_file_path_dst):
-                report_analysis_collections = None
-                for report_count_id in report_count_ids:
-
-                    # define report ancillary analysis file
-                    report_file_path_anc_id = self.define_file_name(report_file_path_anc_tmp, report_id=report_count_id)
-                    # get report ancillary analysis file
-                    log_stream.info(' -----> Get analysis file "' + report_file_path_anc_id + '" ... ')
-                    # read ancillary analysis file
-                    if os.path.exists(report_file_path_anc_id):
-
-                        # read ancillary report file
-                        report_analysis_id = read_obj(report_file_path_anc_id)
-
-                        # merge ancillary file
-                        if report_analysis_collections is None:
-                            report_analysis_collections = deepcopy(report_analysis_id)
-                        else:
-                            # merge analysis dframe
-                            report_analysis_collections = pd.concat(
-                                [report_analysis_collections, report_analysis_id], axis=0)
-
-                        log_stream.info(' -----> Get analysis file "' + report_file_path_anc_id + '" ... DONE')
+            # iterate over process target(s)
+            for proc_target in report_targets:
+
+                # get file ancillary and destination
+                report_file_path_anc_tmp = deepcopy(proc_target['file_path_ancillary'])
+                report_file_path_dst = deepcopy(proc_target['file_path_destination'])
+
+                # flag to clean destination file previously saved
+                if self.flag_clean_report_file_destination:
+                    if os.path.exists(report_file_path_dst):
+                        os.remove(report_file_path_dst)
+
+                if not os.path.exists(report_file_path_dst):
+                    report_analysis_collections, report_analysis_units = None, deepcopy(report_units)
+                    if self.proc_analysis_mode == 'standard':
+                        for report_count_id in report_count_ids:
+
+                            # define report ancillary analysis file
+                            report_file_path_anc_id = self.define_file_name(
+                                report_file_path_anc_tmp, report_id=report_count_id)
+                            # get report ancillary analysis file
+                            log_stream.info(' -----> Get analysis file "' + report_file_path_anc_id + '" ... ')
+                            # read ancillary analysis file
+                            if os.path.exists(report_file_path_anc_id):
+
+                                # read ancillary report file
+                                report_analysis_id = read_workspace(
+                                    report_file_path_anc_id, index_name=self.report_index_tag)
+                                report_analysis_units.update(report_analysis_id.attrs.get('units', {}))
+
+                                # merge ancillary file
+                                if report_analysis_collections is None:
+                                    report_analysis_collections = deepcopy(report_analysis_id)
+                                else:
+                                    # merge analysis dframe
+                                    report_analysis_collections = pd.concat(
+                                        [report_analysis_collections, report_analysis_id], axis=0)
+
+                                log_stream.info(' -----> Get analysis file "' + report_file_path_anc_id + '" ... DONE')
+                            else:
+                                log_stream.warning(' ===> File not found')
+                                log_stream.info(' -----> Get analysis file "' + report_file_path_anc_id + '" ... SKIPPED')
+
+                    # merge analysis array(s) (cpu samples)
+                    report_analysis_array = None
+                    if self.proc_cpu_buffer is not None:
+                        report_analysis_array = self.merge_report_array(report_file_path_anc_tmp, report_count_ids)
+
+                    # merge analysis array(s) (samples of the high frequency mode)
+                    report_analysis_samples = None
+                    if self.proc_analysis_mode == 'high_frequency':
+                        report_analysis_samples = self.merge_report_array(
+                            report_file_path_anc_tmp, report_count_ids, report_array_tag='hf',
+                            report_array_keys=['time', 'values'])
+                        report_analysis_collections = self.convert_report_array(report_analysis_samples)
+
+                    # add launch info (resource usage of the launched process at the exit time)
+                    if report_launch is not None:
+                        report_launch_dframe = pd.DataFrame(
+                            data=report_launch['collections'], index=[report_launch['time']])
+                        report_launch_dframe.index.name = self.report_index_tag
+                        report_analysis_collections = pd.concat(
+                            [report_analysis_collections, report_launch_dframe], axis=0)
+                        report_analysis_units.update(report_launch['units'])
+
+                    # check analysis collections
+                    if report_analysis_collections is None:
+                        log_stream.warning(' ===> Analysis collections for process target "' +
+                                           proc_target['report_name'] + '" are not available')
+                        continue
+
+                    # dump analysis to csv file
+                    log_stream.info(' -----> Dump analysis file "' + report_file_path_dst + '" ... ')
+
+                    report_folder_name_dst, report_file_name_dst = os.path.split(report_file_path_dst)
+                    make_folder(report_folder_name_dst)
+
+                    if self.report_storage == 'csv':
+                        write_csv(report_file_path_dst, report_analysis_collections,
+                                  file_separator=self.report_file_delimiter)
                     else:
-                        log_stream.warning(' ===> File not found')
-                        log_stream.info(' -----> Get analysis file "' + report_file_path_anc_id + '" ... SKIPPED')
-
-                # dump analysis to csv file
-                log_stream.info(' -----> Dump analysis file "' + report_file_path_dst + '" ... ')
-
-                report_folder_name_dst, report_file_name_dst = os.path.split(report_file_path_dst)
-                make_folder(report_folder_name_dst)
+                        write_columnar(report_file_path_dst, report_analysis_collections,
+                                       file_units=report_analysis_units, file_format=self.report_storage)
+                    write_json(proc_target['file_path_units'], report_analysis_units)
+                    if report_analysis_array is not None:
+                        write_array(proc_target['file_path_cpu'], report_analysis_array)
+                    if report_analysis_samples is not None:
+                        write_array(proc_target['file_path_hf'], report_analysis_samples)
+                    log_stream.info(' -----> Dump analysis file "' + report_file_path_dst + '" ... DONE')
 
-                write_csv(report_file_path_dst, report_analysis_collections, file_separator=self.report_file_delimiter)
-                log_stream.info(' -----> Dump analysis file "' + report_file_path_dst + '" ... DONE')
+                else:
+                    log_stream.info(' -----> Dump analysis file "' + report_file_path_dst + '" ... PREVIOUSLY SAVED')
 
-                # info report end
-                log_stream.info(' ----> Dump analysis report ... DONE')
-            else:
-                # info report end
-                log_stream.info(' ----> Dump analysis report ... PREVIOUSLY SAVED')
+            # info report end
+            log_stream.info(' ----> Dump analysis report ... DONE')
         else:
             # info report end
             log_stream.info(' ----> Dump analysis report ... NOT ACTIVATED')
+
+        # overhead end
+        self.proc_overhead.stop_phase('dump', overhead_start)
     # -------------------------------------------------------------------------------------
 
     # -------------------------------------------------------------------------------------
-    # Method to view analysis
-    def view(self):
+    # Method to view analysis (current report or completed segment of the daemon mode)
+    def view(self, report_targets=None):
+
+        if report_targets is None:
+            report_targets = self.proc_targets
 
         # info report start
         log_stream.info(' ----> View analysis report ... ')
+        overhead_start = self.proc_overhead.start_phase()
 
         # flag to activate view part
         if self.flag_activate_report_alg_view:
 
-            # get file destination and figure
-            report_file_path_dst = deepcopy(self.report_file_path_destination)
-            report_file_path_figure = deepcopy(self.report_file_path_figure)
+            # iterate over process target(s)
+            for proc_target in report_targets:
 
-            # flag to clean figure file previously saved
-            if self.flag_clean_report_file_figure:
-                if os.path.exists(report_file_path_figure):
-                    os.remove(report_file_path_figure)
+                # get file destination and figure
+                report_file_path_dst = deepcopy(proc_target['file_path_destination'])
+                report_file_path_figure = deepcopy(proc_target['file_path_figure'])
+                report_file_path_units = deepcopy(proc_target['file_path_units'])
 
-            if os.path.exists(report_file_path_dst):
+                # flag to clean figure file previously saved
+                if self.flag_clean_report_file_figure:
+                    if os.path.exists(report_file_path_figure):
+                        os.remove(report_file_path_figure)
 
-                # read analysis from csv file
-                report_file_delimiter = ';'
-                report_analysis = read_csv(report_file_path_dst, file_separator=report_file_delimiter) #self.report_file_delimiter)
+                if os.path.exists(report_file_path_dst):
 
-                # plot analysis
-                self.view_report_analysis(report_analysis)
+                    # read analysis from csv or columnar file (columnar values typed by the schema)
+                    if self.report_storage == 'csv':
+                        report_analysis = read_csv(report_file_path_dst, file_separator=self.report_file_delimiter)
+                    else:
+                        report_analysis = read_columnar(report_file_path_dst)
+                        report_analysis.index = report_analysis.index.astype(str)
+                    # read analysis units (if available; reports without units are defined by human strings)
+                    report_units = None
+                    if os.path.exists(report_file_path_units):
+                        report_units = read_json(report_file_path_units)
+
+                    # plot analysis
+                    self.view_report_analysis(report_analysis, report_file_path_figure,
+                                              proc_target['obj_collectors'] + self.proc_collectors,
+                                              report_units=report_units)
 
-                # info report start
-                log_stream.info(' ----> View analysis report ... DONE')
-            else:
-                log_stream.warning(' ===> File "' + report_file_path_dst + '" not found')
-                log_stream.info(' ----> View analysis report ... SKIPPED')
+                else:
+                    log_stream.warning(' ===> File "' + report_file_path_dst + '" not found')
+
+            # info report start
+            log_stream.info(' ----> View analysis report ... DONE')
         else:
             # info report start
             log_stream.info(' ----> View analysis report ... NOT ACTIVATED')
+
+        # overhead end
+        self.proc_overhead.stop_phase('view', overhead_start)
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to dump overhead (calls of the analysis phases and percentiles summary of the run)
+    def dump_overhead(self):
+
+        # info report start
+        log_stream.info(' ----> Dump overhead report ... ')
+
+        # get overhead summary (percentiles of each phase)
+        report_overhead_summary = self.proc_overhead.get_summary()
+        for phase_name, phase_summary in report_overhead_summary.items():
+            if phase_name == 'process':
+                log_stream.info(' -----> Process ::: CpuTime: "' + '{:.3f}'.format(phase_summary['cpu_total']) +
+                                ' SECONDS" :: CpuPercent: "' + '{:.3f}'.format(phase_summary['cpu_percent']) +
+                                ' %" :: MaxRSS: "' + str(int(phase_summary['rss_max'])) + ' B"')
+            else:
+                log_stream.info(' -----> Phase "' + phase_name + '" ::: Calls: "' + str(phase_summary['calls']) +
+                                '" :: Wall: "' + ' '.join(
+                                    ['{:.4f}'.format(phase_summary['wall_p' + str(percentile)])
+                                     for percentile in self.proc_overhead.percentiles]) +
+                                ' SECONDS" :: Cpu: "' + ' '.join(
+                                    ['{:.4f}'.format(phase_summary['cpu_p' + str(percentile)])
+                                     for percentile in self.proc_overhead.percentiles]) +
+                                ' SECONDS" [percentiles: ' +
+                                ', '.join([str(percentile) for percentile in self.proc_overhead.percentiles]) + ']')
+
+        # flag to activate dump part (overhead of the run saved next to the report of the first target)
+        if self.flag_activate_report_alg_dump:
+
+            proc_target = self.proc_targets[0]
+            report_file_path_overhead = proc_target['file_path_overhead']
+            report_file_path_overhead_summary = proc_target['file_path_overhead_summary']
+
+            log_stream.info(' -----> Dump overhead file "' + report_file_path_overhead + '" ... ')
+
+            # organize overhead table (one row for each call; time of the end of the call)
+            report_overhead_array = self.proc_overhead.get_buffer()
+            report_overhead_dframe = self.convert_report_array(report_overhead_array).round(6)
+            report_overhead_dframe.insert(0, 'phase', report_overhead_array['phase'])
+            # organize overhead summary (one row for each phase)
+            report_overhead_summary_dframe = pd.DataFrame.from_dict(report_overhead_summary, orient='index').round(6)
+            report_overhead_summary_dframe.index.name = 'phase'
+
+            make_folder(os.path.split(report_file_path_overhead)[0])
+            write_csv(report_file_path_overhead, report_overhead_dframe, file_separator=self.report_file_delimiter)
+            write_csv(report_file_path_overhead_summary, report_overhead_summary_dframe,
+                      file_separator=self.report_file_delimiter)
+
+            log_stream.info(' -----> Dump overhead file "' + report_file_path_overhead + '" ... DONE')
+
+            # info report end
+            log_stream.info(' ----> Dump overhead report ... DONE')
+        else:
+            # info report end
+            log_stream.info(' ----> Dump overhead report ... NOT ACTIVATED')
+
     # -------------------------------------------------------------------------------------
 
     # -------------------------------------------------------------------------------------
@@ -553,36 +1428,40 @@ class DriverAnalysis:
 
         if self.flag_activate_report_alg_kill:
 
-            proc_name_user, proc_obj_list = self.proc_name, self.proc_obj_init
+            # iterate over process target(s)
+            for proc_target in self.proc_targets:
 
-            if proc_obj_list is not None:
-                for proc_obj_step in proc_obj_list:
+                proc_name_user, proc_obj_list = proc_target['name'], proc_target['obj_init']
 
-                    proc_pid_step = proc_obj_step.pid
+                if proc_obj_list is not None:
+                    for proc_obj_step in proc_obj_list:
 
-                    try:
-                        proc_name_step, proc_status_step = proc_obj_step.name(), proc_obj_step.status()
-                        proc_gone_step, proc_alive_step = kill_process_tree(proc_pid_step)
+                        proc_pid_step = proc_obj_step.pid
 
-                        if proc_name_step != proc_name_user:
-                            log_stream.warning(
-                                ' ===> ProcessName set in memory "' + proc_name_step +
-                                '" is not equal to ProcessName set by user "' + proc_name_user + '"')
+                        try:
+                            proc_name_step, proc_status_step = proc_obj_step.name(), proc_obj_step.status()
+                            proc_gone_step, proc_alive_step = kill_process_tree(proc_pid_step)
 
-                        log_stream.info(' -----> Kill ::: ProcessName "' + proc_name_user +
-                                        '" ::: ProcessID: "' + str(proc_pid_step) + '" ::: ProcessStatus: "' +
-                                        proc_status_step + '" ::: KILLED')
+                            if proc_name_step != proc_name_user:
+                                log_stream.warning(
+                                    ' ===> ProcessName set in memory "' + proc_name_step +
+                                    '" is not equal to ProcessName set by user "' + proc_name_user + '"')
 
-                    except psutil.NoSuchProcess:
+                            log_stream.info(' -----> Kill ::: ProcessName "' + proc_name_user +
+                                            '" ::: ProcessID: "' + str(proc_pid_step) + '" ::: ProcessStatus: "' +
+                                            proc_status_step + '" ::: KILLED')
 
-                        log_stream.info(
-                            ' -----> Kill ::: ProcessName "' + proc_name_user + '" ::: ProcessID: "' + str(proc_pid_step) +
-                            '" ::: ProcessStatus: "terminated" ::: NOSUCHPROCESS')
+                        except psutil.NoSuchProcess:
 
-                log_stream.info(' ----> Kill analysis report ... DONE')
+                            log_stream.info(
+                                ' -----> Kill ::: ProcessName "' + proc_name_user + '" ::: ProcessID: "' +
+                                str(proc_pid_step) + '" ::: ProcessStatus: "terminated" ::: NOSUCHPROCESS')
 
-            else:
-                log_stream.info(' ----> Kill analysis report ... SKIPPED. PROCESS LIST IS NOT DEFINED')
+                else:
+                    log_stream.info(' -----> Kill ::: ProcessName "' + proc_name_user +
+                                    '" ::: SKIPPED. PROCESS LIST IS NOT DEFINED')
+
+            log_stream.info(' ----> Kill analysis report ... DONE')
         else:
             log_stream.info(' ----> Kill analysis report ... NOT ACTIVATED')
     # -------------------------------------------------------------------------------------
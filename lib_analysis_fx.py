@@ -11,8 +11,11 @@ Version:       '1.0.0'
 # Libraries
 import logging
 import os
+import time
 import datetime
 import signal
+import select
+import threading
 import psutil
 import numpy as np
 
@@ -20,13 +23,72 @@ from operator import itemgetter
 from copy import deepcopy
 
 from lib_info_args import logger_name
-from lib_analysis_utils import convert_bytes2human_obj, convert_obj2dict, get_linux_memory_usage
+from lib_utils_time import convert_time_delta_to_seconds, fill_time_delta_parts
+from lib_analysis_utils import convert_obj2dict, get_linux_memory_usage, read_linux_vmstat
+from lib_analysis_utils import read_linux_cgroup_path, define_linux_cgroup_root, read_linux_cgroup_value, \
+    read_linux_cgroup_keys, read_linux_cgroup_io, read_linux_pressure, read_linux_statm, read_linux_stat_cpu, \
+    read_linux_status_memory
 
 # Logging
 log_stream = logging.getLogger(logger_name)
+
+# Units information (fields stored in bytes for each tool)
+fields_bytes_memory = ['total', 'available', 'used', 'free', 'active', 'inactive', 'buffers', 'cached', 'shared',
+                       'slab', 'dirty', 'writeback', 'commit_limit', 'committed_as', 'sin', 'sout']
+fields_bytes_process = ['rss', 'vms', 'shared', 'text', 'lib', 'data', 'dirty', 'uss', 'pss', 'swap']
+fields_bytes_disk = ['total', 'used', 'free']
+# Disk usage workers (path --> thread of the last call; a blocked thread is not restarted)
+disk_usage_workers = {}
+# Disk usage timeout of the paths and margin of the collector deadline (seconds)
+disk_timeout_default, disk_timeout_margin = 5.0, 0.5
+# Units information (rate fields for each tool)
+fields_rate_process_io = {'read_bytes_rate': 'B/s', 'write_bytes_rate': 'B/s',
+                          'read_chars_rate': 'B/s', 'write_chars_rate': 'B/s',
+                          'read_count_rate': 'ops/s', 'write_count_rate': 'ops/s',
+                          'ctx_voluntary_rate': 'switches/s', 'ctx_involuntary_rate': 'switches/s'}
+fields_rate_network = {'bytes_sent_rate': 'B/s', 'bytes_recv_rate': 'B/s',
+                       'packets_sent_rate': 'packets/s', 'packets_recv_rate': 'packets/s',
+                       'errin_rate': 'packets/s', 'errout_rate': 'packets/s',
+                       'dropin_rate': 'packets/s', 'dropout_rate': 'packets/s'}
+fields_bytes_cgroup = ['memory_current', 'memory_max', 'memory_anon', 'memory_file', 'memory_kernel_stack',
+                       'memory_shmem', 'memory_file_dirty', 'memory_file_writeback']
+fields_rate_cgroup = {'io_read_bytes_rate': 'B/s', 'io_write_bytes_rate': 'B/s',
+                      'io_read_iops': 'ops/s', 'io_write_iops': 'ops/s',
+                      'cpu_nr_throttled_rate': 'periods/s', 'memory_pgmajfault_rate': 'faults/s'}
+fields_units_pressure = {'avg10': '%', 'avg60': '%', 'total_delta': 'us'}
+fields_rate_disk_io = {'read_bytes_rate': 'B/s', 'write_bytes_rate': 'B/s',
+                       'read_iops': 'ops/s', 'write_iops': 'ops/s'}
 #######################################################################################
 
 
+# -------------------------------------------------------------------------------------
+# method to define units info (units metadata of the collections fields)
+def define_units_info(info_collections, fields_bytes=None, fields_units=None, separator_name='_',
+                      units_bytes='B', units_percent='%', tag_percent='percent'):
+
+    if fields_bytes is None:
+        fields_bytes = []
+    if fields_units is None:
+        fields_units = {}
+
+    info_units = {}
+    if info_collections is not None:
+        for info_key in info_collections.keys():
+            if tag_percent in info_key:
+                info_units[info_key] = units_percent
+            else:
+                for field_name in fields_bytes:
+                    if info_key.endswith(separator_name + field_name):
+                        info_units[info_key] = units_bytes
+                        break
+                for field_name, field_units in fields_units.items():
+                    if info_key.endswith(separator_name + field_name):
+                        info_units[info_key] = field_units
+                        break
+    return info_units
+# -------------------------------------------------------------------------------------
+
+
 # -------------------------------------------------------------------------------------
 # method to filter process info
 def filter_process_info(process_list, process_filter='first'):
@@ -81,6 +143,30 @@ def filter_process_info(process_list, process_filter='first'):
 # -------------------------------------------------------------------------------------
 
 
+# -------------------------------------------------------------------------------------
+# method to define process slots (processes selected by the filter; process_n or default slots for "all" filter)
+def define_process_slots(process_filter='first', process_n=None, process_slots_default=8):
+    if process_n is not None:
+        return max(int(process_n), 1)
+    if isinstance(process_filter, list):
+        return max(process_filter.__len__(), 1)
+    if process_filter in ['first', 'last']:
+        return 1
+    return process_slots_default
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# method to select process slots (processes over the declared slots are not sampled)
+def select_process_slots(obj_process_list, process_slots, tool_name='tool_info_process'):
+    if (obj_process_list is not None) and (obj_process_list.__len__() > process_slots):
+        log_stream.warning(' ===> Tool "' + tool_name + '" samples ' + str(process_slots) + ' of ' +
+                           str(obj_process_list.__len__()) + ' processes. Set "process_n" to sample more processes')
+        obj_process_list = obj_process_list[:process_slots]
+    return obj_process_list
+# -------------------------------------------------------------------------------------
+
+
 # -------------------------------------------------------------------------------------
 # method to sort process info
 def sort_process_info(process_list, values_list, values_order_type=None):
@@ -107,68 +193,104 @@ def sort_process_info(process_list, values_list, values_order_type=None):
 
 
 # -------------------------------------------------------------------------------------
-# method to get process info
-def get_process_info(process_name, process_sort=None, process_filter=None, verbose=False, **kwargs):
-
-    # Info get process info start
-    log_stream.info(' ------> Get process info "' + process_name + '" ... ')
+# method to scan process info (full scan over all running processes, shared by all the process names)
+def scan_process_collections(process_names, verbose=False):
 
     # Iterate over all running process
-    process_obj_list, process_vms_list, process_cmd_list = None, None, None
-    for process_obj_step in psutil.process_iter(["name", "exe", "cmdline", "username"]):
+    process_obj_collections = {process_name: None for process_name in process_names}
+    for process_obj_step in psutil.process_iter(["name", "cmdline"]):
 
+        # use the attributes pre-fetched by the iterator (avoid to read cmdline twice)
         process_info_step = process_obj_step.info
-        process_name_step = process_obj_step.name()
-        process_cmdline_step = " ".join(process_obj_step.cmdline())
+        process_name_step = process_info_step['name']
+        process_cmdline_list = process_info_step['cmdline']
+        if process_name_step is None:
+            process_name_step = ''
+        if process_cmdline_list is None:
+            process_cmdline_list = []
+        process_cmdline_step = " ".join(process_cmdline_list)
 
         if verbose:
             log_stream.info(' -------> Found process info "' + process_name_step + '" ... ')
 
-        if (process_name == process_info_step['name']) or (process_name in process_cmdline_step):
-                #process_info_step['exe'] and os.path.basename(process_info_step['exe']) == process_name or \
-                #process_info_step['cmdline'] and process_info_step['cmdline'][0] == process_name:
-
-            process_name_step = process_obj_step.name()
-            process_id_step = process_obj_step.pid
-            process_vms_step = process_obj_step.memory_info().vms / (1024 * 1024)
-            process_cmdline_step = " ".join(process_obj_step.cmdline())
-            # process_interpreter_step, process_script_step = process_obj_step.cmdline()[0], process_obj_step.cmdline()[1]
-
+        process_selected_step = False
+        for process_name in process_names:
             if (process_name == process_name_step) or (process_name in process_cmdline_step):
-                if process_obj_list is None:
-                    process_obj_list = []
-                process_obj_list.append(process_obj_step)
-
-                if process_vms_list is None:
-                    process_vms_list = []
-                process_vms_list.append(process_vms_step)
 
-                if process_cmd_list is None:
-                    process_cmd_list = []
-                process_cmd_list.append(process_cmdline_step)
+                if process_obj_collections[process_name] is None:
+                    process_obj_collections[process_name] = []
+                process_obj_collections[process_name].append(process_obj_step)
 
-                if process_name in process_obj_step.cmdline()[0]:
-                    process_tag_step = process_obj_step.cmdline()[0]
+                if process_cmdline_list.__len__() > 0 and process_name in process_cmdline_list[0]:
+                    process_tag_step = process_cmdline_list[0]
                     log_stream.info(' -------> Found ::: ProcessName in interpreter part of command-line')
-                elif process_name in process_obj_step.cmdline()[1]:
-                    process_tag_step = process_obj_step.cmdline()[1]
+                elif process_cmdline_list.__len__() > 1 and process_name in process_cmdline_list[1]:
+                    process_tag_step = process_cmdline_list[1]
                     log_stream.info(' -------> Found ::: ProcessName in script part of command-line')
                 else:
                     process_tag_step = process_name_step
                     log_stream.info(' -------> Found ::: ProcessName in the system executables')
 
                 log_stream.info(' -------> Found ::: ProcessName "' + process_tag_step +
-                                '" ::: ProcessID "' + str(process_id_step) + '"')
-                if verbose:
-                    log_stream.info(' -------> Found process info "' + process_name_step + '" ... SELECTED')
-        else:
-            if verbose:
+                                '" ::: ProcessID "' + str(process_obj_step.pid) + '"')
+                process_selected_step = True
+
+        if verbose:
+            if process_selected_step:
+                log_stream.info(' -------> Found process info "' + process_name_step + '" ... SELECTED')
+            else:
                 log_stream.info(' -------> Found process info "' + process_name_step + '" ... NOT SELECTED')
 
+    return process_obj_collections
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# method to scan process info (full scan over all running processes)
+def scan_process_info(process_name, verbose=False):
+    return scan_process_collections([process_name], verbose=verbose)[process_name]
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# method to select process info (sort and filter a list of process handles)
+def select_process_info(process_obj_list, process_sort=None, process_filter=None):
+
+    if process_obj_list is None:
+        return None
+
+    # get the virtual memory of the alive processes (used to sort them)
+    process_obj_alive, process_vms_list = [], []
+    for process_obj_step in process_obj_list:
+        try:
+            process_vms_step = process_obj_step.memory_info().vms / (1024 * 1024)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+        process_obj_alive.append(process_obj_step)
+        process_vms_list.append(process_vms_step)
+
+    if not process_obj_alive:
+        return None
+
     # sort by memory highest
-    process_obj_list = sort_process_info(process_obj_list, process_vms_list, values_order_type=process_sort)
+    process_obj_alive = sort_process_info(process_obj_alive, process_vms_list, values_order_type=process_sort)
     # process filter
-    process_obj_list = filter_process_info(process_obj_list, process_filter=process_filter)
+    process_obj_alive = filter_process_info(process_obj_alive, process_filter=process_filter)
+
+    return process_obj_alive
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# method to get process info
+def get_process_info(process_name, process_sort=None, process_filter=None, verbose=False, **kwargs):
+
+    # Info get process info start
+    log_stream.info(' ------> Get process info "' + process_name + '" ... ')
+
+    # scan, sort and filter processes
+    process_obj_list = scan_process_info(process_name, verbose=verbose)
+    process_obj_list = select_process_info(process_obj_list, process_sort=process_sort, process_filter=process_filter)
 
     # Info get process info end
     if process_obj_list is None:
@@ -182,17 +304,405 @@ def get_process_info(process_name, process_sort=None, process_filter=None, verbo
 # -------------------------------------------------------------------------------------
 
 
+# -------------------------------------------------------------------------------------
+# Class to track process handle(s) between analysis steps
+class TrackerProcess:
+
+    # -------------------------------------------------------------------------------------
+    # Method to initialize class
+    def __init__(self, process_name, process_obj_init=None, process_scan_frequency='1min', process_scan_active=True):
+
+        # process name(s) (one or more targets resolved by the same scan)
+        if isinstance(process_name, str):
+            process_name = [process_name]
+        self.process_names = process_name
+        self.process_obj_collections = {process_name_step: None for process_name_step in self.process_names}
+        if process_obj_init is not None:
+            self.process_obj_collections.update(process_obj_init)
+
+        self.process_scan_seconds = convert_time_delta_to_seconds(fill_time_delta_parts(process_scan_frequency))
+        self.process_scan_active = process_scan_active
+        self.process_scan_last = time.time() if process_obj_init is not None else None
+
+        self.process_scan_n, self.process_scan_skipped = 0, 0
+        self.process_scan_time_last, self.process_scan_time_total = None, 0.0
+
+        # process tree cache (pid --> handle of the descendant processes)
+        self.process_tree_cache = {}
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to check if a scan is needed (no handles, expired cadence or dead handles)
+    def check_process_scan(self):
+
+        if not self.process_scan_active:
+            return False, None
+        for process_name, process_obj_list in self.process_obj_collections.items():
+            if process_obj_list is None:
+                return True, 'process list "' + process_name + '" not defined'
+        if (self.process_scan_seconds is not None) and (self.process_scan_last is not None):
+            if (time.time() - self.process_scan_last) >= self.process_scan_seconds:
+                return True, 'scan frequency expired'
+        for process_obj_list in self.process_obj_collections.values():
+            for process_obj_step in process_obj_list:
+                if not process_obj_step.is_running():
+                    return True, 'process id "' + str(process_obj_step.pid) + '" terminated'
+        return False, None
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to update process collections (tracked handles or full scan shared by all the targets)
+    def update_process_collections(self, verbose=False):
+
+        process_scan_flag, process_scan_reason = self.check_process_scan()
+        if process_scan_flag:
+            log_stream.info(' -------> Scan process info ... ACTIVATED [' + process_scan_reason + ']')
+
+            process_scan_start = time.time()
+            self.process_obj_collections = scan_process_collections(self.process_names, verbose=verbose)
+            self.process_scan_time_last = time.time() - process_scan_start
+            self.process_scan_time_total += self.process_scan_time_last
+            self.process_scan_last = time.time()
+            self.process_scan_n += 1
+
+            log_stream.info(' -------> Scan process info ... DONE [time: ' +
+                            '{:.4f}'.format(self.process_scan_time_last) + ' seconds]')
+        else:
+            self.process_scan_skipped += 1
+            process_obj_n = sum([process_obj_list.__len__()
+                                 for process_obj_list in self.process_obj_collections.values()])
+            log_stream.info(' -------> Scan process info ... SKIPPED [tracked handles: ' + str(process_obj_n) + ']')
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to set process collections (handles known without a scan, e.g. launched processes)
+    def set_process_collections(self, process_obj_collections):
+        self.process_obj_collections.update(process_obj_collections)
+        self.process_scan_last = time.time()
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to get process list (selected handles of a target)
+    def get_process_list(self, process_name=None, process_sort=None, process_filter=None,
+                         process_update=True, verbose=False, **kwargs):
+
+        if process_name is None:
+            process_name = self.process_names[0]
+
+        # Info get process info start
+        log_stream.info(' ------> Get process info "' + process_name + '" ... ')
+
+        if process_update:
+            self.update_process_collections(verbose=verbose)
+
+        process_obj_list = select_process_info(
+            self.process_obj_collections[process_name], process_sort=process_sort, process_filter=process_filter)
+
+        # Info get process info end
+        if process_obj_list is None:
+            log_stream.warning(' ===> Process "' + process_name + '" not found')
+            log_stream.info(' ------> Get process info "' + process_name + '" ... SKIPPED')
+        else:
+            log_stream.info(' ------> Get process info "' + process_name + '" ... DONE')
+
+        return process_obj_list
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to get process tree (root and descendant processes, handles cached between steps)
+    def get_process_tree(self, process_obj_root):
+
+        # get the cached handles of the tree (own handles to keep the cpu percent state of each process)
+        process_tree_cache_root = self.process_tree_cache.get(process_obj_root.pid, {})
+
+        process_tree_handles = {}
+        process_pid_queue = [process_obj_root.pid]
+        while process_pid_queue:
+            process_pid_step = process_pid_queue.pop(0)
+
+            if process_pid_step in process_tree_handles:
+                continue
+
+            # reuse the cached handle if the process is the same (pid not reused)
+            process_obj_step = process_tree_cache_root.get(process_pid_step, None)
+            try:
+                if (process_obj_step is None) or (not process_obj_step.is_running()):
+                    process_obj_step = psutil.Process(process_pid_step)
+            except psutil.NoSuchProcess:
+                continue
+
+            process_tree_handles[process_pid_step] = process_obj_step
+            process_pid_queue.extend(get_process_children(process_pid_step))
+
+        # update the cache (terminated processes are removed)
+        self.process_tree_cache[process_obj_root.pid] = process_tree_handles
+
+        return list(process_tree_handles.values())
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to get tracker info (scan statistics)
+    def get_tracker_info(self, prefix_name='process_scan', separator_name='_'):
+
+        process_scan_time_mean = None
+        if self.process_scan_n > 0:
+            process_scan_time_mean = self.process_scan_time_total / self.process_scan_n
+
+        dict_tracker = {'n': self.process_scan_n, 'skipped': self.process_scan_skipped,
+                        'time_last': self.process_scan_time_last, 'time_mean': process_scan_time_mean}
+
+        info_tracker_collections = {}
+        for obj_key, obj_value in dict_tracker.items():
+            obj_key = separator_name.join([prefix_name, obj_key])
+            info_tracker_collections[obj_key] = obj_value
+
+        return info_tracker_collections
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to wait process collections (scan at the wait frequency until a process of the targets is found)
+    def wait_process_collections(self, seconds_frequency, seconds_period=None, wait_stop=None):
+
+        process_pid_self = os.getpid()
+
+        time_start = time.monotonic()
+        while True:
+
+            # scan processes (the analysis process is not a target)
+            process_obj_collections = scan_process_collections(self.process_names)
+            for process_obj_list in process_obj_collections.values():
+                if process_obj_list is not None:
+                    if any([process_obj_step.pid != process_pid_self for process_obj_step in process_obj_list]):
+                        self.process_obj_collections = process_obj_collections
+                        self.process_scan_last = time.time()
+                        return True
+
+            # check period and stop (no process found)
+            if (seconds_period is not None) and (time.monotonic() - time_start >= seconds_period):
+                return False
+            if (wait_stop is not None) and wait_stop():
+                return False
+
+            time.sleep(seconds_frequency)
+
+    # -------------------------------------------------------------------------------------
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Class to watch process exit (pidfd of the processes polled while waiting the next step)
+class WatcherProcess:
+
+    # -------------------------------------------------------------------------------------
+    # Method to initialize class
+    def __init__(self):
+
+        self.process_pid_self = os.getpid()
+        self.process_obj_watched, self.process_fd_watched = {}, {}
+        self.process_exited = False
+
+        # pidfd available from python 3.9 and linux 5.3 (otherwise the handles are checked after the wait)
+        self.process_poll = None
+        if hasattr(os, 'pidfd_open'):
+            self.process_poll = select.poll()
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to update process list (new processes added to the watched processes)
+    def update_process_list(self, process_obj_list):
+
+        if process_obj_list is None:
+            return
+
+        for process_obj_step in process_obj_list:
+            process_pid_step = process_obj_step.pid
+            if (process_pid_step == self.process_pid_self) or (process_pid_step in self.process_obj_watched):
+                continue
+
+            if self.process_poll is not None:
+                try:
+                    process_fd_step = os.pidfd_open(process_pid_step)
+                except ProcessLookupError:
+                    continue
+                except OSError as exc:
+                    log_stream.warning(' ===> Process id "' + str(process_pid_step) +
+                                       '" is not watched by pidfd [' + str(exc) + ']. Check handles after the wait')
+                    self.process_poll = None
+                else:
+                    self.process_poll.register(process_fd_step, select.POLLIN)
+                    self.process_fd_watched[process_fd_step] = process_pid_step
+
+            self.process_obj_watched[process_pid_step] = process_obj_step
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to remove process (exited process no longer watched)
+    def remove_process(self, process_pid):
+        for process_fd_step, process_pid_step in list(self.process_fd_watched.items()):
+            if process_pid_step == process_pid:
+                if self.process_poll is not None:
+                    self.process_poll.unregister(process_fd_step)
+                os.close(process_fd_step)
+                self.process_fd_watched.pop(process_fd_step)
+        self.process_obj_watched.pop(process_pid, None)
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to wait exit (wait up to seconds; true if all the watched processes exited)
+    def wait_exit(self, seconds_wait):
+
+        if not self.process_obj_watched:
+            time.sleep(seconds_wait)
+            return False
+
+        time_end = time.monotonic() + seconds_wait
+        process_poll_all = self.process_fd_watched.__len__() == self.process_obj_watched.__len__()
+        if (self.process_poll is not None) and process_poll_all:
+
+            # poll the pidfd (readable when the process exits)
+            while self.process_obj_watched:
+                seconds_poll = max(time_end - time.monotonic(), 0.0)
+                process_events = self.process_poll.poll(seconds_poll * 1000)
+                for process_fd_step, process_event_step in process_events:
+                    self.remove_process(self.process_fd_watched[process_fd_step])
+                if (not process_events) and (seconds_poll <= 0.0):
+                    break
+
+        else:
+
+            # check the handles after the wait (process exit detected at the next step; zombie processes exited)
+            time.sleep(seconds_wait)
+            for process_pid_step, process_obj_step in list(self.process_obj_watched.items()):
+                try:
+                    process_running_step = process_obj_step.is_running() and (
+                        process_obj_step.status() != psutil.STATUS_ZOMBIE)
+                except psutil.NoSuchProcess:
+                    process_running_step = False
+                if not process_running_step:
+                    self.remove_process(process_pid_step)
+
+        if not self.process_obj_watched:
+            self.process_exited = True
+        return self.process_exited
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to close watcher (pidfd released)
+    def close(self):
+        for process_pid_step in list(self.process_obj_watched.keys()):
+            self.remove_process(process_pid_step)
+
+    # -------------------------------------------------------------------------------------
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# method to get process children (direct children from proc files; psutil as fallback)
+def get_process_children(process_pid, proc_root='/proc'):
+
+    process_task_folder = os.path.join(proc_root, str(process_pid), 'task')
+
+    process_children_pids = []
+    try:
+        for process_task_id in os.listdir(process_task_folder):
+            process_children_file = os.path.join(process_task_folder, process_task_id, 'children')
+            with open(process_children_file, 'r') as process_children_handle:
+                process_children_pids.extend([int(pid) for pid in process_children_handle.read().split()])
+    except FileNotFoundError:
+        try:
+            process_children_pids = [process_obj.pid for process_obj in psutil.Process(process_pid).children()]
+        except psutil.NoSuchProcess:
+            process_children_pids = []
+    except (ProcessLookupError, PermissionError):
+        process_children_pids = []
+
+    return process_children_pids
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# method to organize process tree info (aggregated fields of root and descendant processes)
+def organize_process_tree_info(obj_process_tree_list, prefix_name_tree=None, separator_name='_',
+                               percent_format="{:.4f}", process_memory_type='full', **kwargs):
+
+    # Info organize process tree info start
+    log_stream.info(' ------> Organize process tree info ... ')
+
+    if prefix_name_tree is None:
+        prefix_name_tree = 'process_tree_{proc_n}'
+    if separator_name is None:
+        separator_name = '_'
+
+    info_tree_collections = {}
+    if obj_process_tree_list is not None:
+        for obj_process_id, obj_process_tree in enumerate(obj_process_tree_list):
+
+            dict_tree = {'n': 0, 'rss': 0, 'uss': 0, 'pss': 0, 'swap': 0, 'cpu_percent': 0.0, 'num_threads': 0}
+            for obj_process_step in obj_process_tree:
+                try:
+                    with obj_process_step.oneshot():
+                        if process_memory_type == 'full':
+                            obj_memory = obj_process_step.memory_full_info()
+                        else:
+                            obj_memory = obj_process_step.memory_info()
+                        obj_cpu_percent = obj_process_step.cpu_percent(interval=None)
+                        obj_num_threads = obj_process_step.num_threads()
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+
+                dict_memory = convert_obj2dict(obj_memory)
+                for memory_key in ['rss', 'uss', 'pss', 'swap']:
+                    dict_tree[memory_key] += dict_memory.get(memory_key, 0)
+                dict_tree['cpu_percent'] += obj_cpu_percent
+                dict_tree['num_threads'] += obj_num_threads
+                dict_tree['n'] += 1
+
+            dict_tree['cpu_percent'] = float(percent_format.format(dict_tree['cpu_percent']))
+
+            info_key_format = {'proc_n': str(obj_process_id)}
+            for info_key_sub, info_value_sub in dict_tree.items():
+                info_key_def = separator_name.join([prefix_name_tree, info_key_sub]).format(**info_key_format)
+                info_tree_collections[info_key_def] = info_value_sub
+
+        # Info organize process tree info end
+        log_stream.info(' ------> Organize process tree info ... DONE')
+
+    else:
+
+        # Info organize process tree info end
+        log_stream.info(' ------> Organize process tree info ... SKIPPED')
+
+    return info_tree_collections
+# -------------------------------------------------------------------------------------
+
+
 # -------------------------------------------------------------------------------------
 # method to get process
-def add_process_info(obj_process, obj_memory,
+def add_process_info(obj_process, obj_memory, memory_total=None,
                      prefix_percent='percent', separator_percent='_', format_percent="{:.4f}"):
 
-    # cpu info parts
+    # get total memory (if not defined by the caller)
+    if memory_total is None:
+        memory_total = psutil.virtual_memory().total
+
+    # cpu info parts (to be called in the oneshot context of the process)
     cpu_affinity = obj_process.cpu_affinity()
     cpu_n = obj_process.cpu_num()
     cpu_info_collections = {'cpu_affinity': cpu_affinity, 'cpu_n': cpu_n}
 
-    # memory info parts
+    # memory info parts (percent computed from the memory obj and the total memory)
     dict_memory = convert_obj2dict(obj_memory)
     memory_info_list_default = ['rss', 'vms', 'shared', 'text', 'lib', 'data', 'dirty', 'uss', 'pss', 'swap']
     memory_info_list_process = list(dict_memory.keys())
@@ -201,7 +711,7 @@ def add_process_info(obj_process, obj_memory,
     for memory_info_name in memory_info_list_default:
 
         if memory_info_name in memory_info_list_process:
-            memory_info_percent = obj_process.memory_percent(memtype=memory_info_name)
+            memory_info_percent = (dict_memory[memory_info_name] / memory_total) * 100
             memory_info_percent = float(format_percent.format(memory_info_percent))
             memory_info_tag = separator_percent.join([prefix_percent, memory_info_name])
             memory_info_collections[memory_info_tag] = memory_info_percent
@@ -215,6 +725,46 @@ def add_process_info(obj_process, obj_memory,
 # -------------------------------------------------------------------------------------
 
 
+# -------------------------------------------------------------------------------------
+# method to get process fields (all the attributes read in a single oneshot context)
+def get_process_fields(obj_process, process_attributes, process_memory_type='full', memory_total=None):
+
+    if memory_total is None:
+        memory_total = psutil.virtual_memory().total
+
+    # attributes computed from the memory obj (to avoid extra reads of the process files)
+    process_attributes_select = [attr_name for attr_name in process_attributes
+                                 if attr_name not in ['memory_info', 'memory_percent']]
+
+    with obj_process.oneshot():
+
+        info_process_fields_basic = obj_process.as_dict(attrs=process_attributes_select)
+
+        # memory basic fields
+        if process_memory_type == 'partial':
+            # info fields partial memory information
+            info_process_fields_memory = obj_process.memory_info()
+        elif process_memory_type == 'full':
+            # info fields full memory information (smaps read only once)
+            info_process_fields_memory = obj_process.memory_full_info()
+        else:
+            log_stream.error(' ===> The information "process_memory_type" defined by "' + process_memory_type +
+                             '" is not supported')
+            raise NotImplemented('Case not implemented yet')
+
+        if 'memory_percent' in process_attributes:
+            info_process_fields_basic['memory_percent'] = (info_process_fields_memory.rss / memory_total) * 100
+        info_process_fields_basic['memory_info'] = info_process_fields_memory
+
+        # memory extra fields
+        info_process_fields_extras = add_process_info(
+            obj_process, info_process_fields_memory, memory_total=memory_total)
+
+    return info_process_fields_basic, info_process_fields_extras
+
+# -------------------------------------------------------------------------------------
+
+
 # -------------------------------------------------------------------------------------
 # method to organize process info
 def organize_process_info(obj_process_list, prefix_name=None, separator_name='_', percent_format="{:.4f}",
@@ -247,27 +797,32 @@ def organize_process_info(obj_process_list, prefix_name=None, separator_name='_'
 
     info_process_collections = {}
     if obj_process_list is not None:
+        memory_total = psutil.virtual_memory().total
         for obj_process_id, obj_process_step in enumerate(obj_process_list):
 
-            # memory basic fields
-            if process_memory_type == 'partial':
-                # info fields partial memory information
-                info_process_fields_basic = obj_process_step.as_dict(attrs=process_attributes)
-            elif process_memory_type == 'full':
-                # info fields full memory information
-                info_process_fields_basic = obj_process_step.as_dict(attrs=process_attributes)
-                info_process_fields_memory = obj_process_step.memory_full_info()
-
-                if 'memory_info' in list(info_process_fields_basic.keys()):
-                    info_process_fields_basic.pop('memory_info')
-                info_process_fields_basic['memory_info'] = info_process_fields_memory
-            else:
-                log_stream.error(' ===> The information "process_memory_type" defined by "' + process_memory_type +
-                                 '" is not supported')
-                raise NotImplemented('Case not implemented yet')
-
-            # memory extra fields
-            info_process_fields_extras = add_process_info(obj_process_step, info_process_fields_basic['memory_info'])
+            # get process fields (basic and extra fields)
+            try:
+                info_process_fields_basic, info_process_fields_extras = get_process_fields(
+                    obj_process_step, process_attributes,
+                    process_memory_type=process_memory_type, memory_total=memory_total)
+            except (psutil.AccessDenied, psutil.ZombieProcess) as exc:
+                # fields not accessible (fall back to the partial memory fields or to NaN fields)
+                log_stream.warning(' ===> ProcessID "' + str(obj_process_step.pid) + '" fields are not accessible [' +
+                                   type(exc).__name__ + ']. Use partial memory fields')
+                try:
+                    info_process_fields_basic, info_process_fields_extras = get_process_fields(
+                        obj_process_step, process_attributes,
+                        process_memory_type='partial', memory_total=memory_total)
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    log_stream.warning(' ===> ProcessID "' + str(obj_process_step.pid) +
+                                       '" memory fields are not accessible. NaN fields')
+                    info_process_fields_basic = {
+                        attr_name: np.nan for attr_name in process_attributes if attr_name != 'memory_info'}
+                    info_process_fields_basic['pid'] = obj_process_step.pid
+                    info_process_fields_extras = {}
+            except psutil.NoSuchProcess:
+                log_stream.warning(' ===> ProcessID "' + str(obj_process_step.pid) + '" is terminated. Skip fields')
+                continue
 
             # merge memory fields
             info_process_fields = {**info_process_fields_basic, **info_process_fields_extras}
@@ -287,20 +842,20 @@ def organize_process_info(obj_process_list, prefix_name=None, separator_name='_'
                     info_fields_collections[info_key_raw] = info_value_str
                 elif isinstance(info_value_raw, tuple):
                     info_fields_tmp = convert_obj2dict(info_value_raw)
-                    if info_key_raw == 'memory_info':
-                        info_fields_collections = convert_bytes2human_obj(info_fields_tmp)
-                    else:
-                        info_fields_collections = deepcopy(info_fields_tmp)
+                    info_fields_collections = deepcopy(info_fields_tmp)
                 else:
                     log_stream.error(' ===> Field "' + info_key_raw + '" has not supported type')
                     raise NotImplemented('Case not implemented yet')
 
                 for info_key_sub, info_value_sub in info_fields_collections.items():
 
-                    if info_key_sub == 'create_time':
+                    # fields not available (defined by NoneType or NaN) are passed as they are
+                    info_value_valid = isinstance(info_value_sub, (int, float)) and not np.isnan(info_value_sub)
+
+                    if (info_key_sub == 'create_time') and info_value_valid:
                         info_value_sub = datetime.datetime.fromtimestamp(info_value_sub).strftime("%Y-%m-%d %H:%M:%S")
 
-                    if 'percent' in info_key_sub:
+                    if ('percent' in info_key_sub) and info_value_valid:
                         info_value_sub = float(percent_format.format(info_value_sub))
 
                     info_key_tmp = separator_name.join([prefix_name, info_key_sub])
@@ -322,11 +877,338 @@ def organize_process_info(obj_process_list, prefix_name=None, separator_name='_'
 
 
 # -------------------------------------------------------------------------------------
-# method to get disk information
-def get_disk_info(disk_path=None, prefix_name='disk_usage', separator_name='_', **kwargs):
+# method to compute counters rate (cumulative counters --> rate; NaN for the first sample or for counters reset)
+def compute_counters_rate(counters_now, counters_prev, time_delta, rate_format='{:.4f}', rate_suffix='_rate'):
+    counters_rate = {}
+    for counter_key, counter_value in counters_now.items():
+        counter_rate = np.nan
+        if (counters_prev is not None) and (time_delta is not None) and (time_delta > 0):
+            counter_value_prev = counters_prev.get(counter_key, None)
+            if (counter_value_prev is not None) and (counter_value >= counter_value_prev):
+                counter_rate = float(rate_format.format((counter_value - counter_value_prev) / time_delta))
+        counters_rate[counter_key + rate_suffix] = counter_rate
+    return counters_rate
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+class TrackerProcessIO:
 
-    # Info get disk info start
-    log_stream.info(' ------> Get disk info ... ')
+    # -------------------------------------------------------------------------------------
+    # Method to initialize class
+    def __init__(self):
+        # previous samples of the cumulative counters ((pid, create_time) --> time and counters)
+        self.process_io_cache = {}
+
+    # cumulative counters and gauges of a process (NaN if the process is not available)
+    process_io_keys = ['read_count', 'write_count', 'read_bytes', 'write_bytes', 'read_chars', 'write_chars']
+    process_ctx_keys = ['ctx_voluntary', 'ctx_involuntary']
+    process_gauges_keys = ['num_threads', 'num_fds']
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to get the cumulative counters and the gauges of a process
+    @staticmethod
+    def get_process_counters(obj_process):
+
+        process_counters, process_gauges = {}, {}
+        try:
+            with obj_process.oneshot():
+                try:
+                    obj_io = obj_process.io_counters()
+                    for io_key in TrackerProcessIO.process_io_keys:
+                        if hasattr(obj_io, io_key):
+                            process_counters[io_key] = getattr(obj_io, io_key)
+                except (psutil.AccessDenied, AttributeError):
+                    pass
+                obj_ctx = obj_process.num_ctx_switches()
+                process_counters['ctx_voluntary'] = obj_ctx.voluntary
+                process_counters['ctx_involuntary'] = obj_ctx.involuntary
+
+                process_gauges['num_threads'] = obj_process.num_threads()
+                try:
+                    process_gauges['num_fds'] = obj_process.num_fds()
+                except (psutil.AccessDenied, AttributeError):
+                    process_gauges['num_fds'] = np.nan
+
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess) as exc:
+            # counters not available (terminated, zombie or not accessible process)
+            log_stream.warning(' ===> ProcessID "' + str(obj_process.pid) + '" counters are not available [' +
+                               type(exc).__name__ + ']. NaN fields')
+            return None, None
+
+        return process_counters, process_gauges
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to get process io info (rates computed from the previous sample of the same process)
+    def get_process_io_info(self, obj_process_list, prefix_name='process_io_{proc_n}', separator_name='_',
+                            rate_format='{:.4f}', **kwargs):
+
+        # Info get process io info start
+        log_stream.info(' ------> Get process io info ... ')
+
+        if prefix_name is None:
+            prefix_name = 'process_io_{proc_n}'
+        if separator_name is None:
+            separator_name = '_'
+
+        info_process_collections, process_io_cache = {}, {}
+        if obj_process_list is not None:
+            for obj_process_id, obj_process_step in enumerate(obj_process_list):
+
+                # get process counters (the key is defined by pid and create time to handle the pid reuse)
+                process_key, process_counters, process_gauges = None, None, None
+                try:
+                    process_key = (obj_process_step.pid, obj_process_step.create_time())
+                    process_time = time.monotonic()
+                    process_counters, process_gauges = self.get_process_counters(obj_process_step)
+                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess) as exc:
+                    log_stream.warning(' ===> ProcessID "' + str(obj_process_step.pid) +
+                                       '" counters are not available [' + type(exc).__name__ + ']. NaN fields')
+
+                # compute rates (NaN for the first sample or for counters reset)
+                if process_counters is not None:
+                    process_sample_prev = self.process_io_cache.get(process_key, None)
+                    if process_sample_prev is not None:
+                        process_rates = compute_counters_rate(
+                            process_counters, process_sample_prev['counters'],
+                            process_time - process_sample_prev['time'], rate_format=rate_format)
+                    else:
+                        process_rates = compute_counters_rate(process_counters, None, None)
+
+                    process_io_cache[process_key] = {'time': process_time, 'counters': process_counters}
+
+                else:
+                    # process not available (NaN fields and previous sample removed from the cache)
+                    self.process_io_cache.pop(process_key, None)
+                    process_rates = compute_counters_rate(
+                        dict.fromkeys(self.process_io_keys + self.process_ctx_keys, np.nan), None, None)
+                    process_gauges = dict.fromkeys(self.process_gauges_keys, np.nan)
+
+                info_process_fields = {'pid': obj_process_step.pid, **process_rates, **process_gauges}
+                for info_key_sub, info_value_sub in info_process_fields.items():
+                    info_key_tmp = separator_name.join([prefix_name, info_key_sub])
+                    info_key_def = info_key_tmp.format(**{'proc_n': str(obj_process_id)})
+                    info_process_collections[info_key_def] = info_value_sub
+
+            # Info get process io info end
+            log_stream.info(' ------> Get process io info ... DONE')
+        else:
+            # Info get process io info end
+            log_stream.info(' ------> Get process io info ... SKIPPED')
+
+        # update the cache (terminated processes are removed)
+        self.process_io_cache = process_io_cache
+
+        return info_process_collections
+    # -------------------------------------------------------------------------------------
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Class to track process peak memory (high water mark read from the status file between analysis steps)
+class TrackerProcessPeak:
+
+    # -------------------------------------------------------------------------------------
+    # Method to initialize class
+    def __init__(self, proc_root='/proc'):
+        # previous samples of the high water mark ((pid, create_time) --> time and high water mark)
+        self.process_peak_cache = {}
+        self.proc_root = proc_root
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to get process peak info (high water mark, its rise and the interval of the rise since the previous sample)
+    def get_process_peak_info(self, obj_process_list, prefix_name='process_name', separator_name='_', **kwargs):
+
+        if prefix_name is None:
+            prefix_name = 'process_name'
+        if separator_name is None:
+            separator_name = '_'
+
+        info_process_collections, process_peak_cache = {}, {}
+        if obj_process_list is not None:
+            for obj_process_id, obj_process_step in enumerate(obj_process_list):
+
+                # get status memory (the key is defined by pid and create time to handle the pid reuse)
+                try:
+                    process_key = (obj_process_step.pid, obj_process_step.create_time())
+                except psutil.NoSuchProcess:
+                    continue
+                process_time = time.monotonic()
+                process_status = read_linux_status_memory(obj_process_step.pid, proc_root=self.proc_root)
+                if (not process_status) or ('VmHWM' not in process_status):
+                    continue
+                process_hwm = process_status['VmHWM']
+
+                # compute rise (NaN for the first sample; interval only for the samples with a rise)
+                process_hwm_rise, process_hwm_interval = np.nan, np.nan
+                process_sample_prev = self.process_peak_cache.get(process_key, None)
+                if process_sample_prev is not None:
+                    process_hwm_rise = process_hwm - process_sample_prev['hwm']
+                    if process_hwm_rise > 0:
+                        process_hwm_interval = round(process_time - process_sample_prev['time'], 4)
+
+                process_peak_cache[process_key] = {'time': process_time, 'hwm': process_hwm}
+
+                info_process_fields = {'vm_hwm': process_hwm, 'vm_peak': process_status.get('VmPeak', None),
+                                       'vm_hwm_rise': process_hwm_rise, 'vm_hwm_rise_interval': process_hwm_interval}
+                for info_key_sub, info_value_sub in info_process_fields.items():
+                    info_key_tmp = separator_name.join([prefix_name, info_key_sub])
+                    info_key_def = info_key_tmp.format(**{'proc_n': str(obj_process_id)})
+                    info_process_collections[info_key_def] = info_value_sub
+
+        # update the cache (terminated processes are removed)
+        self.process_peak_cache = process_peak_cache
+
+        return info_process_collections
+    # -------------------------------------------------------------------------------------
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+class BufferCPU:
+
+    # -------------------------------------------------------------------------------------
+    # Method to initialize class (array preallocated for the samples of the run)
+    def __init__(self, sample_n=None, sample_dtype='float32'):
+
+        if sample_n is None:
+            sample_n = 1024
+
+        self.cpu_n = psutil.cpu_count(logical=True)
+        self.fields_times = list(psutil.cpu_times_percent(interval=None, percpu=False)._fields)
+        self.fields_stats = list(psutil.cpu_stats()._fields)
+
+        self.sample_n, self.sample_dtype = 0, sample_dtype
+        self.buffer_time = np.full(sample_n, np.nan, dtype='float64')
+        self.buffer_times = np.full((sample_n, self.cpu_n, self.fields_times.__len__()), np.nan, dtype=sample_dtype)
+        self.buffer_stats = np.full((sample_n, self.fields_stats.__len__()), np.nan, dtype='float64')
+
+        # first call (the cpu percent is computed from the previous call)
+        psutil.cpu_times_percent(interval=None, percpu=True)
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to extend the buffer (if the number of samples is greater than the preallocated rows)
+    def extend_buffer(self):
+        sample_max = self.buffer_time.shape[0]
+        self.buffer_time = np.concatenate([self.buffer_time, np.full(sample_max, np.nan, dtype='float64')])
+        self.buffer_times = np.concatenate(
+            [self.buffer_times, np.full(self.buffer_times.shape, np.nan, dtype=self.sample_dtype)])
+        self.buffer_stats = np.concatenate(
+            [self.buffer_stats, np.full(self.buffer_stats.shape, np.nan, dtype='float64')])
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to update the buffer (one sample for each step; summary fields returned for the report)
+    def update_buffer(self, prefix_name='cpu', separator_name='_', percent_format='{:.2f}', **kwargs):
+
+        # Info get cpu info start
+        log_stream.info(' ------> Get cpu info ... ')
+
+        if prefix_name is None:
+            prefix_name = 'cpu'
+        if separator_name is None:
+            separator_name = '_'
+
+        if self.sample_n >= self.buffer_time.shape[0]:
+            self.extend_buffer()
+
+        obj_cpu_times = psutil.cpu_times_percent(interval=None, percpu=True)
+        obj_cpu_stats = psutil.cpu_stats()
+
+        sample_id = self.sample_n
+        self.buffer_time[sample_id] = time.time()
+        self.buffer_times[sample_id, :obj_cpu_times.__len__(), :] = np.array(obj_cpu_times, dtype=self.sample_dtype)
+        self.buffer_stats[sample_id, :] = np.array(obj_cpu_stats, dtype='float64')
+        self.sample_n += 1
+
+        # summary of the cores usage (100 - idle; cores without elapsed time since the previous call are skipped)
+        cpu_times = self.buffer_times[sample_id, :, :]
+        cpu_usage = 100.0 - cpu_times[:, self.fields_times.index('idle')]
+        cpu_usage = cpu_usage[np.nansum(cpu_times, axis=1) > 0]
+        if cpu_usage.size > 0:
+            dict_cpu_summary = {'percent_mean': np.mean(cpu_usage), 'percent_max': np.max(cpu_usage),
+                                'percent_min': np.min(cpu_usage)}
+        else:
+            dict_cpu_summary = {'percent_mean': np.nan, 'percent_max': np.nan, 'percent_min': np.nan}
+
+        info_cpu_collection = {}
+        for obj_key, obj_value in dict_cpu_summary.items():
+            obj_key = separator_name.join([prefix_name, obj_key])
+            info_cpu_collection[obj_key] = float(percent_format.format(obj_value))
+        info_cpu_collection[separator_name.join([prefix_name, 'n'])] = self.cpu_n
+
+        # Info get cpu info end
+        log_stream.info(' ------> Get cpu info ... DONE')
+
+        return info_cpu_collection
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to get the buffer (samples between start and end)
+    def get_buffer(self, sample_start=0, sample_end=None):
+
+        if sample_end is None:
+            sample_end = self.sample_n
+
+        obj_buffer = {'time': self.buffer_time[sample_start:sample_end],
+                      'cpu_times_percent': self.buffer_times[sample_start:sample_end],
+                      'cpu_stats': self.buffer_stats[sample_start:sample_end],
+                      'fields_times': np.array(self.fields_times), 'fields_stats': np.array(self.fields_stats)}
+        return obj_buffer
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to reset the buffer (samples of a completed segment already saved)
+    def reset_buffer(self):
+        self.buffer_time[:self.sample_n] = np.nan
+        self.buffer_times[:self.sample_n] = np.nan
+        self.buffer_stats[:self.sample_n] = np.nan
+        self.sample_n = 0
+    # -------------------------------------------------------------------------------------
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# method to start disk usage worker (statvfs call in a daemon thread; result saved in the worker obj)
+def start_disk_usage_worker(disk_path):
+
+    disk_worker = disk_usage_workers.get(disk_path, None)
+    if (disk_worker is not None) and disk_worker['thread'].is_alive():
+        disk_worker['blocked'] = True
+        return disk_worker
+
+    def run_disk_usage(worker_obj):
+        try:
+            worker_obj['usage'] = psutil.disk_usage(worker_obj['path'])
+        except OSError as worker_exc:
+            worker_obj['error'] = worker_exc
+
+    disk_worker = {'path': disk_path, 'usage': None, 'error': None, 'blocked': False}
+    disk_worker['thread'] = threading.Thread(
+        target=run_disk_usage, args=(disk_worker,), name='disk_usage', daemon=True)
+    disk_worker['thread'].start()
+    disk_usage_workers[disk_path] = disk_worker
+
+    return disk_worker
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# method to define disk paths and prefixes (one prefix for each path)
+def define_disk_paths(disk_path=None, prefix_name='disk_usage', separator_name='_'):
 
     if disk_path is None:
         disk_path = '/'
@@ -335,21 +1217,70 @@ def get_disk_info(disk_path=None, prefix_name='disk_usage', separator_name='_',
     if separator_name is None:
         separator_name = '_'
 
-    obj_disk_usage = psutil.disk_usage(disk_path)
-    dict_disk_usage_bytes = convert_obj2dict(obj_disk_usage)
-    dict_disk_usage_human = convert_bytes2human_obj(dict_disk_usage_bytes)
+    if isinstance(disk_path, str):
+        disk_path = [disk_path]
+    if isinstance(prefix_name, str):
+        if disk_path.__len__() == 1:
+            prefix_name = [prefix_name.format(disk_n=0)]
+        elif '{disk_n}' in prefix_name:
+            prefix_name = [prefix_name.format(disk_n=disk_n) for disk_n in range(disk_path.__len__())]
+        else:
+            prefix_name = [separator_name.join([prefix_name, str(disk_n)]) for disk_n in range(disk_path.__len__())]
+
+    if disk_path.__len__() != prefix_name.__len__():
+        log_stream.error(' ===> Disk paths and prefix names must be defined by lists with the same length')
+        raise RuntimeError('Disk paths and prefix names are not in the same number')
+
+    return disk_path, prefix_name
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# method to get disk information (one or more paths; a blocked path gives a null sample)
+def get_disk_info(disk_path=None, prefix_name='disk_usage', separator_name='_', disk_timeout=disk_timeout_default,
+                  fields_name=None, **kwargs):
+
+    # Info get disk info start
+    log_stream.info(' ------> Get disk info ... ')
+
+    if separator_name is None:
+        separator_name = '_'
+    if disk_timeout is None:
+        disk_timeout = disk_timeout_default
+    if fields_name is None:
+        fields_name = ['total', 'used', 'free', 'percent']
+
+    disk_path_list, prefix_name_list = define_disk_paths(disk_path, prefix_name, separator_name)
+
+    # start the workers of all the paths (the timeout is shared by the paths)
+    disk_worker_list = [start_disk_usage_worker(disk_path_step) for disk_path_step in disk_path_list]
+    disk_time_end = time.monotonic() + disk_timeout
 
     info_disk_collection = {}
-    if dict_disk_usage_human is not None:
-        if isinstance(dict_disk_usage_human, dict):
-            for obj_key, obj_value in dict_disk_usage_human.items():
-                obj_key = separator_name.join([prefix_name, obj_key])
-                info_disk_collection[obj_key] = obj_value
+    for disk_path_step, prefix_name_step, disk_worker_step in zip(disk_path_list, prefix_name_list, disk_worker_list):
+
+        if not disk_worker_step['blocked']:
+            disk_worker_step['thread'].join(max(disk_time_end - time.monotonic(), 0.0))
+
+        dict_disk_usage_bytes = None
+        if disk_worker_step['blocked']:
+            log_stream.warning(' ===> Disk path "' + disk_path_step + '" is still blocked by a previous call')
+        elif disk_worker_step['thread'].is_alive():
+            log_stream.warning(' ===> Disk path "' + disk_path_step + '" is not responding in ' +
+                               str(disk_timeout) + ' seconds')
+        elif disk_worker_step['error'] is not None:
+            log_stream.warning(' ===> Disk path "' + disk_path_step + '" is not available [' +
+                               str(disk_worker_step['error']) + ']')
         else:
-            log_stream.error(' ===> Disk obj is not defined by dictionary obj')
-            raise RuntimeError('Only dictionary obj is supported by the function')
-    else:
-        log_stream.warning(' ===> Disk obj is defined by NoneType')
+            dict_disk_usage_bytes = convert_obj2dict(disk_worker_step['usage'])
+
+        # null sample (fields defined by NoneType)
+        if dict_disk_usage_bytes is None:
+            dict_disk_usage_bytes = {field_name: None for field_name in fields_name}
+
+        for obj_key, obj_value in dict_disk_usage_bytes.items():
+            obj_key = separator_name.join([prefix_name_step, obj_key])
+            info_disk_collection[obj_key] = obj_value
 
     # Info get disk info end
     log_stream.info(' ------> Get disk info ... DONE')
@@ -358,6 +1289,394 @@ def get_disk_info(disk_path=None, prefix_name='disk_usage', separator_name='_',
 # -------------------------------------------------------------------------------------
 
 
+# -------------------------------------------------------------------------------------
+# Method to get disk device (block device name behind a path, as defined in the disk io counters)
+def get_disk_device(disk_path='/', sys_root='/sys'):
+
+    disk_path = os.path.realpath(disk_path)
+
+    # device number of the path --> block device name (sysfs link)
+    disk_stat = os.stat(disk_path)
+    disk_link = os.path.join(sys_root, 'dev', 'block',
+                             str(os.major(disk_stat.st_dev)) + ':' + str(os.minor(disk_stat.st_dev)))
+    if os.path.exists(disk_link):
+        return os.path.basename(os.path.realpath(disk_link))
+
+    # mount point of the path (longest match) --> device name (fallback)
+    disk_device, disk_mountpoint_len = None, -1
+    for disk_partition in psutil.disk_partitions(all=False):
+        disk_mountpoint = disk_partition.mountpoint
+        if disk_path == disk_mountpoint or disk_path.startswith(disk_mountpoint.rstrip(os.sep) + os.sep):
+            if disk_mountpoint.__len__() > disk_mountpoint_len:
+                disk_device = os.path.basename(os.path.realpath(disk_partition.device))
+                disk_mountpoint_len = disk_mountpoint.__len__()
+
+    return disk_device
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+class TrackerDiskIO:
+
+    # -------------------------------------------------------------------------------------
+    # Method to initialize class
+    def __init__(self, disk_path=None):
+
+        if disk_path is None:
+            disk_path = '/'
+        self.disk_path = disk_path
+        self.disk_device = get_disk_device(disk_path)
+
+        # previous sample of the cumulative counters
+        self.disk_io_time_prev, self.disk_io_counters_prev = None, None
+
+        if self.disk_device is None:
+            log_stream.warning(' ===> Block device of disk path "' + disk_path + '" is not found')
+        elif self.disk_device not in list(psutil.disk_io_counters(perdisk=True).keys()):
+            log_stream.warning(' ===> Block device "' + self.disk_device + '" of disk path "' + disk_path +
+                               '" is not available in the disk io counters')
+            self.disk_device = None
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to get disk io info (rates computed from the previous sample)
+    def get_disk_io_info(self, prefix_name='disk_io', separator_name='_', rate_format='{:.4f}', **kwargs):
+
+        # Info get disk io info start
+        log_stream.info(' ------> Get disk io info ... ')
+
+        if prefix_name is None:
+            prefix_name = 'disk_io'
+        if separator_name is None:
+            separator_name = '_'
+
+        if self.disk_device is None:
+            log_stream.info(' ------> Get disk io info ... SKIPPED. Block device not defined')
+            return {}
+
+        disk_io_time = time.monotonic()
+        obj_disk_io = psutil.disk_io_counters(perdisk=True).get(self.disk_device, None)
+        if obj_disk_io is None:
+            log_stream.warning(' ===> Block device "' + self.disk_device + '" is not available')
+            log_stream.info(' ------> Get disk io info ... SKIPPED')
+            return {}
+        disk_io_counters = convert_obj2dict(obj_disk_io)
+
+        # compute rates (NaN for the first sample or for counters reset)
+        dict_disk_io = {'read_bytes_rate': np.nan, 'write_bytes_rate': np.nan,
+                        'read_iops': np.nan, 'write_iops': np.nan, 'busy_percent': np.nan}
+        if self.disk_io_counters_prev is not None:
+            disk_io_time_delta = disk_io_time - self.disk_io_time_prev
+            if disk_io_time_delta > 0:
+                for rate_key, counter_key in [('read_bytes_rate', 'read_bytes'), ('write_bytes_rate', 'write_bytes'),
+                                              ('read_iops', 'read_count'), ('write_iops', 'write_count')]:
+                    counter_delta = disk_io_counters[counter_key] - self.disk_io_counters_prev[counter_key]
+                    if counter_delta >= 0:
+                        dict_disk_io[rate_key] = float(rate_format.format(counter_delta / disk_io_time_delta))
+                # busy time in milliseconds (linux)
+                if 'busy_time' in disk_io_counters:
+                    counter_delta = disk_io_counters['busy_time'] - self.disk_io_counters_prev['busy_time']
+                    if counter_delta >= 0:
+                        dict_disk_io['busy_percent'] = float(rate_format.format(
+                            min(counter_delta / (disk_io_time_delta * 1000.0) * 100.0, 100.0)))
+
+        self.disk_io_time_prev, self.disk_io_counters_prev = disk_io_time, disk_io_counters
+
+        info_disk_io_collection = {separator_name.join([prefix_name, 'device']): self.disk_device}
+        for obj_key, obj_value in dict_disk_io.items():
+            obj_key = separator_name.join([prefix_name, obj_key])
+            info_disk_io_collection[obj_key] = obj_value
+
+        # Info get disk io info end
+        log_stream.info(' ------> Get disk io info ... DONE')
+
+        return info_disk_io_collection
+    # -------------------------------------------------------------------------------------
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+class TrackerPressure:
+
+    # -------------------------------------------------------------------------------------
+    # Method to initialize class
+    def __init__(self, pressure_folder='/proc/pressure', pressure_resources=None, pressure_suffix=''):
+
+        if pressure_resources is None:
+            pressure_resources = ['cpu', 'memory', 'io']
+
+        self.pressure_folder = pressure_folder
+        self.pressure_resources = pressure_resources
+        self.pressure_suffix = pressure_suffix
+
+        # previous sample of the total stall time (file name --> line --> total)
+        self.pressure_total_prev = {}
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to get pressure info (some/full averages and growth of the total stall time)
+    def get_pressure_info(self, pressure_folder=None, prefix_name='pressure', separator_name='_',
+                          pressure_fields=None, **kwargs):
+
+        # Info get pressure info start
+        log_stream.info(' ------> Get pressure info ... ')
+
+        if pressure_folder is None:
+            pressure_folder = self.pressure_folder
+        if prefix_name is None:
+            prefix_name = 'pressure'
+        if separator_name is None:
+            separator_name = '_'
+        if pressure_fields is None:
+            pressure_fields = ['avg10', 'avg60']
+
+        info_pressure_collection, pressure_total_now = {}, {}
+        for pressure_resource in self.pressure_resources:
+
+            pressure_file = os.path.join(pressure_folder, pressure_resource + self.pressure_suffix)
+            pressure_obj = read_linux_pressure(pressure_file)
+            if not pressure_obj:
+                continue
+
+            for pressure_line, pressure_values in pressure_obj.items():
+
+                dict_pressure = {pressure_key: pressure_values.get(pressure_key, None)
+                                 for pressure_key in pressure_fields}
+
+                # growth of the total stall time (microseconds; None for the first sample or for counters reset)
+                pressure_total = pressure_values.get('total', None)
+                pressure_total_prev = self.pressure_total_prev.get(pressure_file, {}).get(pressure_line, None)
+                dict_pressure['total_delta'] = None
+                if (pressure_total is not None) and (pressure_total_prev is not None) and \
+                        (pressure_total >= pressure_total_prev):
+                    dict_pressure['total_delta'] = pressure_total - pressure_total_prev
+                pressure_total_now.setdefault(pressure_file, {})[pressure_line] = pressure_total
+
+                for obj_key, obj_value in dict_pressure.items():
+                    obj_key = separator_name.join([prefix_name, pressure_resource, pressure_line, obj_key])
+                    info_pressure_collection[obj_key] = obj_value
+
+        self.pressure_total_prev = pressure_total_now
+
+        # Info get pressure info end
+        if info_pressure_collection:
+            log_stream.info(' ------> Get pressure info ... DONE')
+        else:
+            log_stream.info(' ------> Get pressure info ... SKIPPED. Pressure files not available')
+
+        return info_pressure_collection
+    # -------------------------------------------------------------------------------------
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+class TrackerCgroup:
+
+    # -------------------------------------------------------------------------------------
+    # Method to initialize class
+    def __init__(self, cgroup_root='/sys/fs/cgroup', proc_root='/proc', memory_stat_keys=None):
+
+        if memory_stat_keys is None:
+            memory_stat_keys = ['anon', 'file', 'kernel_stack', 'shmem', 'file_dirty', 'file_writeback']
+
+        self.cgroup_root = define_linux_cgroup_root(cgroup_root)
+        self.proc_root = proc_root
+        self.memory_stat_keys = memory_stat_keys
+
+        if self.cgroup_root is None:
+            log_stream.warning(' ===> Cgroup v2 hierarchy is not available in "' + cgroup_root + '"')
+
+        # previous sample of the cumulative counters (cgroup path --> time and counters)
+        self.cgroup_path_prev, self.cgroup_time_prev, self.cgroup_counters_prev = None, None, None
+
+        # pressure tracker of the cgroup (cpu.pressure, memory.pressure and io.pressure files)
+        self.cgroup_pressure = TrackerPressure(pressure_folder=None, pressure_suffix='.pressure')
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to get cgroup folder (cgroup of the process)
+    def get_cgroup_folder(self, process_pid):
+        if self.cgroup_root is None:
+            return None
+        cgroup_path = read_linux_cgroup_path(process_pid, proc_root=self.proc_root)
+        if cgroup_path is None:
+            return None
+        cgroup_folder = os.path.normpath(os.path.join(self.cgroup_root, cgroup_path.lstrip('/')))
+        if not os.path.isdir(cgroup_folder):
+            return None
+        return cgroup_folder
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to get cgroup info (cgroup of the first process; counters turned into rates)
+    def get_cgroup_info(self, obj_process_list, prefix_name='cgroup', separator_name='_',
+                        rate_format='{:.4f}', percent_format='{:.4f}', **kwargs):
+
+        # Info get cgroup info start
+        log_stream.info(' ------> Get cgroup info ... ')
+
+        if prefix_name is None:
+            prefix_name = 'cgroup'
+        if separator_name is None:
+            separator_name = '_'
+
+        if not obj_process_list:
+            log_stream.info(' ------> Get cgroup info ... SKIPPED. Process list not defined')
+            return {}
+
+        cgroup_folder = self.get_cgroup_folder(obj_process_list[0].pid)
+        if cgroup_folder is None:
+            log_stream.info(' ------> Get cgroup info ... SKIPPED. Cgroup v2 of the process not found')
+            return {}
+
+        cgroup_time = time.monotonic()
+
+        # memory (current, max and stat)
+        memory_current = read_linux_cgroup_value(os.path.join(cgroup_folder, 'memory.current'))
+        memory_max = read_linux_cgroup_value(os.path.join(cgroup_folder, 'memory.max'))
+        memory_stat = read_linux_cgroup_keys(os.path.join(cgroup_folder, 'memory.stat'))
+        memory_events = read_linux_cgroup_keys(os.path.join(cgroup_folder, 'memory.events'))
+        # cpu and io (cumulative counters)
+        cpu_stat = read_linux_cgroup_keys(os.path.join(cgroup_folder, 'cpu.stat'))
+        io_stat = read_linux_cgroup_io(os.path.join(cgroup_folder, 'io.stat'))
+        # io counters (no device lines: idle cgroup; no io.stat file: no data)
+        io_stat_default = 0 if os.path.exists(os.path.join(cgroup_folder, 'io.stat')) else np.nan
+
+        memory_percent = np.nan
+        if (memory_current is not None) and memory_max:
+            memory_percent = float(percent_format.format(memory_current / memory_max * 100))
+
+        dict_cgroup = {'path': cgroup_folder, 'memory_current': memory_current, 'memory_max': memory_max,
+                       'memory_percent': memory_percent}
+        for memory_key in self.memory_stat_keys:
+            dict_cgroup['memory_' + memory_key] = memory_stat.get(memory_key, None)
+        for event_key in ['high', 'max', 'oom', 'oom_kill']:
+            dict_cgroup['memory_events_' + event_key] = memory_events.get(event_key, None)
+
+        # counters of the step (the previous sample is dropped if the cgroup is changed)
+        cgroup_counters = {
+            'cpu_usage_usec': cpu_stat.get('usage_usec', None), 'cpu_nr_throttled': cpu_stat.get('nr_throttled', None),
+            'cpu_throttled_usec': cpu_stat.get('throttled_usec', None),
+            'memory_pgmajfault': memory_stat.get('pgmajfault', None),
+            'io_rbytes': io_stat.get('rbytes', io_stat_default), 'io_wbytes': io_stat.get('wbytes', io_stat_default),
+            'io_rios': io_stat.get('rios', io_stat_default), 'io_wios': io_stat.get('wios', io_stat_default)}
+        cgroup_counters = {counter_key: counter_value for counter_key, counter_value in cgroup_counters.items()
+                           if counter_value is not None}
+
+        cgroup_counters_prev, cgroup_time_delta = None, None
+        if self.cgroup_path_prev == cgroup_folder:
+            cgroup_counters_prev, cgroup_time_delta = self.cgroup_counters_prev, cgroup_time - self.cgroup_time_prev
+        cgroup_rates = compute_counters_rate(
+            cgroup_counters, cgroup_counters_prev, cgroup_time_delta, rate_format=rate_format)
+
+        # cpu usage and throttled time as percentage of the elapsed time (usec per second --> percent)
+        for rate_key_raw, rate_key_def in [('cpu_usage_usec_rate', 'cpu_usage_percent'),
+                                           ('cpu_throttled_usec_rate', 'cpu_throttled_percent')]:
+            rate_value = cgroup_rates.pop(rate_key_raw, np.nan)
+            dict_cgroup[rate_key_def] = float(percent_format.format(rate_value / 1e4))
+        dict_cgroup['cpu_nr_throttled_rate'] = cgroup_rates.get('cpu_nr_throttled_rate', np.nan)
+        dict_cgroup['memory_pgmajfault_rate'] = cgroup_rates.get('memory_pgmajfault_rate', np.nan)
+        dict_cgroup['io_read_bytes_rate'] = cgroup_rates.get('io_rbytes_rate', np.nan)
+        dict_cgroup['io_write_bytes_rate'] = cgroup_rates.get('io_wbytes_rate', np.nan)
+        dict_cgroup['io_read_iops'] = cgroup_rates.get('io_rios_rate', np.nan)
+        dict_cgroup['io_write_iops'] = cgroup_rates.get('io_wios_rate', np.nan)
+
+        self.cgroup_path_prev, self.cgroup_time_prev, self.cgroup_counters_prev = \
+            cgroup_folder, cgroup_time, cgroup_counters
+
+        info_cgroup_collection = {}
+        for obj_key, obj_value in dict_cgroup.items():
+            obj_key = separator_name.join([prefix_name, obj_key])
+            info_cgroup_collection[obj_key] = obj_value
+
+        # pressure info of the cgroup (if available)
+        info_cgroup_collection.update(self.cgroup_pressure.get_pressure_info(
+            pressure_folder=cgroup_folder, prefix_name=separator_name.join([prefix_name, 'pressure']),
+            separator_name=separator_name))
+
+        # Info get cgroup info end
+        log_stream.info(' ------> Get cgroup info ... DONE')
+
+        return info_cgroup_collection
+    # -------------------------------------------------------------------------------------
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+class TrackerNetwork:
+
+    # -------------------------------------------------------------------------------------
+    # Method to initialize class
+    def __init__(self, network_interfaces=None):
+
+        # network interfaces (all the interfaces except loopback if not defined)
+        network_interfaces_available = list(psutil.net_io_counters(pernic=True).keys())
+        if network_interfaces is None:
+            network_interfaces = [nic_name for nic_name in network_interfaces_available if nic_name != 'lo']
+        elif isinstance(network_interfaces, str):
+            network_interfaces = [network_interfaces]
+        for nic_name in network_interfaces:
+            if nic_name not in network_interfaces_available:
+                log_stream.warning(' ===> Network interface "' + nic_name + '" is not available')
+        self.network_interfaces = network_interfaces
+
+        # previous sample of the cumulative counters
+        self.network_time_prev, self.network_counters_prev = None, {}
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to get network info (rates computed from the previous sample of each interface)
+    def get_network_info(self, prefix_name='network_{nic_name}', separator_name='_', rate_format='{:.4f}', **kwargs):
+
+        # Info get network info start
+        log_stream.info(' ------> Get network info ... ')
+
+        if prefix_name is None:
+            prefix_name = 'network_{nic_name}'
+        if separator_name is None:
+            separator_name = '_'
+
+        network_time = time.monotonic()
+        obj_network = psutil.net_io_counters(pernic=True)
+
+        network_time_delta = None
+        if self.network_time_prev is not None:
+            network_time_delta = network_time - self.network_time_prev
+
+        info_network_collection, network_counters = {}, {}
+        for nic_name in self.network_interfaces:
+
+            if nic_name not in obj_network:
+                continue
+            network_counters[nic_name] = convert_obj2dict(obj_network[nic_name])
+
+            dict_network_rate = compute_counters_rate(
+                network_counters[nic_name], self.network_counters_prev.get(nic_name, None), network_time_delta,
+                rate_format=rate_format)
+
+            for obj_key, obj_value in dict_network_rate.items():
+                obj_key = separator_name.join([prefix_name, obj_key]).format(nic_name=nic_name)
+                info_network_collection[obj_key] = obj_value
+
+        self.network_time_prev, self.network_counters_prev = network_time, network_counters
+
+        # Info get network info end
+        log_stream.info(' ------> Get network info ... DONE')
+
+        return info_network_collection
+    # -------------------------------------------------------------------------------------
+
+# -------------------------------------------------------------------------------------
+
+
 # -------------------------------------------------------------------------------------
 # method to get memory information
 def get_memory_info():
@@ -365,22 +1684,27 @@ def get_memory_info():
     # Info get memory info start
     log_stream.info(' ------> Get memory info ... ')
 
-    obj_virtual_memory = psutil.virtual_memory()
-    dict_virtual_memory_bytes = convert_obj2dict(obj_virtual_memory)
-    dict_virtual_memory_human = convert_bytes2human_obj(dict_virtual_memory_bytes)
-
-    obj_swap_memory = psutil.swap_memory()
-    dict_swap_memory_bytes = convert_obj2dict(obj_swap_memory)
-    dict_swap_memory_human = convert_bytes2human_obj(dict_swap_memory_bytes)
+    # virtual and swap memory (meminfo parsed once; fields defined as in the psutil objects)
+    dict_virtual_memory_linux, dict_swap_memory_linux = get_linux_memory_usage()
 
-    dict_virtual_memory_human_extras, dict_swap_memory_human_extras = get_linux_memory_usage()
+    dict_virtual_memory_bytes = {}
+    for virtual_key in ['total', 'available', 'percent', 'used', 'free', 'active', 'inactive', 'buffers', 'cached',
+                        'shared', 'slab', 'dirty', 'writeback', 'commit_limit', 'committed_as']:
+        dict_virtual_memory_bytes[virtual_key] = dict_virtual_memory_linux[virtual_key]
 
-    dict_swap_memory_human['swappiness'] = deepcopy(dict_swap_memory_human_extras['swappiness'])
+    dict_swap_memory_bytes = {}
+    for swap_key in ['total', 'used', 'free', 'percent']:
+        dict_swap_memory_bytes[swap_key] = dict_swap_memory_linux[swap_key]
+    # swap in/out (cumulative pages converted in bytes)
+    dict_vmstat, page_size = read_linux_vmstat(), os.sysconf('SC_PAGE_SIZE')
+    dict_swap_memory_bytes['sin'] = dict_vmstat.get('pswpin', 0) * page_size
+    dict_swap_memory_bytes['sout'] = dict_vmstat.get('pswpout', 0) * page_size
+    dict_swap_memory_bytes['swappiness'] = dict_swap_memory_linux['swappiness']
 
     # Info get memory info end
     log_stream.info(' ------> Get memory info ... DONE')
 
-    return dict_virtual_memory_human, dict_swap_memory_human
+    return dict_virtual_memory_bytes, dict_swap_memory_bytes
 # -------------------------------------------------------------------------------------
 
 
@@ -484,3 +1808,832 @@ def kill_process_tree(pid, sig=signal.SIGTERM, include_parent=True,
                                     callback=on_terminate)
     return (gone, alive)
 # -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Collectors registry (tool name --> collector class)
+collectors_registry = {}
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# method to register collector (decorator of the collector classes)
+def register_collector(collector_class):
+    collectors_registry[collector_class.tool_name] = collector_class
+    return collector_class
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# method to define collectors (one collector for each registered tool of the analysis tools)
+def define_collectors(tool_names, tool_collections, tool_scope='host', tool_context=None, tool_prefix=None,
+                      tool_mode='standard'):
+
+    collectors_obj = []
+    for tool_name in tool_names:
+        if tool_name not in list(collectors_registry.keys()):
+            log_stream.warning(' ===> Tool "' + tool_name + '" is not defined in the collectors registry')
+            continue
+        collector_class = collectors_registry[tool_name]
+        if collector_class.tool_scope != tool_scope:
+            continue
+        if collector_class.tool_mode != tool_mode:
+            log_stream.warning(' ===> Tool "' + tool_name + '" is not available in the "' + tool_mode +
+                               '" analysis mode')
+            continue
+
+        tool_attrs = deepcopy(tool_collections.get(tool_name, None))
+        if tool_attrs is None:
+            tool_attrs = {}
+        if (tool_prefix is not None) and (tool_name in list(tool_prefix.keys())):
+            tool_attrs['prefix_name'] = tool_prefix[tool_name]
+
+        collectors_obj.append(collector_class(tool_attrs=tool_attrs, tool_context=tool_context))
+
+    return collectors_obj
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+class CollectorBase:
+
+    # tool name (key of the analysis tools) and scope (host: one sample for each step; target: one sample for each
+    # process target, using the selected processes)
+    tool_name = None
+    tool_scope = 'host'
+    # analysis mode (standard: analysis steps of seconds; high_frequency: cheap collectors for sub-second steps)
+    tool_mode = 'standard'
+    # units of the fields (suffix of the columns) and process slots of the columns (target collectors)
+    fields_bytes, fields_units = [], {}
+    process_slots = 1
+
+    # -------------------------------------------------------------------------------------
+    # Method to initialize class
+    def __init__(self, tool_attrs=None, tool_context=None):
+        self.tool_attrs = tool_attrs if tool_attrs is not None else {}
+        self.tool_context = tool_context if tool_context is not None else {}
+        self.separator_name = self.tool_attrs.get('separator_name', None)
+        if self.separator_name is None:
+            self.separator_name = '_'
+        self.setup()
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to set up the collector (trackers and buffers)
+    def setup(self):
+        pass
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to sample the collector (collections of the step)
+    def sample(self, obj_process_list=None):
+        return {}
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to sample the collector and measure the latency (seconds)
+    def sample_latency(self, obj_process_list=None):
+        sample_start = time.monotonic()
+        sample_collections = self.sample(obj_process_list)
+        return sample_collections, time.monotonic() - sample_start
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to get a null sample (columns of the schema defined by NoneType)
+    def get_null_sample(self):
+        return {column_name: None for column_name in self.define_columns()}
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to define the timeout (seconds; analysis timeout used if the collector timeout is not defined)
+    def define_timeout(self, default_timeout=None):
+        collector_timeout = self.tool_attrs.get('collector_timeout', None)
+        if collector_timeout is None:
+            collector_timeout = default_timeout
+        return collector_timeout
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to get the latency name (column of the collector latency)
+    def get_latency_name(self, prefix_name='collector', suffix_name='latency'):
+        return self.separator_name.join([prefix_name, self.tool_name.replace('tool_info_', ''), suffix_name])
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to define the column names declared by the collector
+    def define_columns(self):
+        return []
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to get the schema (columns --> units; NoneType for the columns without units)
+    def get_schema(self):
+        schema_columns = self.define_columns()
+        schema_units = self.get_units({column_name: None for column_name in schema_columns})
+        return {column_name: schema_units.get(column_name, None) for column_name in schema_columns}
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to get the units of the collections
+    def get_units(self, info_collections):
+        return define_units_info(info_collections, fields_bytes=self.fields_bytes, fields_units=self.fields_units,
+                                 separator_name=self.separator_name)
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to get the plot spec (plot method, prefix and units of each figure)
+    def get_plot_spec(self):
+        return []
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to define the prefix names of the process slots (unique names; "{proc_n}" filled by the slot index)
+    def define_prefix_slots(self, prefix_name):
+        return list(dict.fromkeys([prefix_name.format(proc_n=proc_n) for proc_n in range(self.process_slots)]))
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to join column names (prefix and fields)
+    def join_columns(self, prefix_name, fields_name):
+        return [self.separator_name.join([prefix_name, field_name]) for field_name in fields_name]
+    # -------------------------------------------------------------------------------------
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+@register_collector
+class CollectorProcess(CollectorBase):
+
+    tool_name, tool_scope = 'tool_info_process', 'target'
+    fields_bytes = fields_bytes_process + ['vm_hwm', 'vm_peak', 'vm_hwm_rise']
+    fields_units = {'vm_hwm_rise_interval': 's'}
+
+    def setup(self):
+        self.process_peak_tracker = None
+        if self.tool_attrs.get('process_peak', True):
+            self.process_peak_tracker = TrackerProcessPeak()
+        self.process_slots = define_process_slots(
+            self.tool_attrs.get('process_filter', 'first'), self.tool_attrs.get('process_n', None))
+
+    def sample(self, obj_process_list=None):
+
+        # select the processes of the declared slots
+        obj_process_list = select_process_slots(obj_process_list, self.process_slots, tool_name=self.tool_name)
+
+        # get and organize process info collections (using the tracked process handles)
+        info_process_collections = organize_process_info(obj_process_list, **self.tool_attrs)
+
+        # get and organize process peak collections (high water mark between the analysis steps)
+        if (self.process_peak_tracker is not None) and info_process_collections:
+            info_process_collections.update(
+                self.process_peak_tracker.get_process_peak_info(obj_process_list, **self.tool_attrs))
+
+        # get and organize process tree info collections (aggregated fields of the descendant processes)
+        process_tracker = self.tool_context.get('process_tracker', None)
+        if self.tool_attrs.get('process_tree', False) and (obj_process_list is not None):
+            info_process_tree_raw = [process_tracker.get_process_tree(
+                obj_process_step) for obj_process_step in obj_process_list]
+            info_process_collections.update(organize_process_tree_info(info_process_tree_raw, **self.tool_attrs))
+
+        # add process tracker info collections (scan statistics)
+        if info_process_collections:
+            info_process_collections.update(process_tracker.get_tracker_info(
+                prefix_name=self.tool_attrs.get('prefix_name_scan', 'process_scan'),
+                separator_name=self.separator_name))
+
+        return info_process_collections
+
+    def define_columns(self):
+
+        prefix_name = self.tool_attrs.get('prefix_name', None)
+        if prefix_name is None:
+            prefix_name = 'process_name'
+        process_attributes = self.tool_attrs.get('process_attributes', None)
+        if process_attributes is None:
+            process_attributes = ['pid', 'name', 'cpu_percent']
+
+        fields_memory = deepcopy(fields_bytes_process)
+        if self.tool_attrs.get('process_memory_type', 'full') == 'partial':
+            fields_memory = fields_memory[:7]
+
+        fields_name = []
+        for attr_name in process_attributes:
+            if attr_name == 'memory_info':
+                fields_name.extend(fields_memory)
+            elif attr_name == 'cpu_times':
+                fields_name.extend(list(psutil.Process().cpu_times()._fields))
+            else:
+                fields_name.append(attr_name)
+        # memory fields (always read by the process fields)
+        if 'memory_info' not in process_attributes:
+            fields_name.extend(fields_memory)
+        fields_name.extend(['cpu_affinity', 'cpu_n'] + ['percent_' + field_name for field_name in fields_memory])
+
+        if self.tool_attrs.get('process_peak', True):
+            fields_name.extend(['vm_hwm', 'vm_peak', 'vm_hwm_rise', 'vm_hwm_rise_interval'])
+
+        # columns of each process slot (prefix without "{proc_n}" shared by the slots)
+        columns_name = []
+        for prefix_name_step in self.define_prefix_slots(prefix_name):
+            columns_name += self.join_columns(prefix_name_step, fields_name)
+        if self.tool_attrs.get('process_tree', False):
+            prefix_name_tree = self.tool_attrs.get('prefix_name_tree', None)
+            if prefix_name_tree is None:
+                prefix_name_tree = 'process_tree_{proc_n}'
+            for prefix_name_step in self.define_prefix_slots(prefix_name_tree):
+                columns_name += self.join_columns(
+                    prefix_name_step, ['n', 'rss', 'uss', 'pss', 'swap', 'cpu_percent', 'num_threads'])
+        columns_name += self.join_columns(
+            self.tool_attrs.get('prefix_name_scan', 'process_scan'), ['n', 'skipped', 'time_last', 'time_mean'])
+
+        return columns_name
+
+    def get_plot_spec(self):
+        prefix_name = self.tool_attrs.get('prefix_name', None)
+        if prefix_name is None:
+            prefix_name = 'process_name'
+        plot_attrs = {}
+        if self.tool_attrs.get('process_peak', True):
+            plot_attrs['columns_peak'] = ['vm_hwm']
+        return [{'plot_name': 'plot_process_info', 'prefix_name': prefix_name.format(proc_n=0),
+                 'dframe_units': 'G', 'plot_attrs': plot_attrs}]
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+@register_collector
+class CollectorProcessIO(CollectorBase):
+
+    tool_name, tool_scope = 'tool_info_process_io', 'target'
+    fields_units = fields_rate_process_io
+
+    def setup(self):
+        self.process_io_tracker = TrackerProcessIO()
+        # process slots defined by the process filter of the process tool
+        tool_attrs_process = self.tool_context.get('tools', {}).get('tool_info_process', None)
+        if tool_attrs_process is None:
+            tool_attrs_process = {}
+        self.process_slots = define_process_slots(
+            tool_attrs_process.get('process_filter', 'first'),
+            self.tool_attrs.get('process_n', tool_attrs_process.get('process_n', None)))
+
+    def sample(self, obj_process_list=None):
+        obj_process_list = select_process_slots(obj_process_list, self.process_slots, tool_name=self.tool_name)
+        return self.process_io_tracker.get_process_io_info(obj_process_list, **self.tool_attrs)
+
+    def define_columns(self):
+        prefix_name = self.tool_attrs.get('prefix_name', None)
+        if prefix_name is None:
+            prefix_name = 'process_io_{proc_n}'
+        columns_name = []
+        for prefix_name_step in self.define_prefix_slots(prefix_name):
+            columns_name += self.join_columns(prefix_name_step, ['pid'] + list(fields_rate_process_io.keys()) +
+                                              ['num_threads', 'num_fds'])
+        return columns_name
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+@register_collector
+class CollectorCgroup(CollectorBase):
+
+    tool_name, tool_scope = 'tool_info_cgroup', 'target'
+    fields_bytes = fields_bytes_cgroup
+    fields_units = {**fields_rate_cgroup, **fields_units_pressure}
+
+    def setup(self):
+        self.cgroup_tracker = TrackerCgroup(
+            cgroup_root=self.tool_attrs.get('cgroup_root', '/sys/fs/cgroup'),
+            proc_root=self.tool_attrs.get('proc_root', '/proc'))
+
+    def sample(self, obj_process_list=None):
+        return self.cgroup_tracker.get_cgroup_info(obj_process_list, **self.tool_attrs)
+
+    def define_columns(self):
+        prefix_name = self.tool_attrs.get('prefix_name', None)
+        if prefix_name is None:
+            prefix_name = 'cgroup'
+        fields_name = ['path', 'memory_current', 'memory_max', 'memory_percent'] + \
+            ['memory_' + memory_key for memory_key in self.cgroup_tracker.memory_stat_keys] + \
+            ['memory_events_' + event_key for event_key in ['high', 'max', 'oom', 'oom_kill']] + \
+            ['cpu_usage_percent', 'cpu_throttled_percent'] + list(fields_rate_cgroup.keys())
+        columns_name = self.join_columns(prefix_name, fields_name)
+        for pressure_resource in self.cgroup_tracker.cgroup_pressure.pressure_resources:
+            for pressure_line in ['some', 'full']:
+                columns_name += self.join_columns(
+                    self.separator_name.join([prefix_name, 'pressure', pressure_resource, pressure_line]),
+                    ['avg10', 'avg60', 'total_delta'])
+        return columns_name
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+@register_collector
+class CollectorMemory(CollectorBase):
+
+    tool_name = 'tool_info_memory'
+    fields_bytes = fields_bytes_memory
+
+    def sample(self, obj_process_list=None):
+        info_virtual_memory, info_swap_memory = get_memory_info()
+        return organize_memory_info(info_virtual_memory, info_swap_memory, **self.tool_attrs)
+
+    def define_columns(self):
+        fields_virtual_memory = list(psutil.virtual_memory()._fields) + \
+            ['dirty', 'writeback', 'slab', 'commit_limit', 'committed_as']
+        fields_virtual_memory = list(dict.fromkeys(fields_virtual_memory))
+        fields_swap_memory = list(psutil.swap_memory()._fields) + ['swappiness']
+        return self.join_columns(self.tool_attrs.get('prefix_name_virtual_memory', 'virtual_memory'),
+                                 fields_virtual_memory) + \
+            self.join_columns(self.tool_attrs.get('prefix_name_swap_memory', 'swap_memory'), fields_swap_memory)
+
+    def get_plot_spec(self):
+        return [{'plot_name': 'plot_memory_info',
+                 'prefix_name': self.tool_attrs.get('prefix_name_virtual_memory', 'virtual_memory'),
+                 'dframe_units': 'G', 'dframe_format': '{:0.3}'}]
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+@register_collector
+class CollectorDisk(CollectorBase):
+
+    tool_name = 'tool_info_disk'
+    fields_bytes = fields_bytes_disk
+
+    def setup(self):
+        self.disk_path_list, self.prefix_name_list = define_disk_paths(
+            self.tool_attrs.get('disk_path', None), self.tool_attrs.get('prefix_name', None), self.separator_name)
+
+    def sample(self, obj_process_list=None):
+        return get_disk_info(**self.tool_attrs)
+
+    def define_timeout(self, default_timeout=None):
+        # the collector deadline covers the timeout of the paths (a blocked path does not drop the other paths)
+        collector_timeout = super().define_timeout(default_timeout)
+        disk_timeout = self.tool_attrs.get('disk_timeout', None)
+        if disk_timeout is None:
+            disk_timeout = disk_timeout_default
+        if (collector_timeout is not None) and (collector_timeout < disk_timeout + disk_timeout_margin):
+            log_stream.warning(' ===> Collector "' + self.tool_name + '" timeout is set to ' +
+                               str(disk_timeout + disk_timeout_margin) + ' seconds to cover the disk timeout of ' +
+                               str(disk_timeout) + ' seconds')
+            collector_timeout = disk_timeout + disk_timeout_margin
+        return collector_timeout
+
+    def define_columns(self):
+        columns_name = []
+        for prefix_name in self.prefix_name_list:
+            columns_name += self.join_columns(prefix_name, ['total', 'used', 'free', 'percent'])
+        return columns_name
+
+    def get_plot_spec(self):
+        return [{'plot_name': 'plot_disk_info', 'prefix_name': prefix_name,
+                 'dframe_units': 'T', 'dframe_format': '{:0.5}'} for prefix_name in self.prefix_name_list]
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+@register_collector
+class CollectorDiskIO(CollectorBase):
+
+    tool_name = 'tool_info_disk_io'
+    fields_units = fields_rate_disk_io
+
+    def setup(self):
+        # disk path of the disk tool used by default (first path)
+        disk_path = self.tool_attrs.get('disk_path', None)
+        if disk_path is None:
+            disk_path = self.tool_context.get('tools', {}).get('tool_info_disk', {}).get('disk_path', None)
+        if isinstance(disk_path, list):
+            disk_path = disk_path[0]
+        self.disk_io_tracker = TrackerDiskIO(disk_path=disk_path)
+
+    def sample(self, obj_process_list=None):
+        return self.disk_io_tracker.get_disk_io_info(**self.tool_attrs)
+
+    def define_columns(self):
+        return self.join_columns(self.tool_attrs.get('prefix_name', 'disk_io'),
+                                 ['device'] + list(fields_rate_disk_io.keys()) + ['busy_percent'])
+
+    def get_plot_spec(self):
+        return [{'plot_name': 'plot_disk_io_info', 'prefix_name': self.tool_attrs.get('prefix_name', 'disk_io'),
+                 'dframe_units': 'M', 'units_bytes': 'B/s'}]
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+@register_collector
+class CollectorNetwork(CollectorBase):
+
+    tool_name = 'tool_info_network'
+    fields_units = fields_rate_network
+
+    def setup(self):
+        self.network_tracker = TrackerNetwork(network_interfaces=self.tool_attrs.get('network_interfaces', None))
+        self.prefix_name = self.tool_attrs.get('prefix_name', None)
+        if self.prefix_name is None:
+            self.prefix_name = 'network_{nic_name}'
+
+    def sample(self, obj_process_list=None):
+        return self.network_tracker.get_network_info(**self.tool_attrs)
+
+    def define_columns(self):
+        columns_name = []
+        for nic_name in self.network_tracker.network_interfaces:
+            columns_name += self.join_columns(self.prefix_name.format(nic_name=nic_name),
+                                              list(fields_rate_network.keys()))
+        return columns_name
+
+    def get_plot_spec(self):
+        return [{'plot_name': 'plot_network_info', 'prefix_name': self.prefix_name.format(nic_name=nic_name),
+                 'dframe_units': 'M', 'units_bytes': 'B/s'} for nic_name in self.network_tracker.network_interfaces]
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+@register_collector
+class CollectorPressure(CollectorBase):
+
+    tool_name = 'tool_info_pressure'
+    fields_units = fields_units_pressure
+
+    def setup(self):
+        self.pressure_tracker = TrackerPressure(
+            pressure_folder=self.tool_attrs.get('pressure_folder', '/proc/pressure'),
+            pressure_resources=self.tool_attrs.get('pressure_resources', None))
+
+    def sample(self, obj_process_list=None):
+        return self.pressure_tracker.get_pressure_info(**self.tool_attrs)
+
+    def define_columns(self):
+        pressure_fields = self.tool_attrs.get('pressure_fields', None)
+        if pressure_fields is None:
+            pressure_fields = ['avg10', 'avg60']
+        columns_name = []
+        for pressure_resource in self.pressure_tracker.pressure_resources:
+            for pressure_line in ['some', 'full']:
+                columns_name += self.join_columns(
+                    self.separator_name.join([self.tool_attrs.get('prefix_name', 'pressure'),
+                                              pressure_resource, pressure_line]),
+                    pressure_fields + ['total_delta'])
+        return columns_name
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+@register_collector
+class CollectorCPU(CollectorBase):
+
+    tool_name = 'tool_info_cpu'
+
+    def setup(self):
+        # samples of the cores preallocated for the analysis period
+        seconds_period = self.tool_context.get('seconds_period', None)
+        seconds_frequency = self.tool_context.get('seconds_frequency', None)
+        sample_n = None
+        if (seconds_period is not None) and (seconds_frequency is not None):
+            sample_n = int(np.ceil(seconds_period / seconds_frequency)) + 1
+        self.cpu_buffer = BufferCPU(sample_n=sample_n)
+
+    def sample(self, obj_process_list=None):
+        return self.cpu_buffer.update_buffer(**self.tool_attrs)
+
+    def define_columns(self):
+        return self.join_columns(self.tool_attrs.get('prefix_name', 'cpu'),
+                                 ['percent_mean', 'percent_max', 'percent_min', 'n'])
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+@register_collector
+class CollectorSystemLoad(CollectorBase):
+
+    tool_name = 'tool_info_system_load'
+
+    def sample(self, obj_process_list=None):
+        return get_system_load_info(**self.tool_attrs)
+
+    def define_columns(self):
+        return self.join_columns(self.tool_attrs.get('prefix_name', 'system_load'), ['1m', '5m', '15m'])
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+class BufferSamples:
+
+    # -------------------------------------------------------------------------------------
+    # Method to initialize class
+    def __init__(self, columns_name, sample_n=None, sample_dtype='float64'):
+
+        if sample_n is None:
+            sample_n = 1024
+
+        # samples preallocated for the columns of the collectors schema (time in nanoseconds)
+        self.columns_name = list(columns_name)
+        self.columns_index = {column_name: column_id for column_id, column_name in enumerate(self.columns_name)}
+        self.sample_n, self.sample_dtype = 0, sample_dtype
+        self.buffer_time = np.zeros(sample_n, dtype='int64')
+        self.buffer_values = np.full((sample_n, self.columns_name.__len__()), np.nan, dtype=sample_dtype)
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to extend the buffer (samples over the preallocated size)
+    def extend_buffer(self):
+        sample_max = self.buffer_time.shape[0]
+        self.buffer_time = np.concatenate([self.buffer_time, np.zeros(sample_max, dtype='int64')])
+        self.buffer_values = np.concatenate(
+            [self.buffer_values, np.full(self.buffer_values.shape, np.nan, dtype=self.sample_dtype)])
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to update the buffer (columns not defined in the schema are skipped)
+    def update_buffer(self, sample_time_ns, sample_collections):
+
+        if self.sample_n >= self.buffer_time.shape[0]:
+            self.extend_buffer()
+
+        sample_id = self.sample_n
+        self.buffer_time[sample_id] = sample_time_ns
+        for column_name, column_value in sample_collections.items():
+            column_id = self.columns_index.get(column_name, None)
+            if (column_id is not None) and (column_value is not None):
+                self.buffer_values[sample_id, column_id] = column_value
+        self.sample_n += 1
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to get the buffer (samples saved from the last reset)
+    def get_buffer(self):
+        return {'time': self.buffer_time[:self.sample_n].copy(),
+                'values': self.buffer_values[:self.sample_n, :].copy(),
+                'columns': np.array(self.columns_name)}
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to reset the buffer (preallocated samples reused)
+    def reset_buffer(self):
+        self.buffer_values[:self.sample_n, :] = np.nan
+        self.sample_n = 0
+    # -------------------------------------------------------------------------------------
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+class BufferOverhead:
+
+    # -------------------------------------------------------------------------------------
+    # Method to initialize class (calls of the analysis phases preallocated; shared by the collector threads)
+    def __init__(self, sample_n=None, percentiles=None):
+
+        if sample_n is None:
+            sample_n = 1024
+        if percentiles is None:
+            percentiles = [50, 95, 99]
+
+        self.phases_name, self.phases_last, self.percentiles = [], {}, percentiles
+        self.sample_n = 0
+        self.buffer_time = np.zeros(sample_n, dtype='int64')
+        self.buffer_phase = np.zeros(sample_n, dtype='int32')
+        self.buffer_values = np.full((sample_n, 3), np.nan, dtype='float64')
+        self.columns_name = ['wall', 'cpu', 'rss']
+
+        self.process_obj = psutil.Process(os.getpid())
+        self.process_time_start = time.monotonic()
+        self.process_cpu_start = sum(self.process_obj.cpu_times()[:2])
+        self.buffer_lock = threading.Lock()
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to extend the buffer (calls over the preallocated size)
+    def extend_buffer(self):
+        sample_max = self.buffer_time.shape[0]
+        self.buffer_time = np.concatenate([self.buffer_time, np.zeros(sample_max, dtype='int64')])
+        self.buffer_phase = np.concatenate([self.buffer_phase, np.zeros(sample_max, dtype='int32')])
+        self.buffer_values = np.concatenate(
+            [self.buffer_values, np.full(self.buffer_values.shape, np.nan, dtype='float64')])
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to start a phase (wall clock and cpu time of the calling thread)
+    @staticmethod
+    def start_phase():
+        return time.perf_counter(), time.thread_time()
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to stop a phase (wall and cpu seconds of the call and rss of the analysis process saved in the buffer)
+    def stop_phase(self, phase_name, phase_start):
+
+        phase_wall = time.perf_counter() - phase_start[0]
+        phase_cpu = time.thread_time() - phase_start[1]
+        try:
+            phase_rss = self.process_obj.memory_info().rss
+        except psutil.Error:
+            phase_rss = np.nan
+
+        with self.buffer_lock:
+            if phase_name not in self.phases_name:
+                self.phases_name.append(phase_name)
+            if self.sample_n >= self.buffer_time.shape[0]:
+                self.extend_buffer()
+
+            sample_id = self.sample_n
+            self.buffer_time[sample_id] = time.time_ns()
+            self.buffer_phase[sample_id] = self.phases_name.index(phase_name)
+            self.buffer_values[sample_id, :] = [phase_wall, phase_cpu, phase_rss]
+            self.sample_n += 1
+
+            self.phases_last[phase_name] = (phase_wall, phase_cpu, phase_rss)
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to measure a phase (function called in the thread of the phase)
+    def measure_phase(self, phase_name, phase_fx, *args, **kwargs):
+        phase_start = self.start_phase()
+        try:
+            return phase_fx(*args, **kwargs)
+        finally:
+            self.stop_phase(phase_name, phase_start)
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to get the phase info (last call of each phase; columns added to the report)
+    def get_phase_info(self, prefix_name='overhead', separator_name='_', value_format='{:.6f}'):
+
+        info_overhead_collections = {}
+        with self.buffer_lock:
+            phases_last = dict(self.phases_last)
+        for phase_name, (phase_wall, phase_cpu, phase_rss) in phases_last.items():
+            info_overhead_collections[separator_name.join([prefix_name, phase_name, 'wall'])] = float(
+                value_format.format(phase_wall))
+            info_overhead_collections[separator_name.join([prefix_name, phase_name, 'cpu'])] = float(
+                value_format.format(phase_cpu))
+        try:
+            info_overhead_collections[separator_name.join([prefix_name, 'rss'])] = self.process_obj.memory_info().rss
+        except psutil.Error:
+            info_overhead_collections[separator_name.join([prefix_name, 'rss'])] = None
+
+        return info_overhead_collections
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to get the buffer (calls saved from the start; phase name of each call)
+    def get_buffer(self):
+        with self.buffer_lock:
+            return {'time': self.buffer_time[:self.sample_n].copy(),
+                    'phase': np.array(self.phases_name, dtype=object)[self.buffer_phase[:self.sample_n]],
+                    'values': self.buffer_values[:self.sample_n, :].copy(),
+                    'columns': np.array(self.columns_name)}
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to get the summary (percentiles of wall and cpu seconds for each phase; cpu of the analysis process)
+    def get_summary(self):
+
+        obj_buffer = self.get_buffer()
+
+        summary_collections = {}
+        for phase_name in list(dict.fromkeys(obj_buffer['phase'].tolist())):
+            phase_values = obj_buffer['values'][obj_buffer['phase'] == phase_name]
+            phase_summary = {'calls': phase_values.shape[0]}
+            for column_id, column_name in enumerate(['wall', 'cpu']):
+                for percentile in self.percentiles:
+                    phase_summary[column_name + '_p' + str(percentile)] = float(
+                        np.nanpercentile(phase_values[:, column_id], percentile))
+                phase_summary[column_name + '_max'] = float(np.nanmax(phase_values[:, column_id]))
+                phase_summary[column_name + '_total'] = float(np.nansum(phase_values[:, column_id]))
+            phase_summary['rss_max'] = float(np.nanmax(phase_values[:, 2]))
+            summary_collections[phase_name] = phase_summary
+
+        # cpu of the analysis process over the elapsed time (all the threads)
+        process_time_elapsed = time.monotonic() - self.process_time_start
+        try:
+            process_cpu = sum(self.process_obj.cpu_times()[:2]) - self.process_cpu_start
+            process_rss = self.process_obj.memory_info().rss
+        except psutil.Error:
+            process_cpu, process_rss = np.nan, np.nan
+        summary_collections['process'] = {
+            'calls': 1, 'wall_total': process_time_elapsed, 'cpu_total': process_cpu,
+            'cpu_percent': 100.0 * process_cpu / process_time_elapsed if process_time_elapsed > 0 else np.nan,
+            'rss_max': float(np.nanmax(np.append(obj_buffer['values'][:, 2], process_rss)))}
+
+        return summary_collections
+    # -------------------------------------------------------------------------------------
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+@register_collector
+class CollectorHighFrequencyRSS(CollectorBase):
+
+    tool_name, tool_scope, tool_mode = 'tool_hf_rss', 'target', 'high_frequency'
+    fields_bytes = ['rss']
+
+    def setup(self):
+        self.prefix_name = self.tool_attrs.get('prefix_name', None)
+        if self.prefix_name is None:
+            self.prefix_name = 'hf_process_{proc_n}'
+        self.process_n = self.tool_attrs.get('process_n', None)
+        if self.process_n is None:
+            self.process_n = 1
+        self.page_size = os.sysconf('SC_PAGE_SIZE')
+
+    def sample(self, obj_process_list=None):
+        info_process_collections = {}
+        if obj_process_list is not None:
+            for obj_process_id, obj_process_step in enumerate(obj_process_list[:self.process_n]):
+                info_key = self.separator_name.join([self.prefix_name, 'rss']).format(proc_n=obj_process_id)
+                info_process_collections[info_key] = read_linux_statm(obj_process_step.pid, page_size=self.page_size)
+        return info_process_collections
+
+    def define_columns(self):
+        return [self.separator_name.join([self.prefix_name, 'rss']).format(proc_n=proc_n)
+                for proc_n in range(self.process_n)]
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+@register_collector
+class CollectorHighFrequencyCPU(CollectorBase):
+
+    tool_name, tool_mode = 'tool_hf_cpu', 'high_frequency'
+    fields_units = {field_name: 'ticks' for field_name in
+                    ['user', 'nice', 'system', 'idle', 'iowait', 'irq', 'softirq', 'steal']}
+
+    def sample(self, obj_process_list=None):
+        return {self.separator_name.join([self.tool_attrs.get('prefix_name', 'hf_cpu'), obj_key]): obj_value
+                for obj_key, obj_value in read_linux_stat_cpu().items()}
+
+    def define_columns(self):
+        return self.join_columns(self.tool_attrs.get('prefix_name', 'hf_cpu'), list(self.fields_units.keys()))
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+@register_collector
+class CollectorHighFrequencyPressure(CollectorBase):
+
+    tool_name, tool_mode = 'tool_hf_pressure', 'high_frequency'
+    fields_units = {'total': 'us'}
+
+    def setup(self):
+        self.pressure_folder = self.tool_attrs.get('pressure_folder', '/proc/pressure')
+        self.pressure_resources = self.tool_attrs.get('pressure_resources', None)
+        if self.pressure_resources is None:
+            self.pressure_resources = ['cpu', 'memory', 'io']
+
+    def sample(self, obj_process_list=None):
+        info_pressure_collection = {}
+        for pressure_resource in self.pressure_resources:
+            pressure_obj = read_linux_pressure(os.path.join(self.pressure_folder, pressure_resource))
+            for pressure_line, pressure_values in pressure_obj.items():
+                info_key = self.separator_name.join(
+                    [self.tool_attrs.get('prefix_name', 'hf_pressure'), pressure_resource, pressure_line, 'total'])
+                info_pressure_collection[info_key] = pressure_values.get('total', None)
+        return info_pressure_collection
+
+    def define_columns(self):
+        return [self.separator_name.join(
+            [self.tool_attrs.get('prefix_name', 'hf_pressure'), pressure_resource, pressure_line, 'total'])
+            for pressure_resource in self.pressure_resources for pressure_line in ['some', 'full']]
+
+# -------------------------------------------------------------------------------------
@@ -27,6 +27,14 @@ log_stream = logging.getLogger(logger_name)
 #######################################################################################
 
 
+# -------------------------------------------------------------------------------------
+# Method to define time axis (elapsed seconds of the samples; irregular time steps are kept)
+def define_time_axis(dframe_index):
+    time_index = pd.to_datetime(pd.Index(dframe_index))
+    return (time_index - time_index[0]).total_seconds().values
+# -------------------------------------------------------------------------------------
+
+
 # -------------------------------------------------------------------------------------
 # Method to plot disk information
 def plot_disk_info(dframe_analysis, dframe_file_path=None, columns_name=None,
@@ -58,6 +66,7 @@ def plot_disk_info(dframe_analysis, dframe_file_path=None, columns_name=None,
     dframe_amount_num = convert_dframe_string2num(dframe_amount_mixed)
 
     time_start, time_end = dframe_amount_num.index[0], dframe_amount_num.index[-1]
+    time_axis = define_time_axis(dframe_amount_num.index)
 
     if fig_title is None:
         fig_title = 'disk usage \n' \
@@ -68,9 +77,10 @@ def plot_disk_info(dframe_analysis, dframe_file_path=None, columns_name=None,
     top.set_title(fig_title, fontsize=10, fontweight="bold")
 
     # get plot dataframe 1
-    ax1 = dframe_amount_num.plot(ax=top, lw=1, colormap='jet', marker='.', markersize=2) # title=fig_title)
+    ax1 = dframe_amount_num.set_axis(time_axis, axis=0).plot(
+        ax=top, lw=1, colormap='jet', marker='.', markersize=2)  # title=fig_title)
     # get plot dataframe 2
-    ax2 = dframe_percent.plot(ax=bottom, lw=1, colormap='jet', marker='.', markersize=2, use_index=False)
+    ax2 = dframe_percent.set_axis(time_axis, axis=0).plot(ax=bottom, lw=1, colormap='jet', marker='.', markersize=2)
 
     # set axis and label 1
     # ax1.set_xticks(x_ticks, minor=True)
@@ -109,10 +119,10 @@ def plot_disk_info(dframe_analysis, dframe_file_path=None, columns_name=None,
 
     # x_ticks = pd.date_range(start=dframe_amount_num.index.min(), end=dframe_amount_num.index.max(), freq=fig_x_unit)
     top.xaxis.label.set_visible(False)
-    top.set_xticks(x_list)
+    top.set_xticks(time_axis[x_list])
     top.set_xticks([], minor=True)
     bottom.xaxis.set_visible(True)
-    bottom.set_xticks(x_list)
+    bottom.set_xticks(time_axis[x_list])
     bottom.set_xticks([], minor=True)
     date_ticks = []
     for date_select in dframe_amount_num.index[x_list]:
@@ -126,13 +136,164 @@ def plot_disk_info(dframe_analysis, dframe_file_path=None, columns_name=None,
         if not os.path.exists(dframe_file_folder):
             make_folder(dframe_file_folder)
         fig.savefig(dframe_file_path, dpi=fig_dpi)
+        # release figure (figures saved by a long running analysis)
+        plt.close(fig)
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to plot rate information (rates of the amount columns on the top panel, other columns on the bottom panel)
+def plot_rate_info(dframe_analysis, columns_top, columns_bottom, dframe_file_path=None,
+                   fig_name='rate', fig_y_label='rate', fig_x_label='time',
+                   fig_y_unit_1='M/s', fig_y_unit_2='%', fig_x_unit='seconds', fig_y_lim_2=None,
+                   fig_title=None, fig_dpi=150):
+
+    dframe_top = dframe_analysis.loc[:, columns_top].astype(float)
+    dframe_bottom = dframe_analysis.loc[:, columns_bottom].astype(float)
+
+    time_start, time_end = dframe_top.index[0], dframe_top.index[-1]
+    time_axis = define_time_axis(dframe_top.index)
+
+    if fig_title is None:
+        fig_title = fig_name + ' \n' \
+                    '== time start: "' + time_start + '" ::: time end: "' + time_end + '" == '
+
+    # plot figure
+    fig, (top, bottom) = plt.subplots(nrows=2, figsize=(10, 6))
+    top.set_title(fig_title, fontsize=10, fontweight="bold")
+
+    # get plot dataframe 1
+    ax1 = dframe_top.set_axis(time_axis, axis=0).plot(ax=top, lw=1, colormap='jet', marker='.', markersize=2)
+    # get plot dataframe 2
+    ax2 = dframe_bottom.set_axis(time_axis, axis=0).plot(ax=bottom, lw=1, colormap='jet', marker='.', markersize=2)
+
+    # set axis and label 1
+    ax1.grid('on', which='minor', axis='x')
+    ax1.grid('on', which='major', axis='x')
+    ax1.grid('on', which='minor', axis='y')
+    ax1.grid('on', which='major', axis='y')
+    ax1.set_ylabel(fig_y_label + ' [' + fig_y_unit_1 + ']', fontsize=8)
+    ax1.set_ylim(bottom=0)
+    ax1.tick_params(axis='both', labelsize=6)
+    plt.setp(ax1.get_xticklabels(), visible=False)
+    plt.setp(ax1.get_yticklabels(), visible=True)
+    ax1.legend(fontsize=6)
+
+    # set axis and label 2
+    ax2.grid('on', which='minor', axis='x')
+    ax2.grid('on', which='major', axis='x')
+    ax2.grid('on', which='minor', axis='y')
+    ax2.grid('on', which='major', axis='y')
+    ax2.set_xlabel(fig_x_label + ' [' + fig_x_unit + ']', fontsize=8)
+    ax2.set_ylabel(fig_y_label + ' [' + fig_y_unit_2 + ']', fontsize=8)
+    if fig_y_lim_2 is not None:
+        ax2.set_ylim(fig_y_lim_2)
+    else:
+        ax2.set_ylim(bottom=0)
+    ax2.tick_params(axis='both', labelsize=6)
+    plt.setp(ax2.get_xticklabels(), visible=True)
+    plt.setp(ax2.get_yticklabels(), visible=True)
+    ax2.legend(fontsize=6)
+
+    # set ticks
+    x_start = 0
+    x_med = round((len(dframe_top) - 1) / 2)
+    x_end = len(dframe_top) - 1
+    x_list = [x_start, x_med, x_end]
+
+    top.xaxis.label.set_visible(False)
+    top.set_xticks(time_axis[x_list])
+    top.set_xticks([], minor=True)
+    bottom.xaxis.set_visible(True)
+    bottom.set_xticks(time_axis[x_list])
+    bottom.set_xticks([], minor=True)
+    date_ticks = []
+    for date_select in dframe_top.index[x_list]:
+        date_ticks.append(date_select)
+    bottom.set_xticklabels(date_ticks)
+
+    # save figure
+    if dframe_file_path is not None:
+
+        dframe_file_folder, dframe_file_name = os.path.split(dframe_file_path)
+        if not os.path.exists(dframe_file_folder):
+            make_folder(dframe_file_folder)
+        fig.savefig(dframe_file_path, dpi=fig_dpi)
+        # release figure (figures saved by a long running analysis)
+        plt.close(fig)
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to plot disk io information
+def plot_disk_io_info(dframe_analysis, dframe_file_path=None, columns_name=None,
+                      prefix_name='disk_io', prefix_separator='_',
+                      fig_y_label='disk io', fig_x_label='time',
+                      fig_y_unit_1='M/s', fig_y_unit_2='%', fig_x_unit='seconds',
+                      fig_title=None, fig_dpi=150, **kwargs):
+
+    if prefix_name is None:
+        prefix_name = 'disk_io'
+    if prefix_separator is None:
+        prefix_separator = '_'
+    if columns_name is None:
+        columns_name = ['read_bytes_rate', 'write_bytes_rate', 'busy_percent']
+
+    columns_amount_tag, columns_percent_tag = [], []
+    for columns_step in columns_name:
+        columns_tmp = prefix_separator.join([prefix_name, columns_step])
+        if columns_tmp in list(dframe_analysis.columns):
+            if 'percent' in columns_tmp:
+                columns_percent_tag.append(columns_tmp)
+            else:
+                columns_amount_tag.append(columns_tmp)
+
+    plot_rate_info(dframe_analysis, columns_amount_tag, columns_percent_tag, dframe_file_path=dframe_file_path,
+                   fig_name='disk io', fig_y_label=fig_y_label, fig_x_label=fig_x_label,
+                   fig_y_unit_1=fig_y_unit_1, fig_y_unit_2=fig_y_unit_2, fig_x_unit=fig_x_unit, fig_y_lim_2=[0, 100],
+                   fig_title=fig_title, fig_dpi=fig_dpi)
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to plot network information
+def plot_network_info(dframe_analysis, dframe_file_path=None, columns_name=None,
+                      prefix_name='network', prefix_separator='_',
+                      fig_y_label='network', fig_x_label='time',
+                      fig_y_unit_1='M/s', fig_y_unit_2='packets/s', fig_x_unit='seconds',
+                      fig_title=None, fig_dpi=150, **kwargs):
+
+    if prefix_name is None:
+        prefix_name = 'network'
+    if prefix_separator is None:
+        prefix_separator = '_'
+    if columns_name is None:
+        columns_name = ['bytes_sent_rate', 'bytes_recv_rate', 'packets_sent_rate', 'packets_recv_rate',
+                        'errin_rate', 'errout_rate', 'dropin_rate', 'dropout_rate']
+
+    columns_amount_tag, columns_packets_tag = [], []
+    for columns_step in columns_name:
+        columns_tmp = prefix_separator.join([prefix_name, columns_step])
+        if columns_tmp in list(dframe_analysis.columns):
+            if 'bytes' in columns_tmp:
+                columns_amount_tag.append(columns_tmp)
+            else:
+                columns_packets_tag.append(columns_tmp)
+
+    plot_rate_info(dframe_analysis, columns_amount_tag, columns_packets_tag, dframe_file_path=dframe_file_path,
+                   fig_name=prefix_name.replace(prefix_separator, ' '), fig_y_label=fig_y_label,
+                   fig_x_label=fig_x_label, fig_y_unit_1=fig_y_unit_1, fig_y_unit_2=fig_y_unit_2,
+                   fig_x_unit=fig_x_unit, fig_title=fig_title, fig_dpi=fig_dpi)
 
 # -------------------------------------------------------------------------------------
 
 
 # -------------------------------------------------------------------------------------
 # Method to plot process information
-def plot_process_info(dframe_analysis, dframe_file_path=None, columns_name=None,
+def plot_process_info(dframe_analysis, dframe_file_path=None, columns_name=None, columns_peak=None,
                       prefix_name='process_memory', prefix_separator='_',
                       fig_y_label='process', fig_x_label='time',
                       fig_y_unit_1='G', fig_y_unit_2='%', fig_x_unit='seconds',
@@ -146,6 +307,8 @@ def plot_process_info(dframe_analysis, dframe_file_path=None, columns_name=None,
     if columns_name is None:
         columns_name = ['rss', 'vms', 'uss', 'shared', 'swap', 'data',
                         'percent_rss', 'percent_vms', 'percent_uss', 'percent_shared', 'percent_swap', 'percent_data']
+    if columns_peak is None:
+        columns_peak = []
 
     columns_amount_tag, columns_percent_tag = [], []
     for columns_step in columns_name:
@@ -156,12 +319,20 @@ def plot_process_info(dframe_analysis, dframe_file_path=None, columns_name=None,
             else:
                 columns_amount_tag.append(columns_tmp)
 
+    columns_peak_tag = []
+    for columns_step in columns_peak:
+        columns_tmp = prefix_separator.join([prefix_name, columns_step])
+        if columns_tmp in list(dframe_analysis.columns):
+            columns_peak_tag.append(columns_tmp)
+
     dframe_amount_mixed = dframe_analysis.loc[:, columns_amount_tag]
     dframe_percent = dframe_analysis.loc[:, columns_percent_tag]
+    dframe_peak = convert_dframe_string2num(dframe_analysis.loc[:, columns_peak_tag])
 
     dframe_amount_num = convert_dframe_string2num(dframe_amount_mixed)
 
     time_start, time_end = dframe_amount_num.index[0], dframe_amount_num.index[-1]
+    time_axis = define_time_axis(dframe_amount_num.index)
 
     if fig_title is None:
         fig_title = 'process memory \n' \
@@ -172,9 +343,14 @@ def plot_process_info(dframe_analysis, dframe_file_path=None, columns_name=None,
     top.set_title(fig_title, fontsize=10, fontweight="bold")
 
     # get plot dataframe 1
-    ax1 = dframe_amount_num.plot(ax=top, lw=2, colormap='jet', marker='.', markersize=5) # title=fig_title)
+    ax1 = dframe_amount_num.set_axis(time_axis, axis=0).plot(
+        ax=top, lw=2, colormap='jet', marker='.', markersize=5)  # title=fig_title)
+    # get plot peak envelope (high water mark reached between the previous and the current sample)
+    for column_peak in columns_peak_tag:
+        top.plot(time_axis, dframe_peak[column_peak].values, drawstyle='steps-pre', color='black', lw=1,
+                 ls='--', label=column_peak + ' (peak)')
     # get plot dataframe 2
-    ax2 = dframe_percent.plot(ax=bottom, lw=2, colormap='jet', marker='.', markersize=5, use_index=False)
+    ax2 = dframe_percent.set_axis(time_axis, axis=0).plot(ax=bottom, lw=2, colormap='jet', marker='.', markersize=5)
 
     # set axis and label 1
     # ax1.set_xticks(x_ticks, minor=True)
@@ -213,10 +389,10 @@ def plot_process_info(dframe_analysis, dframe_file_path=None, columns_name=None,
 
     # x_ticks = pd.date_range(start=dframe_amount_num.index.min(), end=dframe_amount_num.index.max(), freq=fig_x_unit)
     top.xaxis.label.set_visible(False)
-    top.set_xticks(x_list)
+    top.set_xticks(time_axis[x_list])
     top.set_xticks([], minor=True)
     bottom.xaxis.set_visible(True)
-    bottom.set_xticks(x_list)
+    bottom.set_xticks(time_axis[x_list])
     bottom.set_xticks([], minor=True)
     date_ticks = []
     for date_select in dframe_amount_num.index[x_list]:
@@ -230,6 +406,8 @@ def plot_process_info(dframe_analysis, dframe_file_path=None, columns_name=None,
         if not os.path.exists(dframe_file_folder):
             make_folder(dframe_file_folder)
         fig.savefig(dframe_file_path, dpi=fig_dpi)
+        # release figure (figures saved by a long running analysis)
+        plt.close(fig)
 
     pass
 # -------------------------------------------------------------------------------------
@@ -266,6 +444,7 @@ def plot_memory_info(dframe_analysis, dframe_file_path=None, columns_name=None,
     dframe_amount_num = convert_dframe_string2num(dframe_amount_mixed)
 
     time_start, time_end = dframe_amount_num.index[0], dframe_amount_num.index[-1]
+    time_axis = define_time_axis(dframe_amount_num.index)
 
     if fig_title is None:
         fig_title = 'memory analysis \n' \
@@ -276,9 +455,10 @@ def plot_memory_info(dframe_analysis, dframe_file_path=None, columns_name=None,
     top.set_title(fig_title, fontsize=10, fontweight="bold")
 
     # get plot dataframe 1
-    ax1 = dframe_amount_num.plot(ax=top, lw=2, colormap='jet', marker='.', markersize=5) # title=fig_title)
+    ax1 = dframe_amount_num.set_axis(time_axis, axis=0).plot(
+        ax=top, lw=2, colormap='jet', marker='.', markersize=5)  # title=fig_title)
     # get plot dataframe 2
-    ax2 = dframe_percent.plot(ax=bottom, lw=2, colormap='jet', marker='.', markersize=5, use_index=False)
+    ax2 = dframe_percent.set_axis(time_axis, axis=0).plot(ax=bottom, lw=2, colormap='jet', marker='.', markersize=5)
 
     # set axis and label 1
     # ax1.set_xticks(x_ticks, minor=True)
@@ -317,10 +497,10 @@ def plot_memory_info(dframe_analysis, dframe_file_path=None, columns_name=None,
 
     # x_ticks = pd.date_range(start=dframe_amount_num.index.min(), end=dframe_amount_num.index.max(), freq=fig_x_unit)
     top.xaxis.label.set_visible(False)
-    top.set_xticks(x_list)
+    top.set_xticks(time_axis[x_list])
     top.set_xticks([], minor=True)
     bottom.xaxis.set_visible(True)
-    bottom.set_xticks(x_list)
+    bottom.set_xticks(time_axis[x_list])
     bottom.set_xticks([], minor=True)
     date_ticks = []
     for date_select in dframe_amount_num.index[x_list]:
@@ -334,5 +514,7 @@ def plot_memory_info(dframe_analysis, dframe_file_path=None, columns_name=None,
         if not os.path.exists(dframe_file_folder):
             make_folder(dframe_file_folder)
         fig.savefig(dframe_file_path, dpi=fig_dpi)
+        # release figure (figures saved by a long running analysis)
+        plt.close(fig)
 
 # -------------------------------------------------------------------------------------
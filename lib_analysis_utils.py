@@ -10,8 +10,8 @@ Version:       '1.0.0'
 #######################################################################################
 # Libraries
 import logging
-import subprocess
 import math
+import os
 import re
 import numpy as np
 import psutil
@@ -27,104 +27,235 @@ log_stream = logging.getLogger(logger_name)
 
 
 # -------------------------------------------------------------------------------------
-# Method to get sysctl value
-def get_memory_sysctl_value(key):
-    command = "sysctl %s" % key
-    line = subprocess.check_output(command, shell=True).strip()
-    line_sp = line.split()
-    return line_sp[2].decode("utf-8")
+# Method to read meminfo file (values in bytes)
+def read_linux_meminfo(file_name='/proc/meminfo'):
+    meminfo_obj = {}
+    with open(file_name, 'r') as file_handle:
+        for line in file_handle:
+            line_parts = line.split()
+            if line_parts.__len__() < 2:
+                continue
+            meminfo_key, meminfo_value = line_parts[0].rstrip(':'), int(line_parts[1])
+            if line_parts.__len__() > 2 and line_parts[2] == 'kB':
+                meminfo_value = meminfo_value * 1024
+            meminfo_obj[meminfo_key] = meminfo_value
+    return meminfo_obj
 # -------------------------------------------------------------------------------------
 
 
 # -------------------------------------------------------------------------------------
-# Method to get memory usage by linux command
-def get_linux_memory_usage(advices=True):
+# Method to read swappiness file
+def read_linux_swappiness(file_name='/proc/sys/vm/swappiness'):
+    with open(file_name, 'r') as file_handle:
+        swappiness_value = int(file_handle.read().strip())
+    return swappiness_value
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to read vmstat file (selected counters; swap in/out defined in pages)
+def read_linux_vmstat(file_name='/proc/vmstat', fields_name=('pswpin', 'pswpout')):
+    vmstat_obj = {}
+    with open(file_name, 'r') as file_handle:
+        for line in file_handle:
+            line_parts = line.split()
+            if (line_parts.__len__() == 2) and (line_parts[0] in fields_name):
+                vmstat_obj[line_parts[0]] = int(line_parts[1])
+    return vmstat_obj
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to get memory usage by linux proc files (values in bytes)
+def get_linux_memory_usage(advices=True,
+                           file_meminfo='/proc/meminfo', file_swappiness='/proc/sys/vm/swappiness'):
 
     # virtual_memory_header = 'total used free shared buff/cache available'
     # swap_memory_header = 'total used free'
 
-    size_name_long = ("B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
-    size_name_short = ("B", "K", "M", "G", "T", "P", "E", "Z", "Y")
-
-    command = "free -h"
-    all_info = subprocess.check_output(command, shell=True).strip()
-
-    virtual_memory_total, virtual_memory_used, virtual_memory_free = None, None, None
-    virtual_memory_shared, virtual_memory_filesystem_cache, virtual_memory_available = None, None, None
-    swap_memory_total, swap_memory_used, swap_memory_free, swap_memory_swappiness = None, None, None, None
-    for line in all_info.decode("utf-8").split("\n"):
-
-        if 'total' in line:
-            line_header = line.split()
-
-        if "Mem:" in line:
-            line_virtual_memory = line.split()
-            virtual_memory_total = line_virtual_memory[1]
-            virtual_memory_used = line_virtual_memory[2]
-            virtual_memory_free = line_virtual_memory[3]
-            virtual_memory_shared = line_virtual_memory[4]
-            virtual_memory_filesystem_cache = line_virtual_memory[5]
-            virtual_memory_available = line_virtual_memory[6]
-
-        if "Swap:" in line:
-            line_swap_memory = line.split()
-            swap_memory_total = line_swap_memory[1]
-            swap_memory_used = line_swap_memory[2]
-            swap_memory_free = line_swap_memory[3]
-            swap_memory_swappiness = int(get_memory_sysctl_value('vm.swappiness'))
-
-            if (swap_memory_swappiness <= 10) and (swap_memory_swappiness > 0):
-                log_stream.info(' ------> Swappiness value is good [value = "' + str(swap_memory_swappiness) + '"]')
-            elif swap_memory_swappiness == 0:
-                log_stream.warning(' ===> Swappiness value 0 is dangerous, '
-                                   'set it to 5 [value = "' + str(swap_memory_swappiness) + '"]')
-            else:
-                log_stream.warning(' ===> Swappiness value is to high, '
-                                   'set it to a value between 1 and 10 [value = "' + str(swap_memory_swappiness) + '"]')
+    meminfo_obj = read_linux_meminfo(file_meminfo)
+
+    # virtual memory (same definitions used by "free")
+    virtual_memory_total = meminfo_obj.get('MemTotal', 0)
+    virtual_memory_free = meminfo_obj.get('MemFree', 0)
+    virtual_memory_shared = meminfo_obj.get('Shmem', 0)
+    virtual_memory_filesystem_cache = \
+        meminfo_obj.get('Buffers', 0) + meminfo_obj.get('Cached', 0) + meminfo_obj.get('SReclaimable', 0)
+    virtual_memory_available = meminfo_obj.get('MemAvailable', virtual_memory_free)
+    virtual_memory_used = virtual_memory_total - virtual_memory_free - virtual_memory_filesystem_cache
+    if virtual_memory_used < 0:
+        virtual_memory_used = virtual_memory_total - virtual_memory_free
+    virtual_memory_percent = 0.0
+    if virtual_memory_total > 0:
+        virtual_memory_percent = round((virtual_memory_total - virtual_memory_available) /
+                                       virtual_memory_total * 100, 1)
+
+    # swap memory
+    swap_memory_total = meminfo_obj.get('SwapTotal', 0)
+    swap_memory_free = meminfo_obj.get('SwapFree', 0)
+    swap_memory_used = swap_memory_total - swap_memory_free
+    swap_memory_percent = 0.0
+    if swap_memory_total > 0:
+        swap_memory_percent = round(swap_memory_used / swap_memory_total * 100, 1)
+    swap_memory_swappiness = read_linux_swappiness(file_swappiness)
+
+    if advices:
+        if (swap_memory_swappiness <= 10) and (swap_memory_swappiness > 0):
+            log_stream.info(' ------> Swappiness value is good [value = "' + str(swap_memory_swappiness) + '"]')
+        elif swap_memory_swappiness == 0:
+            log_stream.warning(' ===> Swappiness value 0 is dangerous, '
+                               'set it to 5 [value = "' + str(swap_memory_swappiness) + '"]')
+        else:
+            log_stream.warning(' ===> Swappiness value is to high, '
+                               'set it to a value between 1 and 10 [value = "' + str(swap_memory_swappiness) + '"]')
 
     virtual_memory_usage = {
         'total': virtual_memory_total, 'used': virtual_memory_used,
         'free': virtual_memory_free, 'shared': virtual_memory_shared,
-        'filesystem_buff_cache': virtual_memory_filesystem_cache, 'available': virtual_memory_available
+        'filesystem_buff_cache': virtual_memory_filesystem_cache, 'available': virtual_memory_available,
+        'percent': virtual_memory_percent,
+        'active': meminfo_obj.get('Active', 0), 'inactive': meminfo_obj.get('Inactive', 0),
+        'buffers': meminfo_obj.get('Buffers', 0),
+        'cached': meminfo_obj.get('Cached', 0) + meminfo_obj.get('SReclaimable', 0),
+        'dirty': meminfo_obj.get('Dirty', 0), 'writeback': meminfo_obj.get('Writeback', 0),
+        'slab': meminfo_obj.get('Slab', 0),
+        'commit_limit': meminfo_obj.get('CommitLimit', 0), 'committed_as': meminfo_obj.get('Committed_AS', 0)
         }
     swap_memory_usage = {'total': swap_memory_total, 'used': swap_memory_used,
-                         'free': swap_memory_free, 'swappiness': swap_memory_swappiness}
-
-    for vm_key, vm_value in virtual_memory_usage.items():
-        if isinstance(vm_value, str):
-            vm_numeric, vm_units = split_size_parts(vm_value)
-            if vm_units.__len__() == 2:
-                vm_units = vm_units[0]
-                if vm_units not in size_name_short:
-                    log_stream.error(' ===> Variable "vm_units" not available in default values')
-                    raise NotImplemented('Case not implemented yet')
-            vm_memory = ''.join([vm_numeric, vm_units])
-        elif isinstance(vm_value, int):
-            vm_memory = deepcopy(vm_value)
-        else:
-            log_stream.error(' ===> Variable "vm_value" type is not supported')
-            raise NotImplemented('Case not implemented yet')
+                         'free': swap_memory_free, 'percent': swap_memory_percent,
+                         'swappiness': swap_memory_swappiness}
 
-        virtual_memory_usage[vm_key] = vm_memory
-
-    for sm_key, sm_value in swap_memory_usage.items():
-        if isinstance(sm_value, str):
-            sm_numeric, sm_units = split_size_parts(sm_value)
-            if sm_units.__len__() == 2:
-                sm_units = sm_units[0]
-                if sm_units not in size_name_short:
-                    log_stream.error(' ===> Variable "vm_units" not available in default values')
-                    raise NotImplemented('Case not implemented yet')
-            sm_memory = ''.join([sm_numeric, sm_units])
-        elif isinstance(sm_value, int):
-            sm_memory = deepcopy(sm_value)
-        else:
-            log_stream.error(' ===> Variable "vm_value" type is not supported')
-            raise NotImplemented('Case not implemented yet')
+    return virtual_memory_usage, swap_memory_usage
+# -------------------------------------------------------------------------------------
 
-        swap_memory_usage[sm_key] = sm_memory
 
-    return virtual_memory_usage, swap_memory_usage
+# -------------------------------------------------------------------------------------
+# Method to read cgroup path of a process (cgroup v2 unified hierarchy; None if not available)
+def read_linux_cgroup_path(process_pid, proc_root='/proc'):
+    file_name = os.path.join(proc_root, str(process_pid), 'cgroup')
+    if not os.path.exists(file_name):
+        return None
+    with open(file_name, 'r') as file_handle:
+        for line in file_handle:
+            line_parts = line.strip().split(':', 2)
+            if (line_parts.__len__() == 3) and (line_parts[0] == '0') and (line_parts[1] == ''):
+                return line_parts[2]
+    return None
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to define cgroup root (cgroup v2 mount point; unified folder for the hybrid hierarchy)
+def define_linux_cgroup_root(cgroup_root='/sys/fs/cgroup'):
+    for cgroup_root_step in [cgroup_root, os.path.join(cgroup_root, 'unified')]:
+        if os.path.exists(os.path.join(cgroup_root_step, 'cgroup.controllers')):
+            return cgroup_root_step
+    return None
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to read cgroup file value (single value file; "max" defined by NoneType)
+def read_linux_cgroup_value(file_name):
+    if not os.path.exists(file_name):
+        return None
+    with open(file_name, 'r') as file_handle:
+        file_value = file_handle.read().strip()
+    if file_value == 'max':
+        return None
+    return int(file_value)
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to read cgroup file keys (flat keyed file, e.g. memory.stat, memory.events, cpu.stat)
+def read_linux_cgroup_keys(file_name):
+    cgroup_obj = {}
+    if not os.path.exists(file_name):
+        return cgroup_obj
+    with open(file_name, 'r') as file_handle:
+        for line in file_handle:
+            line_parts = line.split()
+            if line_parts.__len__() == 2:
+                cgroup_obj[line_parts[0]] = int(line_parts[1])
+    return cgroup_obj
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to read cgroup io stat (nested keyed file; values summed over the devices)
+def read_linux_cgroup_io(file_name):
+    cgroup_obj = {}
+    if not os.path.exists(file_name):
+        return cgroup_obj
+    with open(file_name, 'r') as file_handle:
+        for line in file_handle:
+            for line_field in line.split()[1:]:
+                if '=' in line_field:
+                    field_key, field_value = line_field.split('=', 1)
+                    cgroup_obj[field_key] = cgroup_obj.get(field_key, 0) + int(field_value)
+    return cgroup_obj
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to read pressure file (psi lines "some|full avg10=.. avg60=.. avg300=.. total=..")
+def read_linux_pressure(file_name):
+    pressure_obj = {}
+    if not os.path.exists(file_name):
+        return pressure_obj
+    with open(file_name, 'r') as file_handle:
+        for line in file_handle:
+            line_parts = line.split()
+            if line_parts.__len__() < 2:
+                continue
+            pressure_fields = {}
+            for line_field in line_parts[1:]:
+                field_key, field_value = line_field.split('=', 1)
+                pressure_fields[field_key] = int(field_value) if field_key == 'total' else float(field_value)
+            pressure_obj[line_parts[0]] = pressure_fields
+    return pressure_obj
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to read statm file of a process (resident set size in bytes; None if the process is terminated)
+def read_linux_statm(process_pid, proc_root='/proc', page_size=None):
+    if page_size is None:
+        page_size = os.sysconf('SC_PAGE_SIZE')
+    try:
+        with open(os.path.join(proc_root, str(process_pid), 'statm'), 'r') as file_handle:
+            file_parts = file_handle.read().split()
+    except (FileNotFoundError, ProcessLookupError):
+        return None
+    return int(file_parts[1]) * page_size
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to read status file of a process (peak memory fields in bytes; None if the process is terminated)
+def read_linux_status_memory(process_pid, proc_root='/proc', fields_name=('VmPeak', 'VmHWM')):
+    try:
+        with open(os.path.join(proc_root, str(process_pid), 'status'), 'r') as file_handle:
+            file_lines = file_handle.readlines()
+    except (FileNotFoundError, ProcessLookupError):
+        return None
+    status_memory = {}
+    for file_line in file_lines:
+        line_key, _, line_value = file_line.partition(':')
+        if line_key in fields_name:
+            status_memory[line_key] = int(line_value.split()[0]) * 1024
+    return status_memory
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to read stat file (cumulative ticks of all the cpus)
+def read_linux_stat_cpu(file_name='/proc/stat',
+                        fields_name=('user', 'nice', 'system', 'idle', 'iowait', 'irq', 'softirq', 'steal')):
+    with open(file_name, 'r') as file_handle:
+        file_parts = file_handle.readline().split()
+    return {field_name: int(field_value) for field_name, field_value in zip(fields_name, file_parts[1:])}
 # -------------------------------------------------------------------------------------
 
 
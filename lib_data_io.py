@@ -10,16 +10,31 @@ Version:       '1.0.0'
 # Library
 import logging
 import os
+import glob
+import re
 import csv
 import pickle
 import json
 
+import numpy as np
 import pandas as pd
 
 from lib_info_args import logger_name
 
+# Optional library (arrow columnar format; npz columnar format used if not available)
+try:
+    import pyarrow
+    import pyarrow.feather
+    import pyarrow.ipc
+except ImportError:
+    pyarrow = None
+
 # Logging
 log_stream = logging.getLogger(logger_name)
+
+# Columnar formats (file extension of each format) and suffix of the part files (batches of a columnar file)
+columnar_formats = {'arrow': '.arrow', 'npz': '.npz'}
+columnar_part_suffix = '.part'
 #######################################################################################
 
 
@@ -36,6 +51,14 @@ def read_json(file_name):
 # -------------------------------------------------------------------------------------
 
 
+# -------------------------------------------------------------------------------------
+# Method to write file json
+def write_json(file_name, file_data, file_indent=4):
+    with open(file_name, 'w') as file_handle:
+        json.dump(file_data, file_handle, indent=file_indent)
+# -------------------------------------------------------------------------------------
+
+
 # -------------------------------------------------------------------------------------
 # Method to write csv file
 def write_csv(file_name, file_dframe, file_separator=';'):
@@ -95,3 +118,419 @@ def write_obj(file_name, data):
     with open(file_name, 'wb') as handle:
         pickle.dump(data, handle, protocol=pickle.HIGHEST_PROTOCOL)
 # -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to read file array (numpy compressed archive)
+def read_array(file_name):
+    if os.path.exists(file_name):
+        with np.load(file_name, allow_pickle=False) as file_handle:
+            data = {file_key: file_handle[file_key] for file_key in file_handle.files}
+    else:
+        log_stream.warning(' ===> File "' + file_name + '" not found. Data will be initialized by NoneType')
+        data = None
+    return data
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to write file array (numpy compressed archive)
+def write_array(file_name, data):
+    if os.path.exists(file_name):
+        os.remove(file_name)
+    with open(file_name, 'wb') as handle:
+        np.savez_compressed(handle, **data)
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to read file pickle stream (batches appended to the file; truncated last batch skipped)
+def read_obj_stream(file_name, index_name='time'):
+
+    if not os.path.exists(file_name):
+        log_stream.warning(' ===> File "' + file_name + '" not found. Data will be initialized by NoneType')
+        return None
+
+    file_index, file_rows, file_units = [], [], {}
+    with open(file_name, 'rb') as handle:
+        while True:
+            try:
+                file_batch = pickle.load(handle)
+            except EOFError:
+                break
+            except (pickle.UnpicklingError, ValueError, TypeError, AttributeError, IndexError):
+                log_stream.warning(' ===> File "' + file_name + '" ends with a truncated batch. Batch skipped')
+                break
+
+            # file saved by a single dframe (previous workspace format)
+            if isinstance(file_batch, pd.DataFrame):
+                return file_batch
+
+            file_index += file_batch['index']
+            file_rows += file_batch['rows']
+            file_units.update(file_batch['units'])
+
+    if not file_rows:
+        return None
+
+    file_dframe = pd.DataFrame(data=file_rows, index=file_index)
+    file_dframe.index.name = index_name
+    file_dframe.attrs['units'] = file_units
+
+    return file_dframe
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to define the columnar format (arrow format replaced by npz format if pyarrow is not available)
+def define_columnar_format(file_format):
+    if file_format not in list(columnar_formats.keys()):
+        log_stream.error(' ===> Columnar format "' + str(file_format) + '" is not supported')
+        raise ValueError('Columnar format "' + str(file_format) + '" is not supported. Allowed formats are ' +
+                         str(list(columnar_formats.keys())))
+    if (file_format == 'arrow') and (pyarrow is None):
+        log_stream.warning(' ===> Library "pyarrow" is not available. Columnar format "npz" is used')
+        file_format = 'npz'
+    return file_format
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to define dframe schema (dtype of each column; numeric columns as float64, other columns as str)
+def define_dframe_schema(file_dframe, file_schema=None):
+
+    dframe_schema = dict(file_schema) if file_schema is not None else {}
+    for column_name in list(file_dframe.columns):
+        if column_name in dframe_schema:
+            continue
+        column_type = pd.api.types.infer_dtype(file_dframe[column_name], skipna=True)
+        if column_type in ['integer', 'floating', 'mixed-integer-float', 'boolean', 'decimal', 'empty']:
+            dframe_schema[column_name] = 'float64'
+        else:
+            dframe_schema[column_name] = 'str'
+    return dframe_schema
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to apply dframe schema (values cast to the dtype of the column; null values as nan or empty string)
+def apply_dframe_schema(file_dframe, file_schema):
+
+    dframe_data = {}
+    for column_name in list(file_dframe.columns):
+        column_values = file_dframe[column_name]
+        if file_schema[column_name] == 'float64':
+            if not pd.api.types.is_numeric_dtype(column_values):
+                column_values = pd.to_numeric(column_values, errors='coerce')
+            dframe_data[column_name] = column_values.to_numpy(dtype='float64')
+        else:
+            dframe_data[column_name] = column_values.astype(object).where(column_values.notna(), '').astype(str)
+
+    file_dframe_typed = pd.DataFrame(data=dframe_data, index=file_dframe.index, columns=list(file_dframe.columns))
+    return file_dframe_typed
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to write file columnar (arrow or npz; explicit schema saved with the data; file replaced atomically)
+def write_columnar(file_name, file_dframe, file_units=None, file_schema=None, file_format=None, file_parts=None):
+
+    if file_format is None:
+        file_format = 'arrow' if os.path.splitext(file_name)[1] == columnar_formats['arrow'] else 'npz'
+    if file_units is None:
+        file_units = {}
+
+    file_schema = define_dframe_schema(file_dframe, file_schema)
+    file_dframe = apply_dframe_schema(file_dframe, file_schema)
+    file_columns = list(file_dframe.columns)
+    file_index_name = file_dframe.index.name if file_dframe.index.name is not None else 'time'
+
+    file_meta = json.dumps({'columns': file_columns, 'dtypes': [file_schema[column] for column in file_columns],
+                            'units': file_units, 'index_name': file_index_name,
+                            'parts': file_parts if file_parts is not None else []})
+    file_index = pd.to_datetime(file_dframe.index).to_numpy(dtype='datetime64[ns]').view('int64')
+
+    file_name_tmp = file_name + '.tmp'
+    if file_format == 'arrow':
+        file_table = pyarrow.table(
+            [pyarrow.array(file_index, type=pyarrow.int64())] +
+            [pyarrow.array(file_dframe[column].to_numpy(dtype=file_schema[column])) for column in file_columns],
+            names=[file_index_name] + file_columns)
+        file_table = file_table.replace_schema_metadata({'ruler': file_meta})
+        pyarrow.feather.write_feather(file_table, file_name_tmp)
+        with open(file_name_tmp, 'rb+') as handle:
+            os.fsync(handle.fileno())
+    else:
+        # numeric columns saved in one block; string columns saved by codes of the strings table (repeated strings
+        # of the process fields saved once)
+        columns_num = [column for column in file_columns if file_schema[column] == 'float64']
+        columns_str = [column for column in file_columns if file_schema[column] == 'str']
+        file_codes, file_strings = pd.factorize(file_dframe[columns_str].to_numpy(dtype=str).ravel())
+        file_arrays = {
+            'time': file_index, 'schema': np.array(file_meta),
+            'values': file_dframe[columns_num].to_numpy(dtype='float64'),
+            'codes': file_codes.astype('int32').reshape(file_index.shape[0], columns_str.__len__()),
+            'strings': np.array(file_strings, dtype=str)}
+        with open(file_name_tmp, 'wb') as handle:
+            np.savez(handle, **file_arrays)
+            handle.flush()
+            os.fsync(handle.fileno())
+    os.replace(file_name_tmp, file_name)
+
+    return file_schema
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to read file columnar part (one file; dtypes and units defined by the schema saved with the data)
+def read_columnar_file(file_name, file_format=None):
+
+    if file_format is None:
+        file_format = 'arrow' if os.path.splitext(file_name)[1] == columnar_formats['arrow'] else 'npz'
+
+    if file_format == 'arrow':
+        if pyarrow is None:
+            log_stream.error(' ===> Library "pyarrow" is needed to read the file "' + file_name + '"')
+            raise RuntimeError('Library pyarrow is not available')
+        file_table = pyarrow.feather.read_table(file_name)
+        file_meta = json.loads(file_table.schema.metadata[b'ruler'])
+        file_index = file_table.column(file_meta['index_name']).to_numpy()
+        file_data = {column_name: file_table.column(column_name).to_numpy()
+                     for column_name in file_meta['columns']}
+    else:
+        with np.load(file_name, allow_pickle=False) as file_handle:
+            file_meta = json.loads(str(file_handle['schema']))
+            file_index = file_handle['time']
+            file_values, file_codes = file_handle['values'], file_handle['codes']
+            file_strings = file_handle['strings'].astype(object)
+        columns_num = [column for column, dtype in zip(file_meta['columns'], file_meta['dtypes']) if dtype == 'float64']
+        columns_str = [column for column, dtype in zip(file_meta['columns'], file_meta['dtypes']) if dtype == 'str']
+        file_data = {column: file_values[:, column_id] for column_id, column in enumerate(columns_num)}
+        file_data.update(
+            {column: file_strings[file_codes[:, column_id]] for column_id, column in enumerate(columns_str)})
+
+    file_dframe = pd.DataFrame(data=file_data, index=pd.to_datetime(file_index, unit='ns'),
+                               columns=file_meta['columns'])
+    file_dframe.index.name = file_meta['index_name']
+    file_dframe.attrs['units'] = file_meta['units']
+    file_dframe.attrs['schema'] = dict(zip(file_meta['columns'], file_meta['dtypes']))
+    file_dframe.attrs['parts'] = file_meta.get('parts', [])
+
+    return file_dframe
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to read file columnar meta (schema saved with the data; data not loaded)
+def read_columnar_meta(file_name):
+    if os.path.splitext(file_name)[1] == columnar_formats['arrow']:
+        if pyarrow is None:
+            log_stream.error(' ===> Library "pyarrow" is needed to read the file "' + file_name + '"')
+            raise RuntimeError('Library pyarrow is not available')
+        with pyarrow.ipc.open_file(file_name) as file_handle:
+            return json.loads(file_handle.schema.metadata[b'ruler'])
+    with np.load(file_name, allow_pickle=False) as file_handle:
+        return json.loads(str(file_handle['schema']))
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to search file columnar parts (batches appended to a columnar file; sorted by the part number)
+def search_columnar_parts(file_name):
+    file_pattern = re.compile(re.escape(os.path.basename(file_name) + columnar_part_suffix) + r'[0-9]+$')
+    file_parts = [file_part for file_part in glob.glob(glob.escape(file_name) + columnar_part_suffix + '*')
+                  if file_pattern.match(os.path.basename(file_part))]
+    return sorted(file_parts, key=define_columnar_part_n)
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to define file columnar part number (suffix of the part file)
+def define_columnar_part_n(file_part):
+    return int(file_part.rsplit(columnar_part_suffix, 1)[1])
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to read file columnar (arrow or npz; main file and parts not merged yet, parts merged in the main file
+# are skipped)
+def read_columnar(file_name):
+
+    file_parts = search_columnar_parts(file_name)
+    if (not os.path.exists(file_name)) and (not file_parts):
+        log_stream.warning(' ===> File "' + file_name + '" not found. Data will be initialized by NoneType')
+        return None
+
+    file_format = 'arrow' if os.path.splitext(file_name)[1] == columnar_formats['arrow'] else 'npz'
+
+    file_dframe_list, file_parts_merged = [], []
+    if os.path.exists(file_name):
+        file_dframe_list.append(read_columnar_file(file_name, file_format=file_format))
+        file_parts_merged = file_dframe_list[0].attrs['parts']
+    for file_part in file_parts:
+        if os.path.basename(file_part) not in file_parts_merged:
+            file_dframe_list.append(read_columnar_file(file_part, file_format=file_format))
+
+    if file_dframe_list.__len__() == 1:
+        file_dframe = file_dframe_list[0]
+    else:
+        file_units, file_schema = {}, {}
+        for file_dframe_step in file_dframe_list:
+            file_units.update(file_dframe_step.attrs['units'])
+            file_schema.update(file_dframe_step.attrs['schema'])
+        file_dframe = pd.concat(file_dframe_list, axis=0)
+        file_dframe.index.name = file_dframe_list[0].index.name
+        file_dframe.attrs['units'], file_dframe.attrs['schema'] = file_units, file_schema
+    if file_parts:
+        file_dframe.attrs['parts'] = [os.path.basename(file_part) for file_part in file_parts]
+
+    return file_dframe
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to merge file columnar parts (parts saved in the main file and removed; merged parts recorded in the main
+# file to skip the parts left by an interrupted merge)
+def merge_columnar(file_name):
+
+    file_parts = search_columnar_parts(file_name)
+    if not file_parts:
+        return False
+
+    file_dframe = read_columnar(file_name)
+    file_format = 'arrow' if os.path.splitext(file_name)[1] == columnar_formats['arrow'] else 'npz'
+    write_columnar(file_name, file_dframe, file_units=file_dframe.attrs['units'],
+                   file_schema=file_dframe.attrs['schema'], file_format=file_format,
+                   file_parts=file_dframe.attrs['parts'])
+    for file_part in file_parts:
+        os.remove(file_part)
+
+    return True
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to read file workspace (columnar or pickle format defined by the file extension)
+def read_workspace(file_name, index_name='time'):
+    if os.path.splitext(file_name)[1] in list(columnar_formats.values()):
+        return read_columnar(file_name)
+    return read_obj_stream(file_name, index_name=index_name)
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Class to write file segment (pickle: rows buffered in memory and appended by batches; columnar: first batch saved
+# in the main file, next batches saved in the part files and merged when the segment is closed)
+class WriterSegment:
+
+    # -------------------------------------------------------------------------------------
+    # Method to initialize class
+    def __init__(self, flush_rows=None, file_format='pickle'):
+
+        if flush_rows is None:
+            flush_rows = 10
+
+        self.flush_rows = max(int(flush_rows), 1)
+        self.file_format = file_format
+        self.file_name, self.file_bytes = None, 0
+        self.batch_index, self.batch_rows, self.batch_units = [], [], {}
+        self.segment_schema, self.segment_part_n = None, 0
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to append a row (pending rows of the previous file flushed when the file changes)
+    def append_row(self, file_name, row_index, row_collections, row_units=None):
+
+        if file_name != self.file_name:
+            self.close_segment()
+            self.open_segment(file_name)
+
+        self.batch_index.append(row_index)
+        self.batch_rows.append(row_collections)
+        if row_units is not None:
+            self.batch_units = row_units
+
+        if self.batch_rows.__len__() >= self.flush_rows:
+            self.flush_rows_batch()
+            return True
+        return False
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to open the segment (columnar: schema and part number of an existing file)
+    def open_segment(self, file_name):
+
+        self.file_name = file_name
+        self.file_bytes = os.path.getsize(file_name) if os.path.exists(file_name) else 0
+        self.segment_schema, self.segment_part_n = None, 0
+
+        if (self.file_format != 'pickle') and os.path.exists(file_name):
+            file_meta = read_columnar_meta(file_name)
+            file_parts = search_columnar_parts(file_name)
+            self.segment_schema = dict(zip(file_meta['columns'], file_meta['dtypes']))
+            self.segment_part_n = max(
+                [define_columnar_part_n(file_part) for file_part in file_meta.get('parts', []) + file_parts] + [0])
+            self.file_bytes += sum([os.path.getsize(file_part) for file_part in file_parts])
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to flush the rows batch (batch synced to disk; flushed rows survive a crash)
+    def flush_rows_batch(self):
+
+        if (self.file_name is None) or (not self.batch_rows):
+            return False
+
+        file_folder = os.path.dirname(self.file_name)
+        if file_folder and (not os.path.exists(file_folder)):
+            os.makedirs(file_folder, exist_ok=True)
+
+        if self.file_format == 'pickle':
+            with open(self.file_name, 'ab') as handle:
+                pickle.dump({'index': self.batch_index, 'rows': self.batch_rows, 'units': self.batch_units},
+                            handle, protocol=pickle.HIGHEST_PROTOCOL)
+                handle.flush()
+                os.fsync(handle.fileno())
+                self.file_bytes = handle.tell()
+        else:
+            # batch saved in the main file (first batch) or in the next part file (the segment is not rewritten)
+            batch_dframe = pd.DataFrame(data=self.batch_rows, index=self.batch_index)
+            batch_dframe.index.name = 'time'
+            if not os.path.exists(self.file_name):
+                batch_file_name = self.file_name
+            else:
+                self.segment_part_n += 1
+                batch_file_name = self.file_name + columnar_part_suffix + '{:06d}'.format(self.segment_part_n)
+            self.segment_schema = write_columnar(
+                batch_file_name, batch_dframe, file_units=self.batch_units, file_schema=self.segment_schema,
+                file_format=self.file_format)
+            self.file_bytes += os.path.getsize(batch_file_name)
+
+        self.batch_index, self.batch_rows = [], []
+        return True
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to close the segment (pending rows flushed; columnar parts merged in the main file)
+    def close_segment(self):
+
+        segment_flushed = self.flush_rows_batch()
+        if (self.file_format != 'pickle') and (self.file_name is not None):
+            if merge_columnar(self.file_name):
+                self.file_bytes = os.path.getsize(self.file_name)
+        return segment_flushed
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to reset the writer (next row opens a new file)
+    def reset_writer(self):
+        self.close_segment()
+        self.file_name, self.file_bytes = None, 0
+        self.segment_schema, self.segment_part_n = None, 0
+    # -------------------------------------------------------------------------------------
+
+# -------------------------------------------------------------------------------------
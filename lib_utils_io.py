@@ -55,20 +55,22 @@ def filter_dframe_by_column(dframe_src, prefix_name=None, **kwargs):
 
 
 # -------------------------------------------------------------------------------------
-# Method to convert string to float
+# Method to convert string to float (numeric columns are kept as they are)
 def convert_dframe_string2num(dframe_src):
-    column_list = list(dframe_src.columns)
-    dframe_dst = pd.DataFrame()
-    for column_name in column_list:
-        dframe_dst[column_name] = dframe_src.apply(
-            lambda x: convert_string2num_value(x[column_name]), axis=1)
+    dframe_dst = dframe_src.copy()
+    for column_name in list(dframe_src.columns):
+        if dframe_src[column_name].dtype == object:
+            dframe_dst[column_name] = dframe_src[column_name].map(convert_string2num_value)
     return dframe_dst
 # -------------------------------------------------------------------------------------
 
 
 # -------------------------------------------------------------------------------------
-# Method to convert dframe human to bytes
-def convert_dframe_units(dframe_src, dframe_units='G', dframe_format='{:0.3}', prefix_name=None, **kwargs):
+# Method to convert dframe units (bytes columns scaled to the desired units)
+def convert_dframe_units(dframe_src, dframe_units='G', dframe_format='{:0.3}', prefix_name=None,
+                         dframe_units_src=None, units_bytes='B', **kwargs):
+
+    size_name_short = ("B", "K", "M", "G", "T", "P", "E", "Z", "Y")
 
     if isinstance(prefix_name, str):
         prefix_name = [prefix_name]
@@ -78,33 +80,37 @@ def convert_dframe_units(dframe_src, dframe_units='G', dframe_format='{:0.3}', p
         log_stream.error(' ===> Arguments "prefix_name" must be string or list')
         raise NotImplemented('Case not implemented yet')
 
-    dframe_dst = None
+    if dframe_units not in size_name_short:
+        log_stream.error(' ===> Variable "dframe_units" is not supported in short names')
+        raise NotImplemented('Case not implemented yet')
+    dframe_factor = 1024 ** size_name_short.index(dframe_units)
+
+    column_list = []
     for prefix_step in prefix_name:
-        column_list = list(dframe_src.columns[dframe_src.columns.str.startswith(prefix_step)])
+        for column_name in list(dframe_src.columns[dframe_src.columns.str.startswith(prefix_step)]):
+            if column_name not in column_list:
+                column_list.append(column_name)
 
-        if column_list:
+    dframe_dst = None
+    if column_list:
+        dframe_dst = dframe_src.loc[:, column_list].copy()
+
+        if dframe_units_src is not None:
+            # numeric bytes columns (units metadata) --> vectorized scaling
+            column_bytes = [column_name for column_name in column_list
+                            if dframe_units_src.get(column_name, None) == units_bytes]
+            if column_bytes:
+                dframe_dst[column_bytes] = dframe_dst[column_bytes].astype(float) / dframe_factor
+        else:
+            # human string columns (reports without units metadata)
             for column_name in column_list:
-
-                if dframe_dst is None:
-                    dframe_dst = pd.DataFrame()
-
-                # check column type
-                dframe_value = dframe_src[column_name][0]
-
+                dframe_value = dframe_src[column_name].iloc[0]
                 if isinstance(dframe_value, str) and 'percent' not in column_name:
-
                     dframe_first, dframe_last = dframe_value[0], dframe_value[-1]
                     if dframe_first.isnumeric() and dframe_last.isalpha():
-                        dframe_dst[column_name] = dframe_src.apply(
-                            lambda x: convert_human_unit(
-                                x[column_name], size_unit=dframe_units, size_format=dframe_format), axis=1)
-                    else:
-                        dframe_dst[column_name] = dframe_src[column_name]
-                elif not isinstance(dframe_value, str) and 'percent' in column_name:
-                    dframe_dst[column_name] = dframe_src[column_name]
-                elif not isinstance(dframe_value, str) and 'percent' not in column_name:
-                    dframe_dst[column_name] = dframe_src[column_name]
-                else:
+                        dframe_dst[column_name] = dframe_src[column_name].map(
+                            lambda x: convert_human_unit(x, size_unit=dframe_units, size_format=dframe_format))
+                elif isinstance(dframe_value, str) and 'percent' in column_name:
                     log_stream.error(' ===> Change units column for "' + column_name + '" is not supported')
                     raise NotImplemented('Case not implemented yet')
 
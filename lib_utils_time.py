@@ -11,6 +11,7 @@ Version:       '1.0.0'
 # Libraries
 import logging
 import re
+import time
 import pandas as pd
 
 from datetime import date
@@ -125,7 +126,7 @@ def set_chunks(time_range, time_delta='3H'):
 def convert_time_delta_to_seconds(time_delta):
     seconds_delta = None
     if time_delta is not None:
-        seconds_delta = pd.Timedelta(time_delta).seconds
+        seconds_delta = pd.Timedelta(time_delta).total_seconds()
     return seconds_delta
 # -------------------------------------------------------------------------------------
 
@@ -160,8 +161,8 @@ def check_time_delta_limits(time_delta_src, time_delta_min=None, time_delta_max=
 
         if (time_delta_min is not None) and (time_delta_max is None):
 
-            seconds_delta_src = pd.Timedelta(fill_time_delta_parts(time_delta_src)).seconds
-            seconds_delta_min = pd.Timedelta(fill_time_delta_parts(time_delta_min)).seconds
+            seconds_delta_src = pd.Timedelta(fill_time_delta_parts(time_delta_src)).total_seconds()
+            seconds_delta_min = pd.Timedelta(fill_time_delta_parts(time_delta_min)).total_seconds()
             if seconds_delta_src < seconds_delta_min:
                 time_delta_dst = deepcopy(time_delta_min)
                 log_stream.warning(' ===> Object "time_delta_src=' + time_delta_src +
@@ -171,8 +172,8 @@ def check_time_delta_limits(time_delta_src, time_delta_min=None, time_delta_max=
                 time_delta_dst = deepcopy(time_delta_src)
 
         elif (time_delta_min is None) and (time_delta_max is not None):
-            seconds_delta_src = pd.Timedelta(fill_time_delta_parts(time_delta_src)).seconds
-            seconds_delta_max = pd.Timedelta(fill_time_delta_parts(time_delta_max)).seconds
+            seconds_delta_src = pd.Timedelta(fill_time_delta_parts(time_delta_src)).total_seconds()
+            seconds_delta_max = pd.Timedelta(fill_time_delta_parts(time_delta_max)).total_seconds()
             if seconds_delta_src > seconds_delta_max:
                 time_delta_dst = deepcopy(time_delta_max)
                 log_stream.warning(' ===> Object "time_delta_src=' + time_delta_src +
@@ -205,3 +206,154 @@ def split_time_delta_parts(time_delta):
     time_frequency = re.findall("[a-zA-Z]+", time_delta)[0]
     return time_period, time_frequency
 # -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Class to schedule time ticks (absolute deadlines on the monotonic clock; overrun ticks are counted and skipped)
+class SchedulerTick:
+
+    # -------------------------------------------------------------------------------------
+    # Method to initialize class
+    def __init__(self, seconds_frequency, seconds_period=None):
+
+        self.tick_ns = int(seconds_frequency * 1e9)
+        self.period_ns = int(seconds_period * 1e9) if seconds_period is not None else None
+
+        self.time_start_ns, self.time_deadline_ns, self.time_sample_ns = None, None, None
+        # monotonic time of the sample (seconds; elapsed time between the samples not affected by the clock changes)
+        self.time_sample_monotonic = None
+        self.tick_n, self.tick_missed = 0, 0
+
+        # wait function (seconds --> true to stop the scheduler; sleep if not defined)
+        self.wait_fx, self.wait_stopped = None, False
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to start the scheduler (first tick at the start time)
+    def start(self):
+        self.time_start_ns = time.monotonic_ns()
+        self.time_deadline_ns = self.time_start_ns
+        self.tick_n, self.tick_missed = 0, 0
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to set the interval (seconds; applied from the next deadline)
+    def set_interval(self, seconds_frequency):
+        tick_ns = int(seconds_frequency * 1e9)
+        if (self.time_deadline_ns is not None) and (self.tick_n > 0):
+            self.time_deadline_ns += tick_ns - self.tick_ns
+        self.tick_ns = tick_ns
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to set the wait function (called in place of the sleep until the deadline)
+    def set_wait(self, wait_fx):
+        self.wait_fx = wait_fx
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to check the period (deadline over the analysis period)
+    def check_expired(self, time_deadline_ns=None):
+        if time_deadline_ns is None:
+            time_deadline_ns = self.time_deadline_ns
+        if (self.period_ns is None) or (time_deadline_ns is None):
+            return False
+        return time_deadline_ns - self.time_start_ns > self.period_ns
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to wait the tick (sleep until the deadline; ticks already over are counted and skipped)
+    def wait_tick(self):
+
+        if self.time_start_ns is None:
+            self.start()
+
+        # skip the overrun ticks (the last deadline already passed is taken as the current tick)
+        time_now_ns = time.monotonic_ns()
+        tick_missed = 0
+        if time_now_ns - self.time_deadline_ns >= self.tick_ns:
+            tick_missed = (time_now_ns - self.time_deadline_ns) // self.tick_ns
+            self.time_deadline_ns += tick_missed * self.tick_ns
+            self.tick_n += tick_missed
+        self.tick_missed += tick_missed
+
+        # check the period (no sample for a deadline over the analysis period)
+        if self.check_expired():
+            return None, None
+
+        # sleep until the deadline (wait function stops the scheduler before the deadline)
+        time_sleep_ns = self.time_deadline_ns - time_now_ns
+        if self.wait_fx is not None:
+            if self.wait_fx(max(time_sleep_ns, 0) / 1e9):
+                self.wait_stopped = True
+                return None, None
+        elif time_sleep_ns > 0:
+            time.sleep(time_sleep_ns / 1e9)
+
+        # sample time (wall clock in nanoseconds and monotonic time in seconds saved in the scheduler) and lag of the tick
+        time_sample_ns = time.monotonic_ns()
+        self.time_sample_ns, self.time_sample_monotonic = time.time_ns(), time_sample_ns / 1e9
+        time_sample = pd.Timestamp.fromtimestamp(self.time_sample_ns / 1e9)
+        tick_info = {'tick': self.tick_n, 'lag': round((time_sample_ns - self.time_deadline_ns) / 1e9, 6),
+                     'missed': tick_missed, 'missed_total': self.tick_missed, 'interval': self.tick_ns / 1e9}
+
+        # next deadline
+        self.time_deadline_ns += self.tick_ns
+        self.tick_n += 1
+
+        return time_sample, tick_info
+
+    # -------------------------------------------------------------------------------------
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Class to adapt the interval (interval reduced for fast changes of the values; increased for stable values)
+class AdaptiveInterval:
+
+    # -------------------------------------------------------------------------------------
+    # Method to initialize class
+    def __init__(self, seconds_frequency, seconds_min, seconds_max, slope_max,
+                 factor_down=0.5, factor_up=1.5):
+
+        self.seconds_frequency = seconds_frequency
+        self.seconds_min, self.seconds_max = seconds_min, seconds_max
+        self.slope_max = slope_max
+        self.factor_down, self.factor_up = factor_down, factor_up
+
+        self.values_prev, self.time_prev = None, None
+        self.slope_last = None
+
+    # -------------------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------------------
+    # Method to update the interval (max absolute slope of the values in units per second; monotonic time in seconds)
+    def update_interval(self, values_obj, time_monotonic):
+
+        slope_list = []
+        if (self.values_prev is not None) and (time_monotonic > self.time_prev):
+            time_delta = time_monotonic - self.time_prev
+            for value_key, value_now in values_obj.items():
+                value_prev = self.values_prev.get(value_key, None)
+                if (value_now is not None) and (value_prev is not None):
+                    slope_list.append(abs(value_now - value_prev) / time_delta)
+        self.values_prev, self.time_prev = values_obj, time_monotonic
+
+        if slope_list:
+            self.slope_last = max(slope_list)
+            if self.slope_last > self.slope_max:
+                self.seconds_frequency = max(self.seconds_frequency * self.factor_down, self.seconds_min)
+            else:
+                self.seconds_frequency = min(self.seconds_frequency * self.factor_up, self.seconds_max)
+
+        return self.seconds_frequency
+
+    # -------------------------------------------------------------------------------------
+
+# -------------------------------------------------------------------------------------
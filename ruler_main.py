@@ -10,6 +10,7 @@ __library__ = 'ruler'
 
 General command line:
 python ruler_main.py -settings_file configuration.json -time "YYYY-MM-DD HH:MM"
+python ruler_main.py -settings_file configuration.json -time "YYYY-MM-DD HH:MM" -command model.x arg1 arg2
 
 Version(s):
 20221227 (1.0.0) --> Beta release based on https://github.com/giampaolo/psutil
@@ -51,7 +52,7 @@ def main():
 
     # -------------------------------------------------------------------------------------
     # Get algorithm settings
-    alg_file_settings, alg_time = get_args()
+    alg_file_settings, alg_time, alg_command = get_args()
 
     # Set algorithm settings
     alg_data_settings = read_json(alg_file_settings)
@@ -92,13 +93,16 @@ def main():
         report_time=alg_time_report,
         dict_algorithm=alg_data_settings['algorithm'],
         dict_process=alg_data_settings['process'],
-        dict_report=alg_data_settings['report'])
+        dict_report=alg_data_settings['report'],
+        process_command=alg_command)
     # method to organize report analysis
     drv_report_analysis.organize()
     # method to dump report analysis
     drv_report_analysis.dump()
     # method to view report analysis
     drv_report_analysis.view()
+    # method to dump overhead of the report analysis
+    drv_report_analysis.dump_overhead()
     # method to view report analysis
     drv_report_analysis.kill()
     # -------------------------------------------------------------------------------------
@@ -125,15 +129,18 @@ def get_args():
     parser_handle = argparse.ArgumentParser()
     parser_handle.add_argument('-settings_file', action="store", dest="alg_settings")
     parser_handle.add_argument('-time', action="store", dest="alg_time")
+    parser_handle.add_argument('-command', action="store", dest="alg_command", nargs=argparse.REMAINDER)
     parser_values = parser_handle.parse_args()
 
-    alg_settings, alg_time = 'configuration.json', None
+    alg_settings, alg_time, alg_command = 'configuration.json', None, None
     if parser_values.alg_settings:
         alg_settings = parser_values.alg_settings
     if parser_values.alg_time:
         alg_time = parser_values.alg_time
+    if parser_values.alg_command:
+        alg_command = parser_values.alg_command
 
-    return alg_settings, alg_time
+    return alg_settings, alg_time, alg_command
 
 # -------------------------------------------------------------------------------------
 
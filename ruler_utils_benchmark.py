@@ -0,0 +1,314 @@
+#!/usr/bin/python3
+
+"""
+RULER LIBRARY - UTILS - Benchmark
+
+__date__ = '20230301'
+__version__ = '1.1.0'
+__author__ = 'Fabio Delogu (fabio.delogu@cimafoundation.org)'
+__library__ = 'ruler'
+
+General command line:
+python ruler_utils_benchmark.py -benchmark memory -iterations 200
+python ruler_utils_benchmark.py -benchmark process -iterations 20 -sizes 64,256,1024
+python ruler_utils_benchmark.py -benchmark storage -iterations 10 -sizes 1000,10000
+
+Version(s):
+20230301 (1.1.0) --> Micro-benchmarks of the analysis tools
+"""
+#######################################################################################
+# Libraries
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import psutil
+import numpy as np
+import pandas as pd
+
+from lib_analysis_utils import get_linux_memory_usage, split_size_parts
+from lib_analysis_fx import organize_process_info
+from lib_data_io import read_obj, write_obj, read_csv, write_csv, read_columnar, write_columnar, \
+    define_columnar_format, columnar_formats
+#######################################################################################
+
+# -------------------------------------------------------------------------------------
+# Algorithm information
+project_name = 'RULER'
+alg_name = 'BENCHMARK UTILS'
+alg_type = 'Package'
+alg_version = '1.1.0'
+alg_release = '2023-03-01'
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Script Main
+def main():
+
+    # get benchmark arguments
+    benchmark_name, benchmark_iterations, benchmark_sizes = get_args()
+
+    print(' ==> ' + project_name + ' ' + alg_type + ' - ' + alg_name + ' (Version ' + alg_version +
+          ' - Release ' + alg_release + ')')
+
+    if benchmark_name == 'memory':
+        benchmark_memory_usage(benchmark_iterations)
+    elif benchmark_name == 'process':
+        benchmark_process_info(benchmark_iterations, benchmark_sizes)
+    elif benchmark_name == 'storage':
+        benchmark_storage(benchmark_iterations, benchmark_sizes)
+    else:
+        raise NotImplementedError('Benchmark "' + benchmark_name + '" is not supported')
+
+    print(' ==> ... END')
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to time a function (return the elapsed times in seconds)
+def time_function(fx_handle, fx_iterations, *fx_args, **fx_kwargs):
+    fx_times = np.zeros(fx_iterations, dtype=float)
+    for fx_id in range(fx_iterations):
+        fx_start = time.perf_counter()
+        fx_handle(*fx_args, **fx_kwargs)
+        fx_times[fx_id] = time.perf_counter() - fx_start
+    return fx_times
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to print benchmark times
+def print_times(fx_name, fx_times):
+    print(' ----> ' + fx_name.ljust(30) +
+          ' ::: mean ' + '{:10.3f}'.format(np.mean(fx_times) * 1e6) + ' us' +
+          ' ::: p50 ' + '{:10.3f}'.format(np.percentile(fx_times, 50) * 1e6) + ' us' +
+          ' ::: p95 ' + '{:10.3f}'.format(np.percentile(fx_times, 95) * 1e6) + ' us')
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to get memory usage by linux command (previous implementation, kept for comparison)
+def get_linux_memory_usage_by_command():
+
+    all_info = subprocess.check_output("free -h", shell=True).strip()
+
+    virtual_memory_usage, swap_memory_usage = {}, {}
+    for line in all_info.decode("utf-8").split("\n"):
+        if "Mem:" in line:
+            line_parts = line.split()
+            for line_key, line_value in zip(
+                    ['total', 'used', 'free', 'shared', 'filesystem_buff_cache', 'available'], line_parts[1:7]):
+                line_numeric, line_units = split_size_parts(line_value)
+                virtual_memory_usage[line_key] = ''.join([line_numeric, line_units[0]])
+        if "Swap:" in line:
+            line_parts = line.split()
+            for line_key, line_value in zip(['total', 'used', 'free'], line_parts[1:4]):
+                line_numeric, line_units = split_size_parts(line_value)
+                swap_memory_usage[line_key] = ''.join([line_numeric, line_units[0]])
+            line_sysctl = subprocess.check_output("sysctl vm.swappiness", shell=True).strip()
+            swap_memory_usage['swappiness'] = int(line_sysctl.split()[2].decode("utf-8"))
+
+    return virtual_memory_usage, swap_memory_usage
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to benchmark memory usage readers (subprocess vs proc files)
+def benchmark_memory_usage(benchmark_iterations=200):
+
+    print(' ---> Benchmark memory usage [iterations: ' + str(benchmark_iterations) + '] ... ')
+
+    times_proc = time_function(get_linux_memory_usage, benchmark_iterations, advices=False)
+    print_times('proc files (/proc/meminfo)', times_proc)
+
+    try:
+        times_command = time_function(get_linux_memory_usage_by_command, benchmark_iterations)
+        print_times('subprocess (free, sysctl)', times_command)
+        print(' ----> speed-up ::: ' + '{:.1f}'.format(np.mean(times_command) / np.mean(times_proc)) + 'x')
+    except (OSError, subprocess.CalledProcessError) as exc:
+        print(' ----> subprocess (free, sysctl) ::: SKIPPED [' + str(exc) + ']')
+
+    print(' ---> Benchmark memory usage ... DONE')
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to organize process info (previous implementation, kept for comparison)
+def organize_process_info_by_calls(obj_process_list, process_attributes):
+    info_process_collections = []
+    for obj_process_step in obj_process_list:
+        info_process_fields = obj_process_step.as_dict(attrs=process_attributes)
+        info_process_fields['memory_info'] = obj_process_step.memory_full_info()
+        info_process_fields['cpu_affinity'] = obj_process_step.cpu_affinity()
+        info_process_fields['cpu_n'] = obj_process_step.cpu_num()
+        for memory_info_name in info_process_fields['memory_info']._fields:
+            info_process_fields['percent_' + memory_info_name] = obj_process_step.memory_percent(
+                memtype=memory_info_name)
+        info_process_collections.append(info_process_fields)
+    return info_process_collections
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to benchmark process info (sample latency vs mapped memory of the target)
+def benchmark_process_info(benchmark_iterations=20, benchmark_sizes=None,
+                           process_attributes=None, process_pages=4096):
+
+    if benchmark_sizes is None:
+        benchmark_sizes = [64, 256, 1024]
+    if process_attributes is None:
+        process_attributes = ["pid", "username", "memory_info", "memory_percent", "name",
+                              "cmdline", "cpu_percent", "cpu_times", "create_time", "status"]
+
+    print(' ---> Benchmark process info [iterations: ' + str(benchmark_iterations) + '] ... ')
+
+    for benchmark_size in benchmark_sizes:
+
+        # target process: map (and touch) "size" MB split in many mappings, then wait
+        process_code = (
+            'import mmap, sys, time\n'
+            'maps = []\n'
+            'for i in range(' + str(benchmark_size) + '):\n'
+            '    m = mmap.mmap(-1, 1024 * 1024)\n'
+            '    for j in range(0, 1024 * 1024, ' + str(process_pages) + '):\n'
+            '        m[j] = 1\n'
+            '    maps.append(m)\n'
+            'sys.stdout.write("ready\\n"); sys.stdout.flush()\n'
+            'time.sleep(3600)\n')
+        process_handle = subprocess.Popen([sys.executable, '-c', process_code], stdout=subprocess.PIPE)
+        try:
+            process_handle.stdout.readline()
+            process_obj = [psutil.Process(process_handle.pid)]
+
+            process_maps = process_obj[0].memory_maps(grouped=False).__len__()
+            print(' ----> Target mapped memory: ' + str(benchmark_size) + ' MB ::: mappings: ' + str(process_maps))
+
+            times_calls = time_function(
+                organize_process_info_by_calls, benchmark_iterations, process_obj, process_attributes)
+            print_times('single calls (as_dict, percent)', times_calls)
+            times_oneshot = time_function(
+                organize_process_info, benchmark_iterations, process_obj,
+                prefix_name='process_memory_{proc_n}', process_attributes=process_attributes)
+            print_times('oneshot (organize_process_info)', times_oneshot)
+            print(' ----> speed-up ::: ' + '{:.1f}'.format(np.mean(times_calls) / np.mean(times_oneshot)) + 'x')
+
+        finally:
+            process_handle.kill()
+            process_handle.wait()
+
+    print(' ---> Benchmark process info ... DONE')
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to define a report dframe (columns similar to the report of the analysis: bytes, percent and strings)
+def define_report_dframe(report_rows=1000, report_columns_num=75, report_columns_str=5):
+
+    report_time = pd.date_range(start='2023-03-01 00:00', periods=report_rows, freq='2s')
+    report_data = {}
+    for column_id in range(report_columns_num):
+        if column_id % 3 == 0:
+            report_data['process_memory_0_field_' + str(column_id)] = np.random.randint(
+                0, 2 ** 34, size=report_rows, dtype='int64')
+        else:
+            report_data['process_memory_0_percent_' + str(column_id)] = np.round(
+                np.random.uniform(0, 100, size=report_rows), 4)
+    for column_id in range(report_columns_str):
+        report_data['process_memory_0_string_' + str(column_id)] = ['python model_' + str(column_id % 7) + ' -x'
+                                                                    ] * report_rows
+
+    report_dframe = pd.DataFrame(data=report_data, index=report_time)
+    report_dframe.index.name = 'time'
+
+    return report_dframe
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to benchmark storage (write, read and size of pickle and csv vs columnar files)
+def benchmark_storage(benchmark_iterations=10, benchmark_sizes=None):
+
+    if benchmark_sizes is None:
+        benchmark_sizes = [1000, 10000]
+
+    storage_formats = list(dict.fromkeys([define_columnar_format(file_format) for file_format in columnar_formats]))
+
+    print(' ---> Benchmark storage [iterations: ' + str(benchmark_iterations) + '] ... ')
+
+    storage_folder = tempfile.mkdtemp(prefix='ruler_benchmark_')
+    try:
+        for benchmark_size in benchmark_sizes:
+
+            report_dframe = define_report_dframe(report_rows=benchmark_size)
+            print(' ----> Report rows: ' + str(benchmark_size) + ' ::: columns: ' + str(report_dframe.shape[1]))
+
+            # current path (pickle workspace and csv report)
+            file_pickle = os.path.join(storage_folder, 'report.workspace')
+            file_csv = os.path.join(storage_folder, 'report.csv')
+            print_times('write pickle (workspace)', time_function(
+                write_obj, benchmark_iterations, file_pickle, report_dframe))
+            print_times('read pickle (workspace)', time_function(read_obj, benchmark_iterations, file_pickle))
+            print_times('write csv (report)', time_function(
+                write_csv, benchmark_iterations, file_csv, report_dframe))
+            print_times('read csv (report)', time_function(read_csv, benchmark_iterations, file_csv))
+            print_size('size pickle (workspace)', file_pickle)
+            print_size('size csv (report)', file_csv)
+
+            # columnar path (workspace and report)
+            for storage_format in storage_formats:
+                file_columnar = os.path.join(storage_folder, 'report' + columnar_formats[storage_format])
+                print_times('write ' + storage_format + ' (columnar)', time_function(
+                    write_columnar, benchmark_iterations, file_columnar, report_dframe, file_format=storage_format))
+                print_times('read ' + storage_format + ' (columnar)', time_function(
+                    read_columnar, benchmark_iterations, file_columnar))
+                print_size('size ' + storage_format + ' (columnar)', file_columnar)
+
+    finally:
+        shutil.rmtree(storage_folder, ignore_errors=True)
+
+    print(' ---> Benchmark storage ... DONE')
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to print benchmark file size
+def print_size(file_tag, file_name):
+    print(' ----> ' + file_tag.ljust(30) + ' ::: ' + '{:10.1f}'.format(os.path.getsize(file_name) / 1024) + ' KB')
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to get script argument(s)
+def get_args():
+    parser_handle = argparse.ArgumentParser()
+    parser_handle.add_argument('-benchmark', action="store", dest="benchmark_name")
+    parser_handle.add_argument('-iterations', action="store", dest="benchmark_iterations")
+    parser_handle.add_argument('-sizes', action="store", dest="benchmark_sizes")
+    parser_values = parser_handle.parse_args()
+
+    benchmark_name, benchmark_iterations, benchmark_sizes = 'memory', 200, None
+    if parser_values.benchmark_name:
+        benchmark_name = parser_values.benchmark_name
+    if parser_values.benchmark_iterations:
+        benchmark_iterations = int(parser_values.benchmark_iterations)
+    if parser_values.benchmark_sizes:
+        benchmark_sizes = [int(size_step) for size_step in parser_values.benchmark_sizes.split(',')]
+
+    return benchmark_name, benchmark_iterations, benchmark_sizes
+
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Call script from external library
+if __name__ == "__main__":
+    main()
+# -------------------------------------------------------------------------------------
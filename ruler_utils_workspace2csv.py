@@ -28,7 +28,7 @@ import pandas as pd
 from copy import deepcopy
 
 from lib_info_args import logger_name
-from lib_data_io import read_json, read_obj, write_csv
+from lib_data_io import read_json, write_json, read_workspace, write_csv
 from lib_utils_system import fill_tags2string, make_folder
 from lib_utils_logging import set_logging_file
 
@@ -132,7 +132,7 @@ def main():
         if not os.path.exists(report_file_path_dst):
 
             # iterate on filename(s)
-            report_analysis_collections = None
+            report_analysis_collections, report_analysis_units = None, {}
             for report_file_path_src_step in report_file_path_src_list:
 
                 # get analysis file
@@ -141,7 +141,12 @@ def main():
                 if os.path.exists(report_file_path_src_step):
 
                     # read analysis file
-                    report_analysis_step = read_obj(report_file_path_src_step)
+                    report_analysis_step = read_workspace(report_file_path_src_step)
+                    if report_analysis_step is None:
+                        log_stream.warning(' ===> File data are not available')
+                        log_stream.info(' -----> File "' + report_file_path_src_step + '" ... SKIPPED')
+                        continue
+                    report_analysis_units.update(report_analysis_step.attrs.get('units', {}))
 
                     # remove columns (problems in writing end file)
                     report_columns_to_drop = []
@@ -162,10 +167,14 @@ def main():
                     log_stream.info(' -----> File "' + report_file_path_src_step + '" ... SKIPPED')
 
             # sort dataframe in ascending mode
-            report_analysis_collections = report_analysis_collections.sort_index(ascending=True)
+            if report_analysis_collections is not None:
+                report_analysis_collections = report_analysis_collections.sort_index(ascending=True)
 
-            # organize file end
-            log_stream.info(' ----> Get analysis file(s) ... DONE')
+                # organize file end
+                log_stream.info(' ----> Get analysis file(s) ... DONE')
+            else:
+                # organize file end
+                log_stream.info(' ----> Get analysis file(s) ... FAILED. DataFrame is not available')
 
         else:
             # organize file end
@@ -192,6 +201,8 @@ def main():
             make_folder(report_folder_name_dst)
 
             write_csv(report_file_path_dst, report_analysis_collections, file_separator=report_file_delimiter)
+            if report_analysis_units:
+                write_json(os.path.splitext(report_file_path_dst)[0] + '_units.json', report_analysis_units)
             log_stream.info(' -----> File "' + report_file_path_dst + '" ... DONE')
 
             # Dump analysis file end
@@ -0,0 +1,17 @@
+"""
+Library Features:
+
+Name:          conftest
+Author(s):     Fabio Delogu (fabio.delogu@cimafoundation.org)
+Date:          '20261018'
+Version:       '1.0.0'
+"""
+
+# -------------------------------------------------------------------------------------
+# Libraries
+import os
+import sys
+
+# modules of the package are defined in the root folder
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# -------------------------------------------------------------------------------------
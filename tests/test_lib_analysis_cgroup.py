@@ -0,0 +1,238 @@
+"""
+Library Features:
+
+Name:          test_lib_analysis_cgroup
+Author(s):     Fabio Delogu (fabio.delogu@cimafoundation.org)
+Date:          '20261018'
+Version:       '1.0.0'
+"""
+
+#######################################################################################
+# Libraries
+import math
+import os
+import types
+
+import pytest
+
+from lib_analysis_utils import read_linux_cgroup_path, define_linux_cgroup_root, \
+    read_linux_cgroup_value, read_linux_cgroup_keys, read_linux_cgroup_io
+from lib_analysis_fx import TrackerCgroup
+
+# process pid of the fake procfs
+process_pid = 4242
+# cgroup path of the process (unified hierarchy)
+cgroup_path = '/user.slice/ruler.scope'
+#######################################################################################
+
+
+# -------------------------------------------------------------------------------------
+# Method to write a file of the fake filesystem
+def write_file(file_name, file_text):
+    os.makedirs(os.path.dirname(file_name), exist_ok=True)
+    with open(file_name, 'w') as file_handle:
+        file_handle.write(file_text)
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to write the cgroup files of a folder (counters scaled by the step)
+def write_cgroup_files(cgroup_folder, memory_max='max', step=1):
+    write_file(os.path.join(cgroup_folder, 'memory.current'), str(1048576 * step) + '\n')
+    write_file(os.path.join(cgroup_folder, 'memory.max'), memory_max + '\n')
+    write_file(os.path.join(cgroup_folder, 'memory.stat'),
+               'anon ' + str(524288 * step) + '\nfile 262144\nkernel_stack 16384\nshmem 0\n'
+               'file_dirty 4096\nfile_writeback 0\npgmajfault ' + str(10 * step) + '\n')
+    write_file(os.path.join(cgroup_folder, 'memory.events'), 'low 0\nhigh 0\nmax 0\noom 0\noom_kill 0\n')
+    write_file(os.path.join(cgroup_folder, 'cpu.stat'),
+               'usage_usec ' + str(1000000 * step) + '\nuser_usec 800000\nsystem_usec 200000\n'
+               'nr_periods 0\nnr_throttled 0\nthrottled_usec 0\n')
+    write_file(os.path.join(cgroup_folder, 'io.stat'),
+               '8:0 rbytes=' + str(4096 * step) + ' wbytes=' + str(8192 * step) + ' rios=1 wios=2 dbytes=0 dios=0\n'
+               '8:16 rbytes=' + str(4096 * step) + ' wbytes=0 rios=1 wios=0 dbytes=0 dios=0\n')
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Fixture to define the fake procfs and cgroupfs (cgroup v2 unified hierarchy)
+@pytest.fixture
+def cgroup_v2(tmp_path):
+    proc_root, cgroup_root = str(tmp_path / 'v2' / 'proc'), str(tmp_path / 'v2' / 'cgroup')
+    write_file(os.path.join(proc_root, str(process_pid), 'cgroup'), '0::' + cgroup_path + '\n')
+    write_file(os.path.join(cgroup_root, 'cgroup.controllers'), 'cpu io memory pids\n')
+    cgroup_folder = os.path.join(cgroup_root, cgroup_path.lstrip('/'))
+    write_cgroup_files(cgroup_folder)
+    return types.SimpleNamespace(proc_root=proc_root, cgroup_root=cgroup_root, cgroup_folder=cgroup_folder)
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Fixture to define the fake procfs and cgroupfs (cgroup v1 hierarchy with the unified folder)
+@pytest.fixture
+def cgroup_v1(tmp_path):
+    proc_root, cgroup_root = str(tmp_path / 'v1' / 'proc'), str(tmp_path / 'v1' / 'cgroup')
+    write_file(os.path.join(proc_root, str(process_pid), 'cgroup'),
+               '12:memory:' + cgroup_path + '\n11:cpu,cpuacct:' + cgroup_path + '\n'
+               '1:name=systemd:' + cgroup_path + '\n0::' + cgroup_path + '\n')
+    write_file(os.path.join(cgroup_root, 'memory', cgroup_path.lstrip('/'), 'memory.usage_in_bytes'), '1048576\n')
+    write_file(os.path.join(cgroup_root, 'unified', 'cgroup.controllers'), '\n')
+    cgroup_folder = os.path.join(cgroup_root, 'unified', cgroup_path.lstrip('/'))
+    write_cgroup_files(cgroup_folder, memory_max='2097152')
+    return types.SimpleNamespace(proc_root=proc_root, cgroup_root=cgroup_root, cgroup_folder=cgroup_folder)
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Test cgroup path of the process
+def test_read_linux_cgroup_path(cgroup_v2, cgroup_v1, tmp_path):
+    assert read_linux_cgroup_path(process_pid, proc_root=cgroup_v2.proc_root) == cgroup_path
+    assert read_linux_cgroup_path(process_pid, proc_root=cgroup_v1.proc_root) == cgroup_path
+
+    # process not available
+    assert read_linux_cgroup_path(process_pid + 1, proc_root=cgroup_v2.proc_root) is None
+
+    # cgroup v1 only (unified line not available)
+    proc_root = str(tmp_path / 'proc_v1')
+    write_file(os.path.join(proc_root, str(process_pid), 'cgroup'), '12:memory:' + cgroup_path + '\n')
+    assert read_linux_cgroup_path(process_pid, proc_root=proc_root) is None
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Test cgroup root (unified mount point and unified folder of the hybrid hierarchy)
+def test_define_linux_cgroup_root(cgroup_v2, cgroup_v1, tmp_path):
+    assert define_linux_cgroup_root(cgroup_v2.cgroup_root) == cgroup_v2.cgroup_root
+    assert define_linux_cgroup_root(cgroup_v1.cgroup_root) == os.path.join(cgroup_v1.cgroup_root, 'unified')
+    assert define_linux_cgroup_root(str(tmp_path / 'missing')) is None
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Test cgroup value files (integer, "max" and missing file)
+def test_read_linux_cgroup_value(cgroup_v2, cgroup_v1):
+    assert read_linux_cgroup_value(os.path.join(cgroup_v2.cgroup_folder, 'memory.current')) == 1048576
+    assert read_linux_cgroup_value(os.path.join(cgroup_v2.cgroup_folder, 'memory.max')) is None
+    assert read_linux_cgroup_value(os.path.join(cgroup_v1.cgroup_folder, 'memory.max')) == 2097152
+    assert read_linux_cgroup_value(os.path.join(cgroup_v2.cgroup_folder, 'memory.high')) is None
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Test cgroup keyed files (flat keys and missing file)
+def test_read_linux_cgroup_keys(cgroup_v2):
+    memory_stat = read_linux_cgroup_keys(os.path.join(cgroup_v2.cgroup_folder, 'memory.stat'))
+    assert memory_stat['anon'] == 524288
+    assert memory_stat['pgmajfault'] == 10
+
+    cpu_stat = read_linux_cgroup_keys(os.path.join(cgroup_v2.cgroup_folder, 'cpu.stat'))
+    assert cpu_stat['usage_usec'] == 1000000
+
+    assert read_linux_cgroup_keys(os.path.join(cgroup_v2.cgroup_folder, 'memory.swap.events')) == {}
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Test cgroup io file (values summed over the devices and missing file)
+def test_read_linux_cgroup_io(cgroup_v2):
+    io_stat = read_linux_cgroup_io(os.path.join(cgroup_v2.cgroup_folder, 'io.stat'))
+    assert io_stat['rbytes'] == 8192
+    assert io_stat['wbytes'] == 8192
+    assert io_stat['rios'] == 2
+    assert io_stat['wios'] == 2
+
+    assert read_linux_cgroup_io(os.path.join(cgroup_v2.cgroup_folder, 'io.max')) == {}
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Test cgroup tracker (cgroup v2; memory limit defined by "max")
+def test_tracker_cgroup_v2(cgroup_v2):
+    tracker_cgroup = TrackerCgroup(cgroup_root=cgroup_v2.cgroup_root, proc_root=cgroup_v2.proc_root)
+    obj_process_list = [types.SimpleNamespace(pid=process_pid)]
+
+    info_cgroup = tracker_cgroup.get_cgroup_info(obj_process_list)
+    assert info_cgroup['cgroup_path'] == cgroup_v2.cgroup_folder
+    assert info_cgroup['cgroup_memory_current'] == 1048576
+    assert info_cgroup['cgroup_memory_max'] is None
+    assert math.isnan(info_cgroup['cgroup_memory_percent'])
+    assert info_cgroup['cgroup_memory_anon'] == 524288
+    assert info_cgroup['cgroup_memory_events_oom_kill'] == 0
+    # first sample (rates not defined)
+    assert math.isnan(info_cgroup['cgroup_cpu_usage_percent'])
+    assert math.isnan(info_cgroup['cgroup_io_read_bytes_rate'])
+    # pressure files not available
+    assert not [obj_key for obj_key in info_cgroup if obj_key.startswith('cgroup_pressure')]
+
+    # second sample (counters doubled over two seconds)
+    write_cgroup_files(cgroup_v2.cgroup_folder, step=2)
+    tracker_cgroup.cgroup_time_prev -= 2.0
+    info_cgroup = tracker_cgroup.get_cgroup_info(obj_process_list)
+    assert info_cgroup['cgroup_cpu_usage_percent'] == pytest.approx(50.0, rel=1e-2)
+    assert info_cgroup['cgroup_io_read_bytes_rate'] == pytest.approx(4096.0, rel=1e-2)
+    assert info_cgroup['cgroup_io_write_bytes_rate'] == pytest.approx(4096.0, rel=1e-2)
+    assert info_cgroup['cgroup_memory_pgmajfault_rate'] == pytest.approx(5.0, rel=1e-2)
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Test cgroup tracker (cgroup v1 hierarchy with the unified folder; memory limit defined)
+def test_tracker_cgroup_v1(cgroup_v1):
+    tracker_cgroup = TrackerCgroup(cgroup_root=cgroup_v1.cgroup_root, proc_root=cgroup_v1.proc_root)
+    obj_process_list = [types.SimpleNamespace(pid=process_pid)]
+
+    info_cgroup = tracker_cgroup.get_cgroup_info(obj_process_list)
+    assert info_cgroup['cgroup_path'] == cgroup_v1.cgroup_folder
+    assert info_cgroup['cgroup_memory_max'] == 2097152
+    assert info_cgroup['cgroup_memory_percent'] == pytest.approx(50.0)
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Test cgroup tracker (hierarchy, process and files not available)
+def test_tracker_cgroup_missing(cgroup_v2, tmp_path):
+    obj_process_list = [types.SimpleNamespace(pid=process_pid)]
+
+    # cgroup v1 only (unified hierarchy not available)
+    cgroup_root = str(tmp_path / 'cgroup_v1')
+    write_file(os.path.join(cgroup_root, 'memory', 'memory.usage_in_bytes'), '1048576\n')
+    tracker_cgroup = TrackerCgroup(cgroup_root=cgroup_root, proc_root=cgroup_v2.proc_root)
+    assert tracker_cgroup.cgroup_root is None
+    assert tracker_cgroup.get_cgroup_info(obj_process_list) == {}
+
+    # process list and process not available
+    tracker_cgroup = TrackerCgroup(cgroup_root=cgroup_v2.cgroup_root, proc_root=cgroup_v2.proc_root)
+    assert tracker_cgroup.get_cgroup_info([]) == {}
+    assert tracker_cgroup.get_cgroup_info([types.SimpleNamespace(pid=process_pid + 1)]) == {}
+
+    # cgroup files not available (keys defined by NoneType and NaN)
+    for file_name in ['memory.current', 'memory.max', 'memory.stat', 'cpu.stat', 'io.stat']:
+        os.remove(os.path.join(cgroup_v2.cgroup_folder, file_name))
+    info_cgroup = tracker_cgroup.get_cgroup_info(obj_process_list)
+    assert info_cgroup['cgroup_memory_current'] is None
+    assert info_cgroup['cgroup_memory_anon'] is None
+    assert math.isnan(info_cgroup['cgroup_memory_percent'])
+    assert math.isnan(info_cgroup['cgroup_cpu_usage_percent'])
+    assert math.isnan(info_cgroup['cgroup_io_read_iops'])
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Test cgroup tracker io rates (io.stat not available: no data; io.stat without devices: idle cgroup)
+def test_tracker_cgroup_io_missing(cgroup_v2):
+    tracker_cgroup = TrackerCgroup(cgroup_root=cgroup_v2.cgroup_root, proc_root=cgroup_v2.proc_root)
+    obj_process_list = [types.SimpleNamespace(pid=process_pid)]
+
+    os.remove(os.path.join(cgroup_v2.cgroup_folder, 'io.stat'))
+    tracker_cgroup.get_cgroup_info(obj_process_list)
+    tracker_cgroup.cgroup_time_prev -= 2.0
+    info_cgroup = tracker_cgroup.get_cgroup_info(obj_process_list)
+    assert math.isnan(info_cgroup['cgroup_io_read_bytes_rate'])
+    assert math.isnan(info_cgroup['cgroup_io_write_iops'])
+
+    write_file(os.path.join(cgroup_v2.cgroup_folder, 'io.stat'), '')
+    tracker_cgroup.get_cgroup_info(obj_process_list)
+    tracker_cgroup.cgroup_time_prev -= 2.0
+    info_cgroup = tracker_cgroup.get_cgroup_info(obj_process_list)
+    assert info_cgroup['cgroup_io_read_bytes_rate'] == 0.0
+    assert info_cgroup['cgroup_io_write_iops'] == 0.0
+# -------------------------------------------------------------------------------------
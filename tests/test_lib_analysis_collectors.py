@@ -0,0 +1,100 @@
+"""
+Library Features:
+
+Name:          test_lib_analysis_collectors
+Author(s):     Fabio Delogu (fabio.delogu@cimafoundation.org)
+Date:          '20261018'
+Version:       '1.0.0'
+"""
+
+#######################################################################################
+# Libraries
+import math
+import os
+
+import psutil
+import pytest
+
+from lib_analysis_fx import CollectorProcess, CollectorProcessIO, TrackerProcess, TrackerProcessIO, define_process_slots
+#######################################################################################
+
+
+# -------------------------------------------------------------------------------------
+# Fixture to define the process list (the same process selected three times)
+@pytest.fixture
+def process_list():
+    return [psutil.Process(os.getpid()) for _ in range(3)]
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to define the collectors context (process tool attributes and process tracker)
+def define_context(tool_attrs_process):
+    process_tracker = TrackerProcess(['python'], process_obj_init={'python': []}, process_scan_active=False)
+    return {'tools': {'tool_info_process': tool_attrs_process}, 'process_tracker': process_tracker}
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Test process slots (defined by the process filter or by process_n)
+def test_define_process_slots():
+    assert define_process_slots('first') == 1
+    assert define_process_slots('last') == 1
+    assert define_process_slots([0, 2, 3]) == 3
+    assert define_process_slots('all') == 8
+    assert define_process_slots(None) == 8
+    assert define_process_slots('all', process_n=2) == 2
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Test process collector (columns declared for each process slot)
+def test_collector_process_slots(process_list):
+    tool_attrs = {'prefix_name': 'process_{proc_n}', 'process_filter': 'all', 'process_n': 3,
+                  'process_memory_type': 'partial', 'process_peak': False}
+    collector_process = CollectorProcess(tool_attrs=tool_attrs, tool_context=define_context(tool_attrs))
+
+    columns_name = collector_process.define_columns()
+    assert 'process_2_pid' in columns_name
+    assert 'process_3_pid' not in columns_name
+    assert sorted(collector_process.get_null_sample()) == sorted(columns_name)
+
+    info_process = collector_process.sample(process_list)
+    assert set(info_process) <= set(columns_name)
+    assert info_process['process_2_pid'] == os.getpid()
+
+    # processes over the declared slots are not sampled
+    info_process = collector_process.sample(process_list + process_list)
+    assert set(info_process) <= set(columns_name)
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Test process io collector (process slots defined by the process filter of the process tool)
+def test_collector_process_io_slots(process_list):
+    collector_process_io = CollectorProcessIO(
+        tool_attrs={}, tool_context=define_context({'process_filter': [0, 1]}))
+
+    columns_name = collector_process_io.define_columns()
+    assert 'process_io_1_pid' in columns_name
+    assert 'process_io_2_pid' not in columns_name
+
+    info_process_io = collector_process_io.sample(process_list)
+    assert set(info_process_io) <= set(columns_name)
+    assert info_process_io['process_io_1_pid'] == os.getpid()
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Test process io gauges (file descriptors not accessible --> NaN field)
+def test_process_counters_fds_denied(monkeypatch):
+
+    def num_fds_denied(obj_process):
+        raise psutil.AccessDenied(obj_process.pid)
+
+    monkeypatch.setattr(psutil.Process, 'num_fds', num_fds_denied)
+    process_counters, process_gauges = TrackerProcessIO.get_process_counters(psutil.Process(os.getpid()))
+    assert process_counters['ctx_voluntary'] >= 0
+    assert process_gauges['num_threads'] >= 1
+    assert math.isnan(process_gauges['num_fds'])
+# -------------------------------------------------------------------------------------
@@ -0,0 +1,86 @@
+"""
+Library Features:
+
+Name:          test_lib_analysis_disk
+Author(s):     Fabio Delogu (fabio.delogu@cimafoundation.org)
+Date:          '20261018'
+Version:       '1.0.0'
+"""
+
+#######################################################################################
+# Libraries
+import concurrent.futures
+import threading
+
+import psutil
+import pytest
+
+import lib_analysis_fx
+from lib_analysis_fx import CollectorDisk, get_disk_info
+#######################################################################################
+
+
+# -------------------------------------------------------------------------------------
+# Fixture to define a stalled statvfs path (the call is released at the end of the test)
+@pytest.fixture
+def disk_paths(tmp_path, monkeypatch):
+    path_healthy, path_stalled = str(tmp_path / 'healthy'), str(tmp_path / 'stalled')
+    (tmp_path / 'healthy').mkdir()
+    stall_event = threading.Event()
+    disk_usage = psutil.disk_usage
+
+    def disk_usage_stalled(disk_path):
+        if disk_path == path_stalled:
+            stall_event.wait()
+        return disk_usage(disk_path)
+
+    monkeypatch.setattr(lib_analysis_fx.psutil, 'disk_usage', disk_usage_stalled)
+    yield path_healthy, path_stalled
+    stall_event.set()
+    for disk_path in [path_healthy, path_stalled]:
+        lib_analysis_fx.disk_usage_workers.pop(disk_path, None)
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Test disk info (a stalled path gives null fields; the healthy path reports its values)
+def test_get_disk_info_stalled(disk_paths):
+    path_healthy, path_stalled = disk_paths
+    info_disk = get_disk_info(disk_path=[path_healthy, path_stalled], prefix_name=['disk_ok', 'disk_ko'],
+                              disk_timeout=0.2)
+    assert info_disk['disk_ok_total'] > 0
+    assert info_disk['disk_ok_percent'] is not None
+    assert info_disk['disk_ko_total'] is None
+    assert info_disk['disk_ko_percent'] is None
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Test disk collector timeout (deadline extended to cover the disk timeout of the paths)
+def test_collector_disk_timeout():
+    collector_disk = CollectorDisk(tool_attrs={'disk_path': '/', 'disk_timeout': 5})
+    assert collector_disk.define_timeout(2.0) == pytest.approx(5.0 + lib_analysis_fx.disk_timeout_margin)
+    assert collector_disk.define_timeout(10.0) == 10.0
+    assert collector_disk.define_timeout(None) is None
+
+    collector_disk = CollectorDisk(tool_attrs={'disk_path': '/', 'collector_timeout': 1.0})
+    assert collector_disk.define_timeout(10.0) == pytest.approx(
+        lib_analysis_fx.disk_timeout_default + lib_analysis_fx.disk_timeout_margin)
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Test disk collector within the collector deadline (the healthy path is not dropped by a stalled path)
+def test_collector_disk_stalled(disk_paths):
+    path_healthy, path_stalled = disk_paths
+    collector_disk = CollectorDisk(tool_attrs={
+        'disk_path': [path_healthy, path_stalled], 'prefix_name': ['disk_ok', 'disk_ko'], 'disk_timeout': 0.2})
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as collector_executor:
+        collector_future = collector_executor.submit(collector_disk.sample_latency)
+        info_disk, disk_latency = collector_future.result(timeout=collector_disk.define_timeout(0.1))
+
+    assert info_disk['disk_ok_total'] > 0
+    assert info_disk['disk_ko_total'] is None
+    assert disk_latency < 0.2 + lib_analysis_fx.disk_timeout_margin
+# -------------------------------------------------------------------------------------
@@ -0,0 +1,133 @@
+"""
+Library Features:
+
+Name:          test_lib_analysis_pressure
+Author(s):     Fabio Delogu (fabio.delogu@cimafoundation.org)
+Date:          '20261018'
+Version:       '1.0.0'
+"""
+
+#######################################################################################
+# Libraries
+import os
+
+import pytest
+
+from lib_analysis_utils import read_linux_pressure
+from lib_analysis_fx import TrackerPressure
+#######################################################################################
+
+
+# -------------------------------------------------------------------------------------
+# Method to write a pressure file (some line and, if defined, full line)
+def write_pressure(file_name, some_total, full_total=None, some_avg10=1.5):
+    file_text = 'some avg10=' + str(some_avg10) + ' avg60=0.75 avg300=0.25 total=' + str(some_total) + '\n'
+    if full_total is not None:
+        file_text += 'full avg10=0.50 avg60=0.25 avg300=0.00 total=' + str(full_total) + '\n'
+    with open(file_name, 'w') as file_handle:
+        file_handle.write(file_text)
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Fixture to define the fake pressure folder (cpu without full line, memory and io with full line)
+@pytest.fixture
+def pressure_folder(tmp_path):
+    write_pressure(str(tmp_path / 'cpu'), some_total=1000)
+    write_pressure(str(tmp_path / 'memory'), some_total=2000, full_total=500)
+    write_pressure(str(tmp_path / 'io'), some_total=3000, full_total=1500)
+    return str(tmp_path)
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Test pressure file (some/full lines, total as integer and missing file)
+def test_read_linux_pressure(pressure_folder):
+    pressure_obj = read_linux_pressure(os.path.join(pressure_folder, 'memory'))
+    assert sorted(pressure_obj) == ['full', 'some']
+    assert pressure_obj['some'] == {'avg10': 1.5, 'avg60': 0.75, 'avg300': 0.25, 'total': 2000}
+    assert pressure_obj['full']['avg10'] == 0.5
+    assert isinstance(pressure_obj['full']['total'], int)
+
+    # file without full line
+    assert list(read_linux_pressure(os.path.join(pressure_folder, 'cpu'))) == ['some']
+
+    # file not available
+    assert read_linux_pressure(os.path.join(pressure_folder, 'irq')) == {}
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Test pressure tracker (averages and total delta between samples)
+def test_tracker_pressure_delta(pressure_folder):
+    tracker_pressure = TrackerPressure(pressure_folder=pressure_folder)
+
+    # first sample (total delta not defined)
+    info_pressure = tracker_pressure.get_pressure_info()
+    assert info_pressure['pressure_memory_some_avg10'] == 1.5
+    assert info_pressure['pressure_memory_full_avg60'] == 0.25
+    assert info_pressure['pressure_memory_some_total_delta'] is None
+    assert info_pressure['pressure_io_full_total_delta'] is None
+
+    # second sample
+    write_pressure(os.path.join(pressure_folder, 'memory'), some_total=2600, full_total=700, some_avg10=3.0)
+    write_pressure(os.path.join(pressure_folder, 'io'), some_total=3000, full_total=1500)
+    info_pressure = tracker_pressure.get_pressure_info()
+    assert info_pressure['pressure_memory_some_avg10'] == 3.0
+    assert info_pressure['pressure_memory_some_total_delta'] == 600
+    assert info_pressure['pressure_memory_full_total_delta'] == 200
+    assert info_pressure['pressure_io_some_total_delta'] == 0
+    assert info_pressure['pressure_io_full_total_delta'] == 0
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Test pressure tracker (counters reset between samples)
+def test_tracker_pressure_reset(pressure_folder):
+    tracker_pressure = TrackerPressure(pressure_folder=pressure_folder)
+    tracker_pressure.get_pressure_info()
+
+    # counters reset (delta not defined)
+    write_pressure(os.path.join(pressure_folder, 'memory'), some_total=100, full_total=50)
+    info_pressure = tracker_pressure.get_pressure_info()
+    assert info_pressure['pressure_memory_some_total_delta'] is None
+    assert info_pressure['pressure_memory_full_total_delta'] is None
+
+    # sample after the reset (delta computed from the reset counters)
+    write_pressure(os.path.join(pressure_folder, 'memory'), some_total=400, full_total=80)
+    info_pressure = tracker_pressure.get_pressure_info()
+    assert info_pressure['pressure_memory_some_total_delta'] == 300
+    assert info_pressure['pressure_memory_full_total_delta'] == 30
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Test pressure tracker (file without full line and files not available)
+def test_tracker_pressure_missing(pressure_folder, tmp_path):
+    tracker_pressure = TrackerPressure(pressure_folder=pressure_folder)
+    info_pressure = tracker_pressure.get_pressure_info(prefix_name='psi')
+    assert 'psi_cpu_some_avg10' in info_pressure
+    assert 'psi_cpu_some_total_delta' in info_pressure
+    assert not [obj_key for obj_key in info_pressure if obj_key.startswith('psi_cpu_full')]
+
+    # full line added to the file (first sample of the line)
+    write_pressure(os.path.join(pressure_folder, 'cpu'), some_total=1200, full_total=10)
+    info_pressure = tracker_pressure.get_pressure_info(prefix_name='psi')
+    assert info_pressure['psi_cpu_some_total_delta'] == 200
+    assert info_pressure['psi_cpu_full_total_delta'] is None
+
+    # folder not available
+    tracker_pressure = TrackerPressure(pressure_folder=str(tmp_path / 'missing'))
+    assert tracker_pressure.get_pressure_info() == {}
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Test pressure tracker (cgroup pressure files defined by suffix)
+def test_tracker_pressure_suffix(tmp_path):
+    write_pressure(str(tmp_path / 'io.pressure'), some_total=10, full_total=5)
+    tracker_pressure = TrackerPressure(pressure_folder=None, pressure_suffix='.pressure')
+    info_pressure = tracker_pressure.get_pressure_info(pressure_folder=str(tmp_path), prefix_name='cgroup_pressure')
+    assert info_pressure['cgroup_pressure_io_full_avg10'] == 0.5
+    assert not [obj_key for obj_key in info_pressure if obj_key.startswith('cgroup_pressure_cpu')]
+# -------------------------------------------------------------------------------------
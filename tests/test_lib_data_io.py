@@ -0,0 +1,138 @@
+"""
+Library Features:
+
+Name:          test_lib_data_io
+Author(s):     Fabio Delogu (fabio.delogu@cimafoundation.org)
+Date:          '20261018'
+Version:       '1.0.0'
+"""
+
+#######################################################################################
+# Libraries
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import lib_data_io
+from lib_data_io import write_columnar, read_columnar, read_workspace, search_columnar_parts, WriterSegment
+#######################################################################################
+
+
+# -------------------------------------------------------------------------------------
+# Method to define the rows of the analysis (numeric, string and null fields)
+def define_rows(row_start, row_n):
+    row_index = pd.date_range('2026-10-18 00:00', periods=row_start + row_n, freq='2s')[row_start:]
+    row_index = row_index.strftime('%Y-%m-%d %H:%M:%S').tolist()
+    row_collections = [{'memory_used': 1024.0 * (row_start + row_id), 'process_0_pid': 4242,
+                        'process_0_name': 'model.x' if row_id % 2 == 0 else None,
+                        'disk_usage_total': None} for row_id in range(row_n)]
+    return row_index, row_collections
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Method to check the columnar dframe (dtypes defined by the schema; null fields as nan or empty string)
+def check_dframe(file_dframe, row_n):
+    assert file_dframe.shape[0] == row_n
+    assert file_dframe.index.name == 'time'
+    assert file_dframe['memory_used'].dtype == np.float64
+    assert file_dframe['memory_used'].tolist() == [1024.0 * row_id for row_id in range(row_n)]
+    assert file_dframe['process_0_pid'].tolist() == [4242.0] * row_n
+    assert file_dframe['process_0_name'].tolist() == ['model.x' if row_id % 2 == 0 else ''
+                                                      for row_id in range(row_n)]
+    assert file_dframe['disk_usage_total'].isna().all()
+    assert file_dframe.attrs['units'] == {'memory_used': 'B'}
+    assert file_dframe.attrs['schema']['process_0_name'] == 'str'
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Test npz columnar file (round trip of values, dtypes and units)
+def test_columnar_npz_roundtrip(tmp_path):
+    file_name = str(tmp_path / 'report.npz')
+    row_index, row_collections = define_rows(0, 5)
+    file_dframe = pd.DataFrame(data=row_collections, index=row_index)
+    file_dframe.index.name = 'time'
+
+    file_schema = write_columnar(file_name, file_dframe, file_units={'memory_used': 'B'})
+    assert file_schema['memory_used'] == 'float64'
+
+    check_dframe(read_columnar(file_name), 5)
+    check_dframe(read_workspace(file_name), 5)
+    assert read_columnar(str(tmp_path / 'missing.npz')) is None
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Test columnar writer (batches saved in the part files without rewriting the main file; parts merged on close)
+def test_writer_segment_npz(tmp_path):
+    file_name = str(tmp_path / 'report.npz')
+    report_writer = WriterSegment(flush_rows=2, file_format='npz')
+
+    row_index, row_collections = define_rows(0, 7)
+    for row_index_step, row_collections_step in zip(row_index[:2], row_collections[:2]):
+        report_writer.append_row(file_name, row_index_step, row_collections_step, row_units={'memory_used': 'B'})
+    file_stat = os.stat(file_name)
+
+    for row_index_step, row_collections_step in zip(row_index[2:], row_collections[2:]):
+        report_writer.append_row(file_name, row_index_step, row_collections_step, row_units={'memory_used': 'B'})
+
+    # main file not rewritten by the next batches (two part files; last row still pending)
+    assert os.stat(file_name).st_mtime_ns == file_stat.st_mtime_ns
+    assert search_columnar_parts(file_name).__len__() == 2
+    check_dframe(read_columnar(file_name), 6)
+
+    # segment closed (pending row flushed and parts merged in the main file)
+    assert report_writer.close_segment()
+    assert search_columnar_parts(file_name) == []
+    check_dframe(read_columnar(file_name), 7)
+    assert report_writer.file_bytes == os.path.getsize(file_name)
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Test columnar writer (segment reopened after an interrupted merge; merged parts are not read twice)
+def test_writer_segment_reopen(tmp_path):
+    file_name = str(tmp_path / 'report.npz')
+    report_writer = WriterSegment(flush_rows=2, file_format='npz')
+    row_index, row_collections = define_rows(0, 6)
+    for row_index_step, row_collections_step in zip(row_index[:4], row_collections[:4]):
+        report_writer.append_row(file_name, row_index_step, row_collections_step, row_units={'memory_used': 'B'})
+
+    # interrupted merge (main file saved with the parts; part file not removed)
+    file_dframe = read_columnar(file_name)
+    write_columnar(file_name, file_dframe, file_units=file_dframe.attrs['units'],
+                   file_schema=file_dframe.attrs['schema'], file_parts=file_dframe.attrs['parts'])
+    check_dframe(read_columnar(file_name), 4)
+
+    # new writer on the same file (next part number after the merged parts)
+    report_writer = WriterSegment(flush_rows=2, file_format='npz')
+    for row_index_step, row_collections_step in zip(row_index[4:], row_collections[4:]):
+        report_writer.append_row(file_name, row_index_step, row_collections_step, row_units={'memory_used': 'B'})
+    check_dframe(read_columnar(file_name), 6)
+
+    report_writer.reset_writer()
+    assert search_columnar_parts(file_name) == []
+    check_dframe(read_columnar(file_name), 6)
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Test arrow columnar file (round trip and writer; skipped if pyarrow is not available)
+def test_columnar_arrow_roundtrip(tmp_path):
+    pytest.importorskip('pyarrow')
+    assert lib_data_io.pyarrow is not None
+
+    file_name = str(tmp_path / 'report.arrow')
+    report_writer = WriterSegment(flush_rows=2, file_format='arrow')
+    row_index, row_collections = define_rows(0, 5)
+    for row_index_step, row_collections_step in zip(row_index, row_collections):
+        report_writer.append_row(file_name, row_index_step, row_collections_step, row_units={'memory_used': 'B'})
+    check_dframe(read_columnar(file_name), 4)
+
+    report_writer.close_segment()
+    assert search_columnar_parts(file_name) == []
+    check_dframe(read_columnar(file_name), 5)
+# -------------------------------------------------------------------------------------
@@ -0,0 +1,52 @@
+"""
+Library Features:
+
+Name:          test_lib_utils_time
+Author(s):     Fabio Delogu (fabio.delogu@cimafoundation.org)
+Date:          '20261018'
+Version:       '1.0.0'
+"""
+
+#######################################################################################
+# Libraries
+import pytest
+
+import lib_utils_time
+from lib_utils_time import SchedulerTick, AdaptiveInterval
+#######################################################################################
+
+
+# -------------------------------------------------------------------------------------
+# Test adaptive interval (slope computed on the monotonic time of the samples)
+def test_adaptive_interval_slope():
+    adaptive_interval = AdaptiveInterval(4.0, seconds_min=2.0, seconds_max=16.0, slope_max=100.0)
+
+    assert adaptive_interval.update_interval({'rss': 1000.0}, 10.0) == 4.0
+    assert adaptive_interval.slope_last is None
+    # fast change (slope over the max slope --> interval reduced)
+    assert adaptive_interval.update_interval({'rss': 2000.0}, 14.0) == 2.0
+    assert adaptive_interval.slope_last == pytest.approx(250.0)
+    # stable values (interval increased)
+    assert adaptive_interval.update_interval({'rss': 2000.0}, 16.0) == 3.0
+    # same time of the previous sample (interval not updated)
+    assert adaptive_interval.update_interval({'rss': 9000.0}, 16.0) == 3.0
+# -------------------------------------------------------------------------------------
+
+
+# -------------------------------------------------------------------------------------
+# Test scheduler sample time (wall clock stepped back; monotonic time of the samples still increasing)
+def test_scheduler_sample_monotonic(monkeypatch):
+    time_wall_ns = iter([2000 * 10 ** 9, 1000 * 10 ** 9])
+    monkeypatch.setattr(lib_utils_time.time, 'time_ns', lambda: next(time_wall_ns))
+
+    scheduler_tick = SchedulerTick(0.01)
+    scheduler_tick.wait_tick()
+    time_sample_monotonic = scheduler_tick.time_sample_monotonic
+    scheduler_tick.wait_tick()
+    assert scheduler_tick.time_sample_monotonic > time_sample_monotonic
+
+    adaptive_interval = AdaptiveInterval(4.0, seconds_min=2.0, seconds_max=16.0, slope_max=100.0)
+    adaptive_interval.update_interval({'rss': 1000.0}, time_sample_monotonic)
+    adaptive_interval.update_interval({'rss': 1000.0}, scheduler_tick.time_sample_monotonic)
+    assert adaptive_interval.slope_last == 0.0
+# -------------------------------------------------------------------------------------